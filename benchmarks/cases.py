@@ -0,0 +1,221 @@
+"""
+Benchmark cases for every public gt-extras function.
+
+Each case takes a native data frame (pandas, polars, or pyarrow) and returns the object the
+function produces, selecting only the columns the function needs so that the timings reflect
+the function itself rather than the width of the benchmark frame.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable
+
+import narwhals.stable.v1 as nw
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+from great_tables import GT
+
+import gt_extras as gte
+
+__all__ = [
+    "BACKENDS",
+    "CASES",
+    "PYARROW_MAX_RENDER_ROWS",
+    "PYARROW_UNSUPPORTED",
+    "make_frame",
+]
+
+BACKENDS = ("pandas", "polars", "pyarrow")
+IMG_URL = "https://posit-dev.github.io/gt-extras/assets/logo.png"
+
+
+def make_frame(n_rows: int, backend: str, seed: int = 37):
+    """
+    Build a reproducible benchmark frame with `n_rows` rows for the given backend.
+    """
+    rng = np.random.default_rng(seed)
+    categories = np.array(["alpha", "beta", "gamma", "delta", "epsilon"])
+
+    num = rng.uniform(0, 100, n_rows).round(3)
+    spread = rng.uniform(1, 10, n_rows).round(3)
+
+    data = {
+        "name": [f"row {i}" for i in range(n_rows)],
+        "group": categories[rng.integers(0, 3, n_rows)],
+        "category": categories[rng.integers(0, len(categories), n_rows)],
+        "num": num,
+        "other": rng.uniform(0, 100, n_rows).round(3),
+        "pct": rng.uniform(0, 1, n_rows).round(4),
+        "lo": (num - spread).round(3),
+        "hi": (num + spread).round(3),
+        "rating": rng.integers(0, 6, n_rows),
+        "change": rng.integers(-5, 6, n_rows),
+        "url": [f"https://example.com/{i}" for i in range(n_rows)],
+        "img": [IMG_URL] * n_rows,
+        "winloss": rng.choice([0, 0.5, 1], size=(n_rows, 10)).tolist(),
+        "stack": rng.uniform(0, 10, size=(n_rows, 3)).round(2).tolist(),
+        "series": rng.normal(0, 1, size=(n_rows, 200)).cumsum(axis=1).round(3).tolist(),
+    }
+
+    if backend == "pandas":
+        return pd.DataFrame(data)
+    if backend == "polars":
+        return pl.DataFrame(data)
+    if backend == "pyarrow":
+        return pa.table(data)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def _select(df, *columns: str):
+    # dict.fromkeys() drops repeated names while keeping their order
+    return nw.to_native(
+        nw.from_native(df, eager_only=True).select(*dict.fromkeys(columns))
+    )
+
+
+def _gt(df, *columns: str, **kwargs) -> GT:
+    return GT(_select(df, *columns), **kwargs)
+
+
+def _fmt_str(df, column: str, fn: Callable[[str], str]) -> GT:
+    # String helpers are used inside formatters, so benchmark them over a whole column
+    return _gt(df, "name", column).fmt(fn, columns=column)
+
+
+CASES: dict[str, Callable] = {
+    # themes
+    "gt_theme_538": lambda df: gte.gt_theme_538(_gt(df, "name", "num")),
+    "gt_theme_espn": lambda df: gte.gt_theme_espn(_gt(df, "name", "num")),
+    "gt_theme_nytimes": lambda df: gte.gt_theme_nytimes(_gt(df, "name", "num")),
+    "gt_theme_guardian": lambda df: gte.gt_theme_guardian(_gt(df, "name", "num")),
+    "gt_theme_excel": lambda df: gte.gt_theme_excel(_gt(df, "name", "num")),
+    "gt_theme_dot_matrix": lambda df: gte.gt_theme_dot_matrix(_gt(df, "name", "num")),
+    "gt_theme_dark": lambda df: gte.gt_theme_dark(_gt(df, "name", "num")),
+    "gt_theme_pff": lambda df: gte.gt_theme_pff(_gt(df, "name", "num")),
+    # colors
+    "gt_data_color_by_group": lambda df: gte.gt_data_color_by_group(
+        _gt(df, "group", "num", groupname_col="group"), columns="num"
+    ),
+    "gt_highlight_cols": lambda df: gte.gt_highlight_cols(
+        _gt(df, "name", "num"), columns="num"
+    ),
+    "gt_highlight_rows": lambda df: gte.gt_highlight_rows(
+        _gt(df, "name", "num"), rows=list(range(0, len(df), 2))
+    ),
+    "gt_hulk_col_numeric": lambda df: gte.gt_hulk_col_numeric(
+        _gt(df, "name", "num"), columns="num"
+    ),
+    "gt_color_box": lambda df: gte.gt_color_box(_gt(df, "name", "num"), columns="num"),
+    # icons
+    "fa_icon_repeat": lambda df: _fmt_str(
+        df, "rating", lambda x: gte.fa_icon_repeat(repeats=int(x))
+    ),
+    "gt_fa_rank_change": lambda df: gte.gt_fa_rank_change(
+        _gt(df, "name", "change"), column="change"
+    ),
+    "gt_fa_rating": lambda df: gte.gt_fa_rating(
+        _gt(df, "name", "rating"), columns="rating"
+    ),
+    # plotting
+    "gt_plt_bar": lambda df: gte.gt_plt_bar(_gt(df, "name", "num"), columns="num"),
+    "gt_plt_bar_pct": lambda df: gte.gt_plt_bar_pct(
+        _gt(df, "name", "num"), column="num"
+    ),
+    "gt_plt_bullet": lambda df: gte.gt_plt_bullet(
+        _gt(df, "name", "num", "other"), data_column="num", target_column="other"
+    ),
+    "gt_plt_dot": lambda df: gte.gt_plt_dot(
+        _gt(df, "category", "num"), category_col="category", data_col="num"
+    ),
+    "gt_plt_conf_int": lambda df: gte.gt_plt_conf_int(
+        _gt(df, "name", "num", "lo", "hi"), column="num", ci_columns=["lo", "hi"]
+    ),
+    "gt_plt_dumbbell": lambda df: gte.gt_plt_dumbbell(
+        _gt(df, "name", "num", "other"), col1="num", col2="other"
+    ),
+    "gt_plt_donut": lambda df: gte.gt_plt_donut(_gt(df, "name", "num"), columns="num"),
+    "gt_plt_winloss": lambda df: gte.gt_plt_winloss(
+        _gt(df, "name", "winloss"), column="winloss"
+    ),
+    "gt_plt_bar_stack": lambda df: gte.gt_plt_bar_stack(
+        _gt(df, "name", "stack"), column="stack"
+    ),
+    "gt_plt_sparkline": lambda df: gte.gt_plt_sparkline(
+        _gt(df, "name", "series"), column="series"
+    ),
+    "gt_plt_dist": lambda df: gte.gt_plt_dist(
+        _gt(df, "name", "series"), column="series"
+    ),
+    # html
+    "with_hyperlink": lambda df: _fmt_str(
+        df, "url", lambda x: gte.with_hyperlink(text=x, url=x)
+    ),
+    "with_tooltip": lambda df: _fmt_str(
+        df, "name", lambda x: gte.with_tooltip(label=x, tooltip=x)
+    ),
+    "gt_merge_stack": lambda df: gte.gt_merge_stack(
+        _gt(df, "name", "category"), col1="name", col2="category"
+    ),
+    # formatting
+    "fmt_pct_extra": lambda df: gte.fmt_pct_extra(
+        _gt(df, "name", "pct"), columns="pct"
+    ),
+    "gt_duplicate_column": lambda df: gte.gt_duplicate_column(
+        _gt(df, "name", "num"), column="num"
+    ),
+    "gt_two_column_layout": lambda df: gte.gt_two_column_layout(
+        _gt(df, "name", "num"), _gt(df, "name", "other"), table_header_from=1
+    ),
+    "gt_grid_layout": lambda df: gte.gt_grid_layout(
+        [_gt(df, "name", column) for column in ("num", "other", "pct", "rating")]
+    ),
+    # images
+    "add_text_img": lambda df: _fmt_str(
+        df, "name", lambda x: gte.add_text_img(text=x, img_url=IMG_URL)
+    ),
+    "img_header": lambda df: _gt(df, "name", "num").cols_label(
+        num=gte.img_header(label="Number", img_url=IMG_URL)
+    ),
+    "gt_fmt_img_circle": lambda df: gte.gt_fmt_img_circle(
+        _gt(df, "name", "img"), columns="img", encode=False
+    ),
+    # styling
+    "gt_add_divider": lambda df: gte.gt_add_divider(
+        _gt(df, "name", "num"), columns="name"
+    ),
+    # pipeline
+    "apply_plots": lambda df: gte.apply_plots(
+        _gt(df, "name", "num", "other", "pct", "rating", "change"),
+        [
+            partial(gte.gt_plt_bar, columns="num"),
+            partial(gte.gt_plt_donut, columns="other"),
+            partial(gte.gt_plt_bar_pct, column="pct"),
+            partial(gte.gt_color_box, columns="rating"),
+            partial(gte.gt_fa_rank_change, column="change"),
+        ],
+    ),
+    # summary
+    "gt_plt_summary": lambda df: gte.gt_plt_summary(
+        _select(df, "name", "group", "num", "other", "rating")
+    ),
+}
+
+# Functions that do not yet support pyarrow tables, and why
+PYARROW_UNSUPPORTED = {
+    "gt_data_color_by_group": "great_tables cannot color pyarrow columns",
+    "gt_hulk_col_numeric": "great_tables cannot color pyarrow columns",
+    "gt_plt_winloss": "great_tables cannot render pyarrow list columns",
+    "gt_plt_bar_stack": "great_tables cannot render pyarrow list columns",
+    "gt_plt_sparkline": "great_tables cannot render pyarrow list columns",
+    "gt_plt_dist": "great_tables cannot render pyarrow list columns",
+    "gt_fmt_img_circle": "NA checks call is_nan on a pyarrow string column",
+    "gt_plt_summary": "summary statistics call to_list on a pyarrow ChunkedArray",
+}
+
+# great_tables writes each formatted pyarrow cell back by rebuilding its whole column, so
+# rendering a pyarrow table is quadratic in the number of rows. Beyond this size a single
+# render takes minutes, which would dominate the run time of the whole suite.
+PYARROW_MAX_RENDER_ROWS = 1_000
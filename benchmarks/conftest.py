@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+from cases import BACKENDS, make_frame
+
+DEFAULT_SIZES = "100,10000,100000"
+DEFAULT_MEM_ROWS = "100000,1000000"
+DEFAULT_MEM_COLS = "10,50"
+
+# Memory budgets are only recorded up to these sizes
+MAX_MEM_ROWS = 1_000_000
+MAX_MEM_COLS = 50
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("gt-extras benchmarks")
+    group.addoption(
+        "--bench-sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated row counts to benchmark (default: {DEFAULT_SIZES}).",
+    )
+    group.addoption(
+        "--bench-backends",
+        default=",".join(BACKENDS),
+        help=f"Comma-separated data frame backends (default: {','.join(BACKENDS)}).",
+    )
+    group.addoption(
+        "--bench-memory",
+        action="store_true",
+        default=False,
+        help="Run the peak memory benchmarks, which are skipped otherwise.",
+    )
+    group.addoption(
+        "--mem-rows",
+        default=DEFAULT_MEM_ROWS,
+        help=f"Comma-separated row counts for memory benchmarks (default: {DEFAULT_MEM_ROWS}).",
+    )
+    group.addoption(
+        "--mem-cols",
+        default=DEFAULT_MEM_COLS,
+        help=f"Comma-separated column counts for memory benchmarks (default: {DEFAULT_MEM_COLS}).",
+    )
+    group.addoption(
+        "--mem-budget-update",
+        action="store_true",
+        default=False,
+        help="Record the measured peak memory as the new memory budgets.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "memory: peak memory benchmark, only run with --bench-memory"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench-memory"):
+        return
+
+    skip_memory = pytest.mark.skip(reason="memory benchmarks need --bench-memory")
+    for item in items:
+        if "memory" in item.keywords:
+            item.add_marker(skip_memory)
+
+
+def pytest_generate_tests(metafunc):
+    if "n_rows" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--bench-sizes")
+        metafunc.parametrize("n_rows", [int(n) for n in sizes.split(",")])
+
+    if "backend" in metafunc.fixturenames:
+        backends = metafunc.config.getoption("--bench-backends").split(",")
+        unknown = set(backends) - set(BACKENDS)
+        if unknown:
+            raise pytest.UsageError(f"Unknown benchmark backends: {sorted(unknown)}")
+        metafunc.parametrize("backend", backends)
+
+    if "mem_rows" in metafunc.fixturenames:
+        rows = [int(n) for n in metafunc.config.getoption("--mem-rows").split(",")]
+        too_large = [n for n in rows if n > MAX_MEM_ROWS]
+        if too_large:
+            raise pytest.UsageError(
+                f"Memory benchmarks are capped at {MAX_MEM_ROWS} rows, got {too_large}"
+            )
+        metafunc.parametrize("mem_rows", rows)
+
+    if "mem_cols" in metafunc.fixturenames:
+        cols = [int(n) for n in metafunc.config.getoption("--mem-cols").split(",")]
+        too_large = [n for n in cols if n > MAX_MEM_COLS]
+        if too_large:
+            raise pytest.UsageError(
+                f"Memory benchmarks are capped at {MAX_MEM_COLS} columns, got {too_large}"
+            )
+        metafunc.parametrize("mem_cols", cols)
+
+
+_FRAMES = {}
+
+
+@pytest.fixture
+def bench_df(n_rows: int, backend: str):
+    key = (n_rows, backend)
+    if key not in _FRAMES:
+        _FRAMES[key] = make_frame(n_rows, backend)
+    return _FRAMES[key]
+
+
+# Rounds run before timing each case, so imports, caches, and allocator growth are not timed
+WARMUP_ROUNDS = 1
+
+
+def rounds_for(n_rows: int) -> int:
+    # Enough rounds that the median is stable to compare against the baseline, with fewer for
+    # the large tables so the full suite stays within a reasonable run time
+    if n_rows <= 1_000:
+        return 15
+    if n_rows <= 10_000:
+        return 7
+    return 3
@@ -0,0 +1,68 @@
+"""
+Build and render timings for every public gt-extras function.
+
+`make bench` compares these timings with a local baseline, `benchmarks/baseline.json`, and fails
+if the median time of any case grows by more than 25%. Timings depend on the machine, so the
+baseline is not committed: record one with `make bench-baseline` on a clean checkout of the commit
+to compare against, with the same `BENCH_SIZES` and `BENCH_BACKENDS`, and record it again whenever
+cases are added or the machine changes.
+"""
+
+from __future__ import annotations
+
+import pytest
+from cases import CASES, PYARROW_MAX_RENDER_ROWS, PYARROW_UNSUPPORTED
+from conftest import WARMUP_ROUNDS, rounds_for
+
+import gt_extras as gte
+
+
+def _render(obj) -> str:
+    # Layout functions return a GTCombinedLayout, which renders through str()
+    if hasattr(obj, "as_raw_html"):
+        return obj.as_raw_html()
+    return str(obj)
+
+
+def _skip_unsupported(name: str, backend: str):
+    if backend == "pyarrow" and name in PYARROW_UNSUPPORTED:
+        pytest.skip(PYARROW_UNSUPPORTED[name])
+
+
+# Public names that are tooling rather than table functions
+NOT_BENCHMARKED = {"profile", "ProfileReport", "set_options", "get_options"}
+
+
+def test_cases_cover_public_api():
+    assert set(CASES) == set(gte.__all__) - NOT_BENCHMARKED
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_bench_build(benchmark, name, bench_df, backend, n_rows):
+    _skip_unsupported(name, backend)
+    benchmark.group = f"build-{name}"
+
+    benchmark.pedantic(
+        CASES[name],
+        args=(bench_df,),
+        rounds=rounds_for(n_rows),
+        warmup_rounds=WARMUP_ROUNDS,
+        iterations=1,
+    )
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_bench_render(benchmark, name, bench_df, backend, n_rows):
+    _skip_unsupported(name, backend)
+    if backend == "pyarrow" and n_rows > PYARROW_MAX_RENDER_ROWS:
+        pytest.skip("great_tables renders pyarrow tables in quadratic time")
+    benchmark.group = f"render-{name}"
+
+    built = CASES[name](bench_df)
+    benchmark.pedantic(
+        _render,
+        args=(built,),
+        rounds=rounds_for(n_rows),
+        warmup_rounds=WARMUP_ROUNDS,
+        iterations=1,
+    )
@@ -0,0 +1,104 @@
+"""
+Peak memory benchmarks for `gt_plt_summary()`.
+
+These run only with `--bench-memory` (see `make bench-memory`). Each case builds and renders a
+summary of a wide frame under `tracemalloc`, and checks the peak traced memory against the budget
+recorded for that frame size in `memory_budgets.json`.
+
+Budgets are recorded for 100k to 1M rows by 10 to 50 columns, which keeps the run to around ten
+minutes. Larger sizes are rejected by `conftest.py` rather than run without a budget.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import gt_extras as gte
+
+BUDGETS_PATH = Path(__file__).parent / "memory_budgets.json"
+
+# Allowed growth over the recorded budget before a test fails
+TOLERANCE = 0.10
+
+pytestmark = pytest.mark.memory
+
+DTYPE_CYCLE = ("numeric", "string", "boolean", "datetime")
+
+
+def make_wide_frame(n_rows: int, n_cols: int, seed: int = 37) -> pd.DataFrame:
+    """
+    Build a reproducible frame whose columns cycle through the types `gt_plt_summary()` plots.
+    """
+    rng = np.random.default_rng(seed)
+    categories = np.array(["alpha", "beta", "gamma", "delta", "epsilon"], dtype=object)
+    start = np.datetime64("2020-01-01T00:00:00", "s")
+
+    data = {}
+    for i in range(n_cols):
+        kind = DTYPE_CYCLE[i % len(DTYPE_CYCLE)]
+        if kind == "numeric":
+            col = rng.normal(50, 15, n_rows)
+            col[rng.random(n_rows) < 0.01] = np.nan
+        elif kind == "string":
+            col = categories[rng.integers(0, len(categories), n_rows)]
+        elif kind == "boolean":
+            col = rng.random(n_rows) < 0.5
+        else:
+            col = start + rng.integers(0, 3 * 365 * 86_400, n_rows).astype("m8[s]")
+        data[f"{kind}_{i}"] = col
+
+    return pd.DataFrame(data)
+
+
+def _peak_summary_memory(df: pd.DataFrame) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        gte.gt_plt_summary(df).as_raw_html()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.fixture(scope="module")
+def memory_budgets(request):
+    budgets = json.loads(BUDGETS_PATH.read_text()) if BUDGETS_PATH.exists() else {}
+    yield budgets
+
+    if request.config.getoption("--mem-budget-update"):
+        BUDGETS_PATH.write_text(json.dumps(budgets, indent=2, sort_keys=True) + "\n")
+
+
+def test_bench_summary_memory(request, mem_rows, mem_cols, memory_budgets):
+    df = make_wide_frame(mem_rows, mem_cols)
+    peak = _peak_summary_memory(df)
+
+    key = f"gt_plt_summary-{mem_rows}x{mem_cols}"
+    measured = {
+        "peak_bytes": peak,
+        "bytes_per_cell": round(peak / (mem_rows * mem_cols), 2),
+    }
+    request.node.user_properties.append(("memory", measured))
+
+    if request.config.getoption("--mem-budget-update"):
+        memory_budgets[key] = measured
+        return
+
+    assert key in memory_budgets, (
+        f"No memory budget recorded for {key}. "
+        "Run `make bench-memory-baseline` with the same sizes to record one."
+    )
+
+    budget = memory_budgets[key]["peak_bytes"]
+    assert peak <= budget * (1 + TOLERANCE), (
+        f"{key} peak traced memory grew to {peak:,} bytes, over its budget of "
+        f"{budget:,} bytes (tolerance {TOLERANCE:.0%})."
+    )
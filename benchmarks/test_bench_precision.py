@@ -0,0 +1,58 @@
+"""
+Benchmarks of the HTML size saved by rounding SVG coordinates.
+
+Each case renders a plotting function's table at full precision and again with the global
+`precision` option set, timing the rounded render. The byte counts of both renders, and the
+fraction of bytes saved, are recorded in the benchmark's `extra_info`.
+"""
+
+from __future__ import annotations
+
+import pytest
+from cases import CASES, PYARROW_MAX_RENDER_ROWS, PYARROW_UNSUPPORTED
+from conftest import WARMUP_ROUNDS, rounds_for
+
+import gt_extras as gte
+
+PLOT_CASES = [name for name in CASES if name.startswith("gt_plt_")]
+PRECISIONS = (0, 1, 2)
+
+
+def _html_bytes(name: str, df) -> int:
+    return len(CASES[name](df).as_raw_html().encode("utf-8"))
+
+
+@pytest.mark.parametrize("precision", PRECISIONS)
+@pytest.mark.parametrize("name", PLOT_CASES)
+def test_bench_precision_size(benchmark, name, bench_df, backend, n_rows, precision):
+    if backend == "pyarrow" and name in PYARROW_UNSUPPORTED:
+        pytest.skip(PYARROW_UNSUPPORTED[name])
+    if backend == "pyarrow" and n_rows > PYARROW_MAX_RENDER_ROWS:
+        pytest.skip("great_tables renders pyarrow tables in quadratic time")
+    benchmark.group = f"precision-{name}"
+
+    full_bytes = _html_bytes(name, bench_df)
+
+    previous = gte.set_options(precision=precision)
+    try:
+        built = CASES[name](bench_df)
+        html = benchmark.pedantic(
+            built.as_raw_html,
+            rounds=rounds_for(n_rows),
+            warmup_rounds=WARMUP_ROUNDS,
+            iterations=1,
+        )
+    finally:
+        gte.set_options(**previous)
+
+    rounded_bytes = len(html.encode("utf-8"))
+    benchmark.extra_info.update(
+        {
+            "precision": precision,
+            "full_bytes": full_bytes,
+            "rounded_bytes": rounded_bytes,
+            "bytes_saved": round(1 - rounded_bytes / full_bytes, 4),
+        }
+    )
+
+    assert rounded_bytes <= full_bytes
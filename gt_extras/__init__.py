@@ -6,7 +6,12 @@ from .colors import (
     gt_highlight_rows,
     gt_hulk_col_numeric,
 )
-from .formatting import fmt_pct_extra, gt_duplicate_column, gt_two_column_layout
+from .formatting import (
+    fmt_pct_extra,
+    gt_duplicate_column,
+    gt_grid_layout,
+    gt_two_column_layout,
+)
 from .html import gt_merge_stack, with_hyperlink, with_tooltip
 from .icons import fa_icon_repeat, gt_fa_rank_change, gt_fa_rating
 from .images import add_text_img, gt_fmt_img_circle, img_header
@@ -16,11 +21,16 @@ from .plotting import (
     gt_plt_bar_stack,
     gt_plt_bullet,
     gt_plt_conf_int,
+    gt_plt_dist,
     gt_plt_donut,
     gt_plt_dot,
     gt_plt_dumbbell,
+    gt_plt_sparkline,
     gt_plt_winloss,
 )
+from .options import get_options, set_options
+from .pipeline import apply_plots
+from .profiling import ProfileReport, profile
 from .styling import gt_add_divider
 from .summary import gt_plt_summary
 from .themes import (
@@ -60,15 +70,23 @@ __all__ = [
     "gt_plt_donut",
     "gt_plt_winloss",
     "gt_plt_bar_stack",
+    "gt_plt_sparkline",
+    "gt_plt_dist",
     "with_hyperlink",
     "with_tooltip",
     "gt_merge_stack",
     "fmt_pct_extra",
     "gt_duplicate_column",
     "gt_two_column_layout",
+    "gt_grid_layout",
     "add_text_img",
     "img_header",
     "gt_fmt_img_circle",
     "gt_add_divider",
     "gt_plt_summary",
+    "apply_plots",
+    "profile",
+    "ProfileReport",
+    "set_options",
+    "get_options",
 ]
@@ -0,0 +1,457 @@
+"""
+Glyph builders compiled to polars queries, used by the `engine="polars"` option of plots.
+
+Each builder writes the HTML of a whole column of glyphs at once. The markup shared by every cell
+is rendered once as a template, with a `@name@` field wherever a cell has its own value, and the
+fields are filled in from string columns computed by polars. The output is identical to the
+glyphs that the Python engine builds cell by cell.
+"""
+
+from __future__ import annotations
+
+import re
+import warnings
+
+import polars as pl
+from svg import SVG, Circle, Length, Line, Rect, Text
+
+from gt_extras._utils_column import _format_numeric_text
+from gt_extras._utils_svg import _round_number
+from gt_extras.profiling import _profile_stage
+
+__all__ = [
+    "_scale_polars_column",
+    "_compile_bar_html",
+    "_compile_bullet_html",
+    "_compile_dumbbell_html",
+]
+
+_FIELD_PATTERN = re.compile(r"@([a-z_]+)@")
+
+# Polars writes floats in this range of magnitudes the same way as Python's `str()`, and writes
+# the floats outside of it in plain notation rather than with an exponent
+_PLAIN_MIN = 1e-4
+_PLAIN_MAX = 1e16
+
+# Numbers are rounded exactly by polars when, scaled by the precision, they are below this size
+# and not within this distance of a tie
+_ROUNDING_MAX = 1e15
+_TIE_TOLERANCE = 1e-6
+
+
+def _field(name: str) -> str:
+    return f"@{name}@"
+
+
+def _fill_template(template: str, fields: dict[str, pl.Series]) -> pl.Series:
+    """
+    Fill in the `@name@` fields of a template from string columns of the same length.
+    """
+    parts = _FIELD_PATTERN.split(template)
+
+    # Splitting on the fields alternates between literal markup and field names
+    exprs = [
+        pl.col(part) if i % 2 else pl.lit(part)
+        for i, part in enumerate(parts)
+        if part or i % 2
+    ]
+    return pl.DataFrame(fields).select(pl.concat_str(exprs).alias("html")).to_series()
+
+
+def _format_numbers(
+    values: pl.Series,
+    precision: int | None,
+    keep_negative_zero: bool = False,
+) -> pl.Series:
+    """
+    Write a column of numbers as `_round_number()` does.
+
+    If `keep_negative_zero` is `True`, numbers are instead written as `_format_numeric_text()`
+    does, which writes small negative numbers rounded to zero as `-0`.
+
+    Polars writes and rounds most numbers the same way as Python, so only the few numbers that
+    it would write differently, such as those close to a tie when rounding, are written in Python.
+    """
+    values = values.cast(pl.Float64)
+
+    if precision is None:
+        magnitude = values.abs()
+        text = values.cast(pl.String)
+        exact = (magnitude == 0) | (
+            (magnitude >= _PLAIN_MIN) & (magnitude < _PLAIN_MAX)
+        )
+    else:
+        scaled = values * 10**precision
+        text = (
+            values.round(precision, mode="half_to_even")
+            .cast(pl.String)
+            .str.replace(r"\.0*$", "")
+            .str.replace(r"(\.\d*?)0+$", "${1}")
+        )
+        if not keep_negative_zero:
+            text = text.str.replace(r"^-0$", "0")
+        exact = (scaled.abs() < _ROUNDING_MAX) & (
+            (scaled - scaled.floor() - 0.5).abs() > _TIE_TOLERANCE
+        )
+
+    rows = (~exact.fill_null(False)).arg_true()
+    if len(rows) == 0:
+        return text
+
+    if keep_negative_zero and precision is not None:
+        written = [_format_numeric_text(val, precision) for val in values[rows]]
+    else:
+        written = [_round_number(val, precision) for val in values[rows]]
+    return text.scatter(rows, written)
+
+
+def _format_labels(values: pl.Series) -> pl.Series:
+    """
+    Write a column of numbers as `str()` writes them, with missing values as `None`.
+    """
+    if values.dtype.is_integer():
+        text = values.cast(pl.String)
+    else:
+        text = _format_numbers(values, precision=None)
+    return text.fill_null("None")
+
+
+@_profile_stage("scaling")
+def _scale_polars_column(
+    values: pl.Series,
+    domain: list[float] | list[int] | None = None,
+) -> pl.Series:
+    """
+    Scale a polars column to a domain, as `_scale_numeric_column()` does.
+
+    Missing values are `NaN`, so callers can choose how to draw them. Values outside of the
+    domain are set to its nearest end, with a warning.
+    """
+    col_name = values.name
+    if not (values.dtype.is_numeric() or values.dtype == pl.Boolean):
+        raise TypeError(
+            f"Invalid column type provided ({col_name}). Please ensure that the column is numeric."
+        )
+
+    vals = values.cast(pl.Float64).fill_null(float("nan"))
+    is_missing = vals.is_nan()
+    if is_missing.all():
+        raise TypeError(
+            f"Invalid column type provided ({col_name}). Please ensure that the column is numeric."
+        )
+
+    # If `domain` is not provided, then set it to a default domain
+    if domain is None:
+        domain = [0, values.filter(~is_missing).max()]
+
+    domain_min, domain_max = domain
+    domain_range = domain_max - domain_min
+    if domain_range == 0:
+        scaled = pl.Series(col_name, [0.0] * len(vals), dtype=pl.Float64)
+    else:
+        # Polars divides by a constant by multiplying by its reciprocal, which can differ from
+        # the Python engine in the last digit, so divide with numpy instead
+        scaled = pl.Series(col_name, (vals.to_numpy() - domain_min) / domain_range)
+
+    is_outside = ~is_missing & ((scaled < 0) | (scaled > 1))
+    if not is_outside.any():
+        return scaled.set(is_missing, float("nan"))
+
+    is_below = is_outside & (vals < min(domain))
+    for orig_val, below in zip(
+        values.filter(is_outside).to_list(), is_below.filter(is_outside).to_list()
+    ):
+        if below:
+            warnings.warn(
+                f"Value {orig_val} in column '{col_name}' is less than the domain minimum {min(domain)}. Setting to {min(domain)}.",
+                category=UserWarning,
+            )
+        else:
+            warnings.warn(
+                f"Value {orig_val} in column '{col_name}' is greater than the domain maximum {max(domain)}. Setting to {max(domain)}.",
+                category=UserWarning,
+            )
+
+    return (
+        scaled.set(is_below, 0.0)
+        .set(is_outside & ~is_below, 1.0)
+        .set(is_missing, float("nan"))
+    )
+
+
+def _bar_elements(
+    fill: str,
+    bar_height: float,
+    height: float,
+    width: float,
+    stroke_color: str,
+    label: str,
+    label_color: str | None,
+    precision: int | None,
+) -> list:
+    def _num(val: float) -> str:
+        return _round_number(val, precision)
+
+    # The same elements as `_make_bar_svg()`, with fields for the length of the bar
+    return [
+        Rect(
+            x=0,
+            y=Length(_num((height - bar_height) / 2), "px"),
+            width=Length(_field("bar_width"), "px"),  # type: ignore[arg-type]
+            height=Length(_num(bar_height), "px"),
+            fill=fill,
+        ),
+        Text(
+            text=label,
+            x=Length(_field("label_x"), "px"),  # type: ignore[arg-type]
+            y=Length(_num(height / 2), "px"),
+            fill=label_color,
+            font_size=_num(bar_height * 0.6),
+            text_anchor="end",
+            dominant_baseline="central",
+        ),
+        Line(
+            x1=0,
+            x2=0,
+            y1=0,
+            y2=Length(_num(height), "px"),
+            stroke_width=Length(_num(height / 10), "px"),
+            stroke=stroke_color,
+        ),
+    ]
+
+
+def _bar_fields(
+    scaled: pl.Series, width: float, precision: int | None
+) -> dict[str, pl.Series]:
+    # Missing values are drawn as empty bars
+    bar_width = scaled.fill_nan(0.0) * width
+    return {
+        "bar_width": _format_numbers(bar_width, precision),
+        "label_x": _format_numbers(bar_width * 0.98, precision),
+    }
+
+
+@_profile_stage("svg_building")
+def _compile_bar_html(
+    values: pl.Series,
+    scaled: pl.Series,
+    fill: str,
+    bar_height: float,
+    height: float,
+    width: float,
+    stroke_color: str,
+    show_labels: bool,
+    label_color: str,
+    precision: int | None,
+) -> pl.Series:
+    """
+    Build the HTML of the `gt_plt_bar()` glyph of every value in a column.
+    """
+    svg = SVG(
+        width=_round_number(width, precision),
+        height=_round_number(height, precision),
+        elements=_bar_elements(
+            fill=fill,
+            bar_height=bar_height,
+            height=height,
+            width=width,
+            stroke_color=stroke_color,
+            label=_field("label") if show_labels else "",
+            label_color=label_color,
+            precision=precision,
+        ),
+    )
+    template = f'<div style="display: flex;">{svg.as_str()}</div>'
+
+    fields = _bar_fields(scaled, width, precision)
+    if show_labels:
+        fields["label"] = _format_labels(values)
+
+    return _fill_template(template, fields)
+
+
+@_profile_stage("svg_building")
+def _compile_bullet_html(
+    scaled: pl.Series,
+    scaled_target: pl.Series,
+    fill: str,
+    bar_height: float,
+    height: float,
+    width: float,
+    target_color: str,
+    stroke_color: str,
+    precision: int | None,
+) -> pl.Series:
+    """
+    Build the HTML of the `gt_plt_bullet()` glyph of every value and target in two columns.
+    """
+
+    def _num(val: float) -> str:
+        return _round_number(val, precision)
+
+    stroke_width = height / 10
+    elements = _bar_elements(
+        fill=fill,
+        bar_height=bar_height,
+        height=height,
+        width=width,
+        stroke_color=stroke_color,
+        label="",
+        label_color="black",
+        precision=precision,
+    )
+    target_line = Line(
+        x1=Length(_field("target_x"), "px"),  # type: ignore[arg-type]
+        x2=Length(_field("target_x"), "px"),  # type: ignore[arg-type]
+        y1=0,
+        y2=Length(_num(height), "px"),
+        stroke_width=Length(_num(stroke_width), "px"),
+        stroke=target_color,
+    )
+
+    without_target = SVG(width=_num(width), height=_num(height), elements=elements)
+    with_target = SVG(
+        width=_num(width), height=_num(height), elements=[*elements, target_line]
+    )
+
+    fields = _bar_fields(scaled, width, precision)
+    target_x = (
+        pl.DataFrame({"target": scaled_target.fill_nan(0.0)})
+        .select(
+            pl.max_horizontal(
+                pl.lit(stroke_width), width * pl.col("target") - stroke_width / 2
+            )
+        )
+        .to_series()
+    )
+    fields["target_x"] = _format_numbers(target_x, precision)
+
+    html = pl.DataFrame(
+        {
+            "with_target": _fill_template(with_target.as_str(), fields),
+            "without_target": _fill_template(without_target.as_str(), fields),
+            "is_missing": scaled_target.is_nan(),
+        }
+    ).select(
+        pl.concat_str(
+            pl.lit('<div style="display: flex;">'),
+            # Missing targets are NaN, and no target line is drawn for them
+            pl.when(pl.col("is_missing"))
+            .then(pl.col("without_target"))
+            .otherwise(pl.col("with_target")),
+            pl.lit("</div>"),
+        )
+    )
+    return html.to_series()
+
+
+@_profile_stage("svg_building")
+def _compile_dumbbell_html(
+    values_1: pl.Series,
+    values_2: pl.Series,
+    width: float,
+    height: float,
+    value_1_color: str,
+    value_2_color: str,
+    bar_color: str,
+    dot_border_color: str,
+    max_val: float,
+    min_val: float,
+    font_size: int,
+    num_decimals: int,
+    precision: int | None,
+) -> pl.Series:
+    """
+    Build the HTML of the `gt_plt_dumbbell()` glyph of every pair of values in two columns.
+    """
+
+    def _num(val: float) -> str:
+        return _round_number(val, precision)
+
+    values_1 = values_1.cast(pl.Float64).fill_null(float("nan"))
+    values_2 = values_2.cast(pl.Float64).fill_null(float("nan"))
+
+    # The same layout as `_make_dumbbell_svg()`, with fields for the positions and labels
+    span = max_val - min_val
+    span = span if span != 0 else 1
+    bar_height = height / 10
+    bar_y = height / 2 - bar_height / 2 + font_size / 2
+    dot_radius = bar_height * 1.25
+    dot_border = bar_height / 2
+    dot_y = bar_y + bar_height / 2
+    label_y = dot_y - dot_radius - dot_border * 1.2
+
+    def _dot(pos: str, fill: str) -> Circle:
+        return Circle(
+            cx=_field(pos),  # type: ignore[arg-type]
+            cy=_num(dot_y),
+            r=_num(dot_radius),
+            fill=fill,
+            stroke=dot_border_color,
+            stroke_width=_num(dot_border),
+        )
+
+    def _label(pos: str, text: str, fill: str) -> Text:
+        return Text(
+            text=_field(text),
+            x=_field(pos),  # type: ignore[arg-type]
+            y=_num(label_y),
+            fill=fill,
+            font_size=_num(font_size),
+            font_weight="bold",
+            text_anchor="middle",
+            dominant_baseline="lower",
+        )
+
+    elements = [
+        Rect(
+            x=_field("bar_left"),  # type: ignore[arg-type]
+            y=_num(bar_y),
+            width=_field("bar_width"),  # type: ignore[arg-type]
+            height=_num(bar_height),
+            fill=bar_color,
+            rx=2,
+        ),
+        _dot("pos_one", value_1_color),
+        _dot("pos_two", value_2_color),
+        _label("pos_one", "text_one", value_1_color),
+        _label("pos_two", "text_two", value_2_color),
+    ]
+    svg = SVG(width=_num(width), height=_num(height), elements=elements)
+
+    # Missing values are drawn as an empty glyph, so their fields are only placeholders
+    is_missing = values_1.is_nan() | values_2.is_nan()
+    values_1 = values_1.fill_nan(min_val)
+    values_2 = values_2.fill_nan(min_val)
+
+    # Divide with numpy, as in `_scale_polars_column()`
+    pos_1 = pl.Series(((values_1.to_numpy() - min_val) / span) * width)
+    pos_2 = pl.Series(((values_2.to_numpy() - min_val) / span) * width)
+    positions = pl.DataFrame({"pos_1": pos_1, "pos_2": pos_2}).select(
+        pl.min_horizontal("pos_1", "pos_2").alias("bar_left"),
+        (pl.col("pos_2") - pl.col("pos_1")).abs().alias("bar_width"),
+    )
+
+    fields = {
+        "bar_left": _format_numbers(positions["bar_left"], precision),
+        "bar_width": _format_numbers(positions["bar_width"], precision),
+        "pos_one": _format_numbers(pos_1, precision),
+        "pos_two": _format_numbers(pos_2, precision),
+        "text_one": _format_numbers(values_1, num_decimals, keep_negative_zero=True),
+        "text_two": _format_numbers(values_2, num_decimals, keep_negative_zero=True),
+    }
+
+    empty = f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
+    html = pl.DataFrame(
+        {
+            "glyph": _fill_template(
+                f'<div style="display: flex;">{svg.as_str()}</div>',
+                fields,
+            ),
+            "is_missing": is_missing,
+        }
+    ).select(
+        pl.when(pl.col("is_missing")).then(pl.lit(empty)).otherwise(pl.col("glyph"))
+    )
+    return html.to_series()
@@ -11,9 +11,16 @@ from great_tables._data_color.constants import ALL_PALETTES, DEFAULT_PALETTE
 from great_tables._data_color.palettes import GradientPalette
 from great_tables._tbl_data import TblData
 
-__all__ = ["_get_discrete_colors_from_palette"]
+from gt_extras.profiling import _profile_stage
 
+__all__ = [
+    "_get_discrete_colors_from_palette",
+    "_get_category_colors",
+    "_get_gradient_colors",
+]
 
+
+@_profile_stage("color_mapping")
 def _get_discrete_colors_from_palette(
     palette: list[str] | str | None,
     data: list,
@@ -50,6 +57,52 @@ def _get_discrete_colors_from_palette(
     return color_vals
 
 
+@_profile_stage("color_mapping")
+def _get_category_colors(
+    palette: list[str] | str | None,
+    n_categories: int,
+) -> list[str]:
+    """
+    Get one color for each of `n_categories` categories, spread evenly along the palette.
+
+    Category `i` gets the same color as `_get_discrete_colors_from_palette()` gives the `i`-th
+    distinct value of a column, but each color is interpolated only once, however many rows share
+    its category. Rows are then colored by looking up their category code.
+    """
+    if n_categories == 0:
+        return []
+
+    palette = _get_palette(palette)
+    color_scale_fn = GradientPalette(colors=palette)
+
+    scaled_vals = [i / max(n_categories - 1, 1) for i in range(n_categories)]
+    color_vals = color_scale_fn(scaled_vals)
+
+    # Category codes index this list, so a missing color is replaced rather than dropped
+    for i, c in enumerate(color_vals):
+        if c is None:
+            color_vals[i] = "transparent"
+            warnings.warn(
+                "A color value is None and has been coerced to 'transparent'",
+                UserWarning,
+            )
+
+    # This is redundant but satisfies the type-checker
+    return [c for c in color_vals if c is not None]
+
+
+@_profile_stage("color_mapping")
+def _get_gradient_colors(palette: list[str], scaled_vals: list[float]) -> list[str]:
+    # Create a color scale function from the palette
+    color_scale_fn = GradientPalette(colors=palette)
+
+    # Call the color scale function on the scaled values to get a list of colors
+    color_vals = color_scale_fn(scaled_vals)
+
+    # Coerce color values to str if None
+    return [c for c in color_vals if c is not None]
+
+
 def _get_palette(palette: list[str] | str | None) -> list[str]:
     # If palette is not provided, use a default palette
     if palette is None:
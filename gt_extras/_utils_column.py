@@ -1,19 +1,104 @@
 from __future__ import annotations
 
 import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from itertools import chain
+from typing import Any, Callable, Iterator, Sequence
 
+import narwhals.stable.v1 as nw
+import numpy as np
 from great_tables import GT
-from great_tables._data_color.base import _rescale_numeric
+from great_tables._gt_data import CellSubset, FormatFns, FormatInfo
 from great_tables._locations import resolve_cols_c
-from great_tables._tbl_data import SelectExpr, is_na, to_list
+from great_tables._tbl_data import SelectExpr, _get_cell, to_list
+
+from gt_extras.options import _apply_render_budget
+from gt_extras.profiling import _profile_stage
 
 __all__ = [
     "_validate_and_get_single_column",
+    "_validate_and_get_list_column",
     "_scale_numeric_column",
     "_format_numeric_text",
+    "_fmt_with_row_payloads",
+    "_get_na_mask",
+    "_factorize_column",
+    "_get_global_range",
+    "_has_numeric_dtype",
+    "_render_first_cell",
+    "_register_within_render_budget",
+    "_resolve_single_column",
+    "_cache_column_reads",
 ]
 
+# The column reads cached by the `apply_plots()` call in progress, if any, keyed by the identity
+# of each data table. A context variable, so that calls in other threads keep their own caches.
+_ACTIVE_COLUMN_CACHE: ContextVar[dict[tuple, tuple[Any, Any]] | None] = ContextVar(
+    "_ACTIVE_COLUMN_CACHE", default=None
+)
+
+
+@contextmanager
+def _cache_column_reads() -> Iterator[None]:
+    """
+    Reuse what is read from each column of a table within the block, instead of reading it again.
+
+    Inside the block, helpers decorated with `_cached_column_read` compute their result once per
+    table and arguments. Tables are kept alive until the block exits, so their identities stay
+    unique.
+    """
+    previous = _ACTIVE_COLUMN_CACHE.get()
+    token = _ACTIVE_COLUMN_CACHE.set({} if previous is None else previous)
+    try:
+        yield
+    finally:
+        _ACTIVE_COLUMN_CACHE.reset(token)
+
+
+def _cached_column_read(fn: Callable) -> Callable:
+    """
+    Decorate a helper called as `fn(data_table, ...)` with hashable (or list) arguments, so that
+    its results are reused inside `_cache_column_reads()`.
+
+    Cached arrays are returned as read-only views and cached lists as shallow copies, so a caller
+    cannot change what later callers read.
+    """
+
+    @wraps(fn)
+    def wrapper(data_table, *args, **kwargs):
+        cache = _ACTIVE_COLUMN_CACHE.get()
+        if cache is None:
+            return fn(data_table, *args, **kwargs)
 
+        key = (
+            id(data_table),
+            fn.__name__,
+            *(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+            *sorted(kwargs.items()),
+        )
+        if key not in cache:
+            cache[key] = (data_table, fn(data_table, *args, **kwargs))
+
+        return _read_only(cache[key][1])
+
+    return wrapper
+
+
+def _read_only(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, tuple):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+@_profile_stage("column_resolution")
 def _validate_and_get_single_column(
     gt: GT,
     expr: SelectExpr,
@@ -40,6 +125,262 @@ def _validate_and_get_single_column(
     ValueError
         If multiple columns are resolved
     """
+    col_name = _resolve_single_column(gt, expr)
+    col_vals = _read_column(gt._tbl_data, col_name)
+
+    return col_name, col_vals
+
+
+@_cached_column_read
+def _read_column(data_table, col_name: str) -> list:
+    return to_list(data_table[col_name])
+
+
+@_profile_stage("column_resolution")
+def _validate_and_get_list_column(
+    gt: GT,
+    expr: SelectExpr,
+) -> tuple[str, np.ndarray | list, np.ndarray]:
+    """
+    Validate that expr resolves to a single column of lists, and return its values flattened.
+
+    For polars and pyarrow list columns with a numeric inner type, the values and offsets are
+    computed natively, so no Python list is created per row. Other columns, such as pandas
+    object columns holding Python lists, are flattened from their Python values.
+
+    Parameters
+    ----------
+    gt
+        The `GT` object containing the data
+    expr
+        The column expression to resolve
+
+    Returns
+    -------
+    tuple[str, np.ndarray | list, np.ndarray]
+        A tuple of (column_name, flat_values, offsets). The values of row `i` are
+        `flat_values[offsets[i]:offsets[i + 1]]`. Natively flattened values are a float array
+        with missing values as `NaN`, otherwise they are a list of the original values. Missing
+        rows have no values.
+
+    Raises
+    ------
+    KeyError
+        If the column is not found
+    ValueError
+        If multiple columns are resolved
+    """
+    col_name = _resolve_single_column(gt, expr)
+    flat_vals, offsets = _flatten_list_column(gt._tbl_data, col_name)
+
+    return col_name, flat_vals, offsets
+
+
+@_cached_column_read
+def _flatten_list_column(
+    data_table, col_name: str
+) -> tuple[np.ndarray | list, np.ndarray]:
+    frame = nw.from_native(data_table, eager_only=True)
+    column = frame[col_name]
+
+    if column.dtype == nw.List and column.dtype.inner.is_numeric():  # type: ignore
+        lengths = column.list.len().fill_null(0)
+
+        if frame.implementation is nw.Implementation.PYARROW:
+            import pyarrow.compute as pc
+
+            flat_column = pc.list_flatten(column.to_native()).cast("float64")
+            flat_vals = flat_column.to_numpy(zero_copy_only=False)
+        else:
+            flat_vals = (
+                frame.select(col_name)
+                .filter(lengths > 0)
+                .explode(col_name)[col_name]
+                .cast(nw.Float64)
+                .to_numpy()
+            )
+
+        lengths = lengths.to_numpy()
+
+    else:
+        col_vals = _read_column(data_table, col_name)
+        lengths = [len(entry) if entry is not None else 0 for entry in col_vals]
+        flat_vals = list(
+            chain.from_iterable(entry for entry in col_vals if entry is not None)
+        )
+
+    offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+
+    return flat_vals, offsets
+
+
+@_cached_column_read
+def _get_na_mask(data_table, col_name: str) -> np.ndarray:
+    """
+    Compute which values of a column are missing, in one pass over the native column.
+
+    Missing values are nulls and, in float columns, `NaN` values, as with great_tables' `is_na()`.
+    Helpers compute the mask once per column and look it up by row index, rather than checking
+    each value on its own.
+
+    Parameters
+    ----------
+    data_table
+        The underlying data table
+    col_name
+        The name of the column
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array, `True` where the value of the row is missing.
+    """
+    column = nw.from_native(data_table, eager_only=True)[col_name]
+
+    is_missing = column.is_null()
+    if column.dtype.is_float():
+        is_missing = is_missing | column.is_nan().fill_null(True)
+
+    return np.asarray(is_missing.to_numpy(), dtype=bool)
+
+
+@_cached_column_read
+def _factorize_column(data_table, col_name: str) -> tuple[np.ndarray, list]:
+    """
+    Encode a column as integer codes into its distinct values, in order of first appearance.
+
+    Dictionary-encoded columns (pandas `category`, polars `Categorical` and `Enum`, and pyarrow
+    dictionary columns) are read from their native codes, so no value is hashed or compared.
+    Other columns are factorized with one dictionary lookup per value.
+
+    Parameters
+    ----------
+    data_table
+        The underlying data table
+    col_name
+        The name of the column
+
+    Returns
+    -------
+    tuple[np.ndarray, list]
+        A tuple of (codes, uniques). `uniques` holds the distinct non-missing values in the order
+        they first appear, and `codes[i]` is the position of row `i`'s value in `uniques`, or `-1`
+        if it is missing.
+    """
+    column = nw.from_native(data_table, eager_only=True)[col_name]
+
+    if column.dtype in (nw.Categorical, nw.Enum):
+        codes, dictionary = _get_dictionary_codes(column)
+
+        # Renumber the dictionary entries that are used by their first appearance in the column
+        is_valid = codes >= 0
+        used, first_rows = np.unique(codes[is_valid], return_index=True)
+        used = used[np.argsort(first_rows)]
+
+        renumber = np.full(len(dictionary), -1, dtype=np.int64)
+        renumber[used] = np.arange(len(used))
+        codes = np.where(is_valid, renumber[np.maximum(codes, 0)], -1)
+
+        return codes, [dictionary[code] for code in used.tolist()]
+
+    is_missing = _get_na_mask(data_table, col_name).tolist()
+    lookup: dict[Any, int] = {}
+    codes = np.fromiter(
+        (
+            -1 if missing else lookup.setdefault(val, len(lookup))
+            for val, missing in zip(column.to_list(), is_missing)
+        ),
+        dtype=np.int64,
+        count=len(is_missing),
+    )
+
+    return codes, list(lookup)
+
+
+def _get_dictionary_codes(column: nw.Series) -> tuple[np.ndarray, list]:
+    """
+    Get the native codes, with `-1` for missing values, and dictionary of a categorical column.
+    """
+    native = column.to_native()
+
+    if column.implementation is nw.Implementation.PANDAS:
+        return native.cat.codes.to_numpy(dtype=np.int64), native.cat.categories.tolist()
+
+    if column.implementation is nw.Implementation.POLARS:
+        import polars as pl
+
+        codes = native.to_physical().cast(pl.Int64).fill_null(-1).to_numpy()
+        return codes, native.cat.get_categories().to_list()
+
+    import pyarrow.compute as pc
+
+    # Chunks may hold different dictionaries, so unify them before reading the codes
+    combined = native.unify_dictionaries().combine_chunks()
+    codes = pc.fill_null(combined.indices.cast("int64"), -1).to_numpy()
+    return codes, combined.dictionary.to_pylist()
+
+
+@_cached_column_read
+def _get_global_range(
+    data_table,
+    col_names: list[str],
+    padding: float = 0,
+) -> tuple[float, float]:
+    """
+    Compute the minimum and maximum over several columns in a single native aggregation.
+
+    Missing values, including `NaN` in float columns, are skipped.
+
+    Parameters
+    ----------
+    data_table
+        The underlying data table
+    col_names
+        The names of the numeric columns to compute the range over
+    padding
+        The fraction of the range to add below the minimum and above the maximum
+
+    Returns
+    -------
+    tuple[float, float]
+        The padded `(minimum, maximum)`. Both are `NaN` if every value is missing.
+    """
+    frame = nw.from_native(data_table, eager_only=True)
+
+    columns = []
+    for col_name in col_names:
+        dtype = frame.schema[col_name]
+        column = nw.col(col_name)
+
+        # Columns of only nulls (e.g. polars' `Null` dtype) have no range to contribute
+        if dtype == nw.Unknown:
+            continue
+        if dtype.is_float():
+            column = nw.when(~column.is_nan()).then(column)
+        columns.append(column)
+
+    if not columns:
+        return np.nan, np.nan
+
+    data_min, data_max = frame.select(
+        nw.min_horizontal(*(column.min() for column in columns)).alias("min"),
+        nw.max_horizontal(*(column.max() for column in columns)).alias("max"),
+    ).rows()[0]
+
+    if data_min is None or data_max is None:
+        return np.nan, np.nan
+
+    data_min, data_max = float(data_min), float(data_max)
+    data_range = data_max - data_min
+
+    return data_min - data_range * padding, data_max + data_range * padding
+
+
+def _has_numeric_dtype(data_table, col_name: str) -> bool:
+    return nw.from_native(data_table, eager_only=True).schema[col_name].is_numeric()
+
+
+def _resolve_single_column(gt: GT, expr: SelectExpr) -> str:
     col_names = resolve_cols_c(data=gt, expr=expr)
 
     if len(col_names) == 0:
@@ -49,12 +390,10 @@ def _validate_and_get_single_column(
             f"Expected a single column, but got multiple columns: {col_names}"
         )
 
-    col_name = col_names[0]
-    col_vals = to_list(gt._tbl_data[col_name])
-
-    return col_name, col_vals
+    return col_names[0]
 
 
+@_profile_stage("scaling")
 def _scale_numeric_column(
     data_table,
     col_name: str,
@@ -88,38 +427,44 @@ def _scale_numeric_column(
     TypeError
         If the column is not numeric
     """
-    col_vals_filtered = [x for x in col_vals if not is_na(data_table, x)]
+    is_missing = _get_na_mask(data_table, col_name).tolist()
+    col_vals_filtered = [x for x, missing in zip(col_vals, is_missing) if not missing]
 
     # Check that column has numeric data
-    if len(col_vals_filtered) and all(
-        isinstance(x, (int, float)) for x in col_vals_filtered
+    if not (
+        len(col_vals_filtered)
+        and all(isinstance(x, (int, float)) for x in col_vals_filtered)
     ):
-        # If `domain` is not provided, then set it to a default domain
-        if domain is None:
-            if default_domain_min_zero:
-                domain = [0, max(col_vals_filtered)]
-            else:
-                domain = [min(col_vals_filtered), max(col_vals_filtered)]
-
-        # Rescale based on the given domain
-        scaled_vals = _rescale_numeric(
-            df=data_table,
-            vals=col_vals,
-            # Alternatively we could convert the domain to floats, but I dont mind ignoring this
-            domain=domain,  # type: ignore
-        )
-    else:
         raise TypeError(
             f"Invalid column type provided ({col_name}). Please ensure that the column is numeric."
         )
 
-    # Map scaled values back to original positions, using 0 for NAs
+    # If `domain` is not provided, then set it to a default domain
+    if domain is None:
+        if default_domain_min_zero:
+            domain = [0, max(col_vals_filtered)]
+        else:
+            domain = [min(col_vals_filtered), max(col_vals_filtered)]
+
+    # Rescale the whole column at once, with NAs as NaN
+    domain_min, domain_max = domain
+    domain_range = domain_max - domain_min
+    vals = np.array(
+        [np.nan if missing else x for x, missing in zip(col_vals, is_missing)],
+        dtype=float,
+    )
+    if domain_range == 0:
+        scaled_vals = np.zeros_like(vals).tolist()
+    else:
+        scaled_vals = ((vals - domain_min) / domain_range).tolist()
+
+    # Map NAs to 0, and values outside of the domain to its nearest end
     scaled_vals_fixed = []
-    for orig_val, scaled_val in zip(col_vals, scaled_vals):
-        if is_na(data_table, orig_val):
+    for orig_val, scaled_val, missing in zip(col_vals, scaled_vals, is_missing):
+        if missing:
             scaled_vals_fixed.append(0)
 
-        elif is_na(data_table, scaled_val):
+        elif scaled_val < 0 or scaled_val > 1:
             # consider handling by leaving the original val, and having a third color/category.
 
             # If original value < domain[0], set to 0; if > domain[1], set to 1
@@ -147,3 +492,179 @@ def _format_numeric_text(value: float, num_decimals: int) -> str:
         return f"{value:.0f}"
     else:
         return f"{value:.{num_decimals}f}".rstrip("0").rstrip(".")
+
+
+def _fmt_with_row_payloads(
+    gt: GT,
+    fn: Callable[..., str],
+    column: str,
+    payloads: dict[str, Sequence],
+    rows: list[int] | None = None,
+    render_caches: Sequence[dict] = (),
+) -> GT:
+    """
+    Format the rows of a column with one formatter that looks up per-row values by row index.
+
+    Registering one closure per row keeps a function object alive for every cell of the table.
+    Instead, the per-row values are held in compact arrays (such as `array("d")` or NumPy
+    buffers) and shared by a single formatter.
+
+    Parameters
+    ----------
+    gt
+        The `GT` object to format
+    fn
+        Called as `fn(value, **{name: payload[row] for name, payload in payloads.items()})` for
+        each formatted cell, and returns the cell's HTML
+    column
+        The name of the column to format
+    payloads
+        Arrays indexed by row number, holding the values `fn` needs for each row
+    rows
+        The rows to format. If `None`, all rows are formatted.
+    render_caches
+        Caches of glyphs that `fn` shares between cells. They are cleared once every cell has been
+        formatted, so the glyphs are only kept for the length of a render.
+
+    Returns
+    -------
+    GT
+        The `GT` object with the formatter added.
+    """
+    if rows is None:
+        rows = list(range(len(gt._tbl_data)))
+
+    formatter = _RowPayloadFormatter(fn, payloads)
+    fmt_info = FormatInfo(FormatFns(default=formatter), [column], rows)
+    fmt_info.cells = _RowPayloadCells(formatter, column, rows, render_caches)
+
+    return gt._replace(_formats=[*gt._formats, fmt_info])
+
+
+def _render_first_cell(gt: GT) -> str:
+    """
+    Render the first cell of the most recently added formatter, as a sample of its output.
+    """
+    fmt = gt._formats[-1]
+    cells = fmt.cells.resolve()
+    if not len(cells):
+        return ""
+
+    column, row = cells[0]
+    value = _get_cell(gt._tbl_data, row, column)
+    if isinstance(fmt.func.default, _RowPayloadFormatter):
+        return str(fmt.func.default(value, row=row))
+    return str(fmt.func.default(value))
+
+
+def _register_within_render_budget(
+    function: str,
+    n_cells: int,
+    register: Callable[..., GT],
+    **settings: Any,
+) -> GT:
+    """
+    Add a function's formatters with the settings that the render budget allows.
+
+    `register` adds the formatters to a `GT` object, given each setting by name, and must not
+    change any other state. When a byte budget is set, it is first called with the current
+    settings to render one sample glyph. If the glyphs exceed the budget, it is called again with
+    the leaner settings, so the formatters are only ever given the settings they render with.
+    """
+    sampled: dict[str, GT] = {}
+
+    def _sample_glyph() -> str:
+        sampled["gt"] = register(**settings)
+        return _render_first_cell(sampled["gt"])
+
+    resolved = _apply_render_budget(
+        function, n_cells=n_cells, sample_glyph=_sample_glyph, **settings
+    )
+
+    if "gt" in sampled and resolved == tuple(settings.values()):
+        return sampled["gt"]
+    return register(**dict(zip(settings, resolved)))
+
+
+# The row payload formatter whose cells great_tables is iterating over, the row of the cell it is
+# about to format, and whether the formatter has been called during the iteration. A context
+# variable, so that each thread rendering a table sees its own.
+_RENDERING_CELL: ContextVar[tuple[_RowPayloadFormatter, int, list[bool]] | None] = (
+    ContextVar("_RENDERING_CELL", default=None)
+)
+
+
+class _RowPayloadFormatter:
+    def __init__(self, fn: Callable[..., str], payloads: dict[str, Sequence]):
+        self._fn = fn
+        self._payloads = payloads
+
+    def __call__(self, value: Any, row: int | None = None) -> str:
+        """
+        Format the cell of `row`. Without a `row`, great_tables is rendering the cells of this
+        formatter, and the row is that of the cell being rendered.
+        """
+        if row is None:
+            rendering = _RENDERING_CELL.get()
+            if rendering is None or rendering[0] is not self:
+                raise RuntimeError(
+                    "A row payload formatter must be given a row, unless great_tables is "
+                    "rendering its cells."
+                )
+            row, formatted = rendering[1], rendering[2]
+            formatted[0] = True
+
+        return self._fn(
+            value, **{name: payload[row] for name, payload in self._payloads.items()}
+        )
+
+
+class _RowPayloadCells(CellSubset):
+    def __init__(
+        self,
+        formatter: _RowPayloadFormatter,
+        column: str,
+        rows: list[int],
+        render_caches: Sequence[dict] = (),
+    ):
+        self.formatter = formatter
+        self.column = column
+        self.rows = rows
+        self.render_caches = render_caches
+
+    def resolve(self) -> list[tuple[str, int]]:
+        return _RowTrackingCells(
+            self.formatter,
+            [(self.column, row) for row in self.rows],
+            self.render_caches,
+        )
+
+
+class _RowTrackingCells(list):
+    # great_tables only passes the value of each cell to its formatter, which it calls while
+    # iterating over the resolved cells. The row of each cell is published just before the call.
+    # great_tables also iterates over the cells without formatting them, such as to find the
+    # cells that are left unformatted, and the render caches are only cleared after a render.
+    def __init__(
+        self,
+        formatter: _RowPayloadFormatter,
+        cells: list[tuple[str, int]],
+        render_caches: Sequence[dict] = (),
+    ):
+        super().__init__(cells)
+        self._formatter = formatter
+        self._render_caches = render_caches
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        previous = _RENDERING_CELL.get()
+        formatted = [False]
+        try:
+            for cell in super().__iter__():
+                _RENDERING_CELL.set((self._formatter, cell[1], formatted))
+                yield cell
+        finally:
+            _RENDERING_CELL.set(previous)
+            # The cells have been formatted, so the glyphs they shared are not needed again
+            if formatted[0]:
+                for cache in self._render_caches:
+                    cache.clear()
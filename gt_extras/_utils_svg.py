@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+__all__ = ["_round_number"]
+
+
+def _round_number(value: float, precision: int | None) -> str:
+    """
+    Write a number rounded to `precision` decimal places, dropping trailing zeros.
+
+    With a precision of 2, `57.29577951308232` becomes `57.3` and `30.0` becomes `30`. A
+    precision of `None` writes the number as is.
+
+    Glyphs pass their coordinates and sizes through this function as they build their SVG
+    elements, so opacities and the text of labels are never rounded.
+    """
+    if precision is None:
+        return str(value)
+
+    rounded = f"{value:.{precision}f}"
+    if "." in rounded:
+        rounded = rounded.rstrip("0").rstrip(".")
+    # Avoid writing "-0" for small negative numbers
+    return "0" if rounded == "-0" else rounded
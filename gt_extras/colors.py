@@ -2,18 +2,21 @@ from __future__ import annotations
 
 from typing import Literal
 
+import numpy as np
 from great_tables import GT, loc, style
 from great_tables._data_color.base import _add_alpha, _html_color
-from great_tables._data_color.palettes import GradientPalette
 from great_tables._locations import Loc, RowSelectExpr, resolve_cols_c
 from great_tables._styles import CellStyle
-from great_tables._tbl_data import SelectExpr, is_na
+from great_tables._tbl_data import SelectExpr
 
-from gt_extras._utils_color import _get_palette
+from gt_extras._utils_color import _get_gradient_colors, _get_palette
 from gt_extras._utils_column import (
+    _fmt_with_row_payloads,
+    _get_na_mask,
     _scale_numeric_column,
     _validate_and_get_single_column,
 )
+from gt_extras.profiling import _profile_function
 
 __all__ = [
     "gt_data_color_by_group",
@@ -416,6 +419,7 @@ def gt_hulk_col_numeric(
     return res
 
 
+@_profile_function
 def gt_color_box(
     gt: GT,
     columns: SelectExpr,
@@ -426,6 +430,7 @@ def gt_color_box(
     min_width: int | float = 70,
     min_height: int | float = 20,
     font_weight: str = "normal",
+    compact: bool = False,
 ) -> GT:
     """
     Add PFF-style color boxes to numeric columns in a `GT` object.
@@ -467,6 +472,11 @@ def gt_color_box(
         A string indicating the weight of the font for the numeric values. Can be `"normal"`,
         `"bold"`, or other CSS font-weight values. Defaults to `"normal"`.
 
+    compact
+        A boolean indicating whether to emit minified HTML. The default output is indented for
+        readability; setting this to `True` drops that whitespace from every cell, which can
+        considerably reduce the size of large tables.
+
     Returns
     -------
     GT
@@ -502,8 +512,8 @@ def gt_color_box(
     # Get the underlying `GT` data
     data_table = gt._tbl_data
 
-    def _make_color_box(value: float, fill: str, alpha: float = 0.2):
-        if is_na(data_table, value):
+    def _make_color_box(value: float, fill: str, is_missing: bool, alpha: float = 0.2):
+        if is_missing:
             return "<div></div>"
 
         background_color = fill
@@ -528,6 +538,17 @@ def gt_color_box(
             f"font-weight:{font_weight}; white-space:nowrap;"
         )
 
+        if compact:
+            main_box_style, color_square_style, value_text_style = (
+                s.replace("; ", ";").replace(": ", ":")
+                for s in (main_box_style, color_square_style, value_text_style)
+            )
+            return (
+                f'<div><div style="{main_box_style}">'
+                f'<div style="{color_square_style}"></div>'
+                f'<div style="{value_text_style}">{str(value)}</div></div></div>'
+            )
+
         html = f'''
         <div>
             <div style="{main_box_style}">
@@ -559,27 +580,24 @@ def gt_color_box(
             default_domain_min_zero=False,
         )
 
-        # Create a color scale function from the palette
-        color_scale_fn = GradientPalette(colors=palette)
-
-        # Call the color scale function on the scaled values to get a list of colors
-        color_vals = color_scale_fn(scaled_vals)
-
-        # Coerce color values to str if None
-        color_vals = [c for c in color_vals if c is not None]
-
-        # Apply gt.fmt() to each row individually, so we can access the color_value for that row
-        for i in range(len(data_table)):
-            color_val = color_vals[i]
-
-            res = res.fmt(
-                lambda x, fill=color_val: _make_color_box(
-                    value=x,
-                    fill=fill,
-                    alpha=alpha,
-                ),
-                columns=column,
-                rows=[i],
-            )
+        color_vals = _get_gradient_colors(palette, scaled_vals)
+
+        # Store each row's color as a code into the column's distinct colors
+        fills, fill_codes = np.unique(color_vals, return_inverse=True)
+
+        res = _fmt_with_row_payloads(
+            res,
+            lambda x, fill_code, is_missing, fills=fills.tolist(): _make_color_box(
+                value=x,
+                fill=fills[fill_code],
+                is_missing=is_missing,
+                alpha=alpha,
+            ),
+            column=col_name,
+            payloads={
+                "fill_code": fill_codes.astype(np.int32),
+                "is_missing": _get_na_mask(data_table, col_name),
+            },
+        )
 
     return res
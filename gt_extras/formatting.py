@@ -1,22 +1,37 @@
 from __future__ import annotations
 
-import re
 import tempfile
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import Literal, Sequence, TextIO
 
 import narwhals.stable.v1 as nw
 from great_tables import GT
+from great_tables import _locations as loc
 from great_tables._export import _create_temp_file_server
-from great_tables._gt_data import Boxhead, ColInfo
-from great_tables._tbl_data import SelectExpr, is_na
-
-from gt_extras._utils_column import _validate_and_get_single_column
-
-__all__ = ["fmt_pct_extra", "gt_duplicate_column", "gt_two_column_layout"]
-
-
+from great_tables._gt_data import Body, Boxhead, ColInfo
+from great_tables._scss import compile_scss
+from great_tables._tbl_data import SelectExpr
+from great_tables._utils_render_html import _flatten_styles, _is_loc
+
+from gt_extras._utils_column import (
+    _fmt_with_row_payloads,
+    _get_na_mask,
+    _validate_and_get_single_column,
+)
+from gt_extras.profiling import _profile_function
+
+__all__ = [
+    "fmt_pct_extra",
+    "gt_duplicate_column",
+    "gt_two_column_layout",
+    "gt_grid_layout",
+]
+
+
+@_profile_function
 def fmt_pct_extra(
     gt: GT,
     columns: SelectExpr,
@@ -99,8 +114,8 @@ def fmt_pct_extra(
     """
     # TODO: consider how to handle negative values
 
-    def _fmt_pct_single_val(value: float):
-        if is_na(gt._tbl_data, value):
+    def _fmt_pct_single_val(value: float, is_missing: bool):
+        if is_missing:
             return ""
 
         # Convert to percentage
@@ -112,7 +127,13 @@ def fmt_pct_extra(
             return f"{pct_value:.{decimals}f}%"
 
     res = gt
-    res = res.fmt(_fmt_pct_single_val, columns=columns)
+    for column in loc.resolve_cols_c(data=gt, expr=columns):
+        res = _fmt_with_row_payloads(
+            res,
+            _fmt_pct_single_val,
+            column=column,
+            payloads={"is_missing": _get_na_mask(gt._tbl_data, column)},
+        )
 
     return res
 
@@ -193,68 +214,92 @@ def gt_duplicate_column(
             f"The new column name '{new_col_name}' cannot be the same as the original column name '{original_name}'."
         )
 
-    res = gt
+    res = _duplicate_columns(gt, {original_name: new_col_name})
+
+    if after is None:
+        res = res.cols_move_to_end(new_col_name)
+    else:
+        res = res.cols_move(new_col_name, after=after)
+
+    return res
 
-    # get the boxhead info
-    original_col_info = None
-    for col_info in res._boxhead:
-        if col_info.var == original_name:
-            original_col_info = col_info
-            break
 
-    if TYPE_CHECKING:
+def _duplicate_columns(
+    gt: GT, dupes: dict[str, str], after_original: bool = False
+) -> GT:
+    """
+    Duplicate several columns of a `GT` object in a single update.
+
+    `dupes` maps each original column name to the name of its duplicate. The duplicates are
+    appended to the end of the table in the order given or, if `after_original` is `True`,
+    placed directly after their original columns. Both the data and the body are extended with
+    one `with_columns()` call each, which references the original column buffers rather than
+    copying them, and the input `GT` object is left unmodified.
+    """
+    if not dupes:
+        return gt
+
+    col_infos = {col_info.var: col_info for col_info in gt._boxhead}
+
+    new_col_infos = {}
+    for original_name, new_col_name in dupes.items():
+        original_col_info = col_infos.get(original_name)
+
         if original_col_info is None:
             raise ValueError(f"Column '{original_name}' not found in boxhead.")
 
-    # make the new boxhead entry
-    new_col_info = ColInfo(
-        var=new_col_name,
-        type=original_col_info.type,
-        column_label=new_col_name,
-        column_align=original_col_info.column_align,
-        column_width=original_col_info.column_width,
-    )
+        # make the new boxhead entry
+        new_col_infos[original_name] = ColInfo(
+            var=new_col_name,
+            type=original_col_info.type,
+            column_label=new_col_name,
+            column_align=original_col_info.column_align,
+            column_width=original_col_info.column_width,
+        )
+
+    dupe_exprs = [
+        nw.col(original_name).alias(new_col_name)
+        for original_name, new_col_name in dupes.items()
+    ]
 
-    # Duplicate the col in the data_table data
-    original_data_table = res._tbl_data
+    # Duplicate the cols in the data_table data
     new_data_table = nw.to_native(
-        nw.from_native(original_data_table).with_columns(
-            nw.col(original_name).alias(new_col_name)
-        )
+        nw.from_native(gt._tbl_data).with_columns(*dupe_exprs)
     )
 
-    # Duplicate the col in the body element of body
-    new_body = res._body
-    new_body.body = nw.to_native(
-        nw.from_native(new_body.body).with_columns(
-            nw.col(original_name).alias(new_col_name)
-        )
+    # Duplicate the cols in the body, without touching the body of the original GT
+    new_body = Body(
+        nw.to_native(nw.from_native(gt._body.body).with_columns(*dupe_exprs))
     )
 
-    new_boxhead_list = list(res._boxhead._d) + [new_col_info]
-    new_boxhead = Boxhead(new_boxhead_list)
-
-    res = res._replace(_tbl_data=new_data_table, _boxhead=new_boxhead, _body=new_body)
-
-    if after is None:
-        res = res.cols_move_to_end(new_col_name)
+    if after_original:
+        new_boxhead_list = []
+        for col_info in gt._boxhead:
+            new_boxhead_list.append(col_info)
+            if col_info.var in new_col_infos:
+                new_boxhead_list.append(new_col_infos[col_info.var])
     else:
-        res = res.cols_move(new_col_name, after=after)
+        new_boxhead_list = list(gt._boxhead._d) + list(new_col_infos.values())
 
-    return res
+    new_boxhead = Boxhead(new_boxhead_list)
+
+    return gt._replace(_tbl_data=new_data_table, _boxhead=new_boxhead, _body=new_body)
 
 
 class GTCombinedLayout:
     """
-    Represents the combined layout of two `GT` objects rendered side by side.
+    Represents the combined layout of multiple `GT` objects rendered together.
 
     This class is returned by [`gt_two_column_layout()`](https://posit-dev.github.io/gt-extras/reference/gt_two_column_layout)
+    and [`gt_grid_layout()`](https://posit-dev.github.io/gt-extras/reference/gt_grid_layout),
     and is designed for automatic rendering in Jupyter notebooks and other HTML-aware environments.
 
     Parameters
     ----------
     html_content
-        The combined HTML content representing the two tables in a single layout.
+        The combined HTML content representing the tables in a single layout. This may be a
+        single string, or a sequence of strings (such as wrapper markup and each table's HTML)
+        that are concatenated in order.
 
     Methods
     -------
@@ -266,10 +311,27 @@ class GTCombinedLayout:
 
     show()
         Displays the table in an environment of choice. Options are `"notebook"` and `"browser"`.
+
+    save()
+        Writes the HTML content to a file.
+
+    write_to()
+        Writes the HTML content to an open text file object.
     """
 
-    def __init__(self, html_content: str):
-        self.html_content = html_content
+    def __init__(self, html_content: str | Sequence[str]):
+        if isinstance(html_content, str):
+            self._parts = [html_content]
+        else:
+            self._parts = list(html_content)
+
+    @property
+    def html_content(self) -> str:
+        return "".join(self._parts)
+
+    @html_content.setter
+    def html_content(self, value: str):
+        self._parts = [value]
 
     def _repr_html_(self):
         return self.html_content
@@ -288,8 +350,7 @@ class GTCombinedLayout:
             )
         elif target == "browser":
             with tempfile.TemporaryDirectory() as tmp_dir:
-                f_path = Path(tmp_dir) / "index.html"
-                f_path.write_text(self._repr_html_(), encoding="utf-8")
+                f_path = self.save(Path(tmp_dir) / "index.html")
 
                 # create a server that closes after 1 request ----
                 server = _create_temp_file_server(f_path)
@@ -298,14 +359,57 @@ class GTCombinedLayout:
         else:
             raise Exception(f"Unknown target display: {target}")
 
-    def save(self):
-        raise NotImplementedError
+    def save(self, file: str | Path, encoding: str = "utf-8") -> Path:
+        """
+        Write the combined layout to an HTML file.
+
+        The wrapper markup and each table's HTML are streamed to the file one after another,
+        so the full document is never held as a single string.
+
+        Parameters
+        ----------
+        file
+            The path of the HTML file to write.
+
+        encoding
+            The text encoding to use when writing the file.
+
+        Returns
+        -------
+        Path
+            The path of the written file.
+        """
+        f_path = Path(file)
+        with open(f_path, "w", encoding=encoding) as f:
+            self.write_to(f)
+
+        return f_path
+
+    def write_to(self, fileobj: TextIO, chunk_size: int = 1 << 16) -> None:
+        """
+        Write the combined layout to an open text file object in chunks.
+
+        Parameters
+        ----------
+        fileobj
+            A writable text file object, such as one returned by `open(..., "w")` or an
+            `io.StringIO`.
+
+        chunk_size
+            The maximum number of characters passed to `fileobj.write()` at a time.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        for part in self._parts:
+            for start in range(0, len(part), chunk_size):
+                fileobj.write(part[start : start + chunk_size])
 
 
 def gt_two_column_layout(
     gt1: GT,
     gt2: GT,
-    target: Literal["notebook", "browser"] | None = None,  # TODO: add save
+    target: Literal["notebook", "browser"] | None = None,
     table_header_from: Literal[1, 2] | None = None,
 ) -> GTCombinedLayout:
     """
@@ -327,7 +431,8 @@ def gt_two_column_layout(
     target
         Determines how the combined layout is displayed. Use `"notebook"` to display in a Jupyter
         notebook, `"browser"` to open in a web browser. If `None`, returns the layout object
-        for automatic rendering. Currently, `"save"` is not yet implemented.
+        for automatic rendering. To write the layout to an HTML file, call `.save()` on the
+        returned layout.
 
     table_header_from
         Determines which table's header (title and subtitle) to include in the combined layout.
@@ -338,7 +443,8 @@ def gt_two_column_layout(
     -------
     GTCombinedLayout
         A layout object that automatically renders as HTML in Jupyter notebooks and Quarto
-        documents. It also has a `.show()` method, taking `"notebook"` or `"browser"` as targets.
+        documents. It also has a `.show()` method, taking `"notebook"` or `"browser"` as targets,
+        and a `.save()` method for writing the layout to an HTML file.
 
     Examples
     --------
@@ -373,77 +479,31 @@ def gt_two_column_layout(
 
     def extract_tab_header_and_style(gt: GT) -> dict:
         """
-        Extract the title, subtitle, and full style block from a GT object's HTML.
+        Extract the title, subtitle, and full style block from a GT object's heading,
+        style, and option data, without rendering the table to HTML.
         """
-        html = gt.as_raw_html()
-
         title = gt._heading.title if gt._heading.title else ""
         subtitle = gt._heading.subtitle if gt._heading.subtitle else ""
 
-        # Extract the original table ID
-        id_match = re.search(r'<div id="([^"]*)"', html)
-        original_id = id_match.group(1) if id_match else ""
-
-        # Extract the entire style block
-        style_match = re.search(r"<style>(.*?)</style>", html, re.DOTALL)
-        style_content = style_match.group(1) if style_match else ""
-
-        # Replace the original ID with "mycombinedtable" in the CSS
-        if original_id:
-            style_content = style_content.replace(f"#{original_id}", "#mycombinedtable")
-            style_content = style_content.replace(
-                "mycombinedtable table", "mycombinedtable div"
-            )
-
-        title_td_pattern = (
-            r'<td[^>]*class="[^"]*gt_title[^"]*"[^>]*>\s*'
-            + re.escape(str(title))
-            + r"\s*</td>"
+        # Compile the table CSS directly against the combined layout's ID
+        style_content = compile_scss(data=gt, id="mycombinedtable", all_important=False)
+        style_content = style_content.replace(
+            "mycombinedtable table", "mycombinedtable div"
         )
-        title_match = re.search(title_td_pattern, html, re.DOTALL)
 
-        if title_match:
-            td_tag = title_match.group(0)
+        # Gather inline styles the same way great_tables does for the heading cells
+        styles_header = [x for x in gt._styles if _is_loc(x.locname, loc.LocHeader)]
+        styles_title = [x for x in gt._styles if _is_loc(x.locname, loc.LocTitle)]
+        styles_subtitle = [x for x in gt._styles if _is_loc(x.locname, loc.LocSubTitle)]
 
-            # Extract class attribute
-            class_match = re.search(r'class="([^"]*gt_title[^"]*)"', td_tag)
-            title_class = f"gt_table {class_match.group(1)}" if class_match else ""
+        title_class = "gt_table gt_heading gt_title gt_font_normal" if title else ""
+        title_inline_style = _flatten_styles(styles_header + styles_title) or ""
 
-            # Extract style attribute
-            style_match = re.search(r'style="([^"]*)"', td_tag)
-            title_inline_style = style_match.group(1) if style_match else ""
-        else:
-            title_class = ""
-            title_inline_style = ""
-
-        subtitle_class = ""
-
-        subtitle_td_pattern = (
-            r'<td[^>]*class="[^"]*gt_subtitle[^"]*"[^>]*>\s*'
-            + re.escape(str(subtitle))
-            + r"\s*</td>"
+        # gt_bottom_border is left off, since the tables below supply their own
+        subtitle_class = (
+            "gt_table gt_heading gt_subtitle gt_font_normal" if subtitle else ""
         )
-        subtitle_match = re.search(subtitle_td_pattern, html, re.DOTALL)
-
-        if subtitle_match:
-            td_tag = subtitle_match.group(0)
-
-            # Extract class attribute
-            class_match = re.search(r'class="([^"]*gt_subtitle[^"]*)"', td_tag)
-
-            if class_match:
-                # Exclude gt_bottom_border from class string if present
-                class_str = class_match.group(1)
-                class_str = " ".join(
-                    c for c in class_str.split() if c != "gt_bottom_border"
-                )
-                subtitle_class = f"gt_table {class_str}"
-
-            # Extract style attribute
-            style_match = re.search(r'style="([^"]*)"', td_tag)
-            subtitle_inline_style = style_match.group(1) if style_match else ""
-        else:
-            subtitle_inline_style = ""
+        subtitle_inline_style = _flatten_styles(styles_header + styles_subtitle) or ""
 
         return {
             "title": title,
@@ -501,30 +561,178 @@ def gt_two_column_layout(
         table_1_html = gt1.as_raw_html()
         table_2_html = gt2.as_raw_html()
 
-    double_table_html = f"""
+    # Keep the wrapper markup and each table as separate parts, so the layout can be
+    # streamed to a file without concatenating everything into one string
+    double_table_parts = [
+        """
     <div style="display: flex; justify-content: center; width: 100%;">
         <div id="mycombinedtable" style="display: inline-block; width: auto;">
-            {header_html}
+            """,
+        header_html,
+        """
             <div style="overflow: auto; white-space: nowrap;">
                 <div style="display: inline-block; margin-right: 1em;">
-                    {table_1_html}
+                    """,
+        table_1_html,
+        """
                 </div>
                 <div style="display: inline-block;">
-                    {table_2_html}
+                    """,
+        table_2_html,
+        """
                 </div>
             </div>
         </div>
     </div>
-    """
+    """,
+    ]
 
-    double_table = GTCombinedLayout(double_table_html)
+    double_table = GTCombinedLayout(double_table_parts)
 
     if target:
-        if target == "save":
-            raise NotImplementedError(
-                "At the moment, only notebook and browser display options are available."
+        double_table.show(target)
+
+    return double_table
+
+
+def gt_grid_layout(
+    gts: list[GT],
+    ncol: int = 2,
+    gap: str = "1em",
+    target: Literal["notebook", "browser"] | None = None,
+    max_workers: int | None = None,
+) -> GTCombinedLayout:
+    """
+    Arrange any number of `GT` objects in a grid layout.
+
+    This function generalizes [`gt_two_column_layout()`](https://posit-dev.github.io/gt-extras/reference/gt_two_column_layout)
+    to an arbitrary number of tables, placed row by row into a grid with `ncol` columns. The
+    tables are rendered concurrently, and tables that share identical styling share a single
+    stylesheet in the output rather than each carrying their own copy.
+
+    Parameters
+    ----------
+    gts
+        The tables to include in the layout, in row-major order.
+
+    ncol
+        The number of columns in the grid. The number of rows is determined by the number of
+        tables.
+
+    gap
+        The spacing between grid cells, as a CSS length.
+
+    target
+        Determines how the combined layout is displayed. Use `"notebook"` to display in a Jupyter
+        notebook, `"browser"` to open in a web browser. If `None`, returns the layout object
+        for automatic rendering.
+
+    max_workers
+        The maximum number of threads used to render the tables. If `None`, the default of
+        [`concurrent.futures.ThreadPoolExecutor`](https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor)
+        is used.
+
+    Returns
+    -------
+    GTCombinedLayout
+        A layout object that automatically renders as HTML in Jupyter notebooks and Quarto
+        documents. It also has a `.show()` method, taking `"notebook"` or `"browser"` as targets,
+        and a `.save()` method for writing the layout to an HTML file.
+
+    Examples
+    --------
+    ```{python}
+    from great_tables import GT
+    import gt_extras as gte
+    import pandas as pd
+
+    gts = [
+        GT(pd.DataFrame({"A": [i, i + 1], "B": [i * 2, i * 3]})).tab_header(f"Table {i}")
+        for i in range(1, 5)
+    ]
+
+    gte.gt_grid_layout(gts, ncol=2)
+    ```
+    """
+    if ncol < 1:
+        raise ValueError("ncol must be a positive integer.")
+
+    # Each worker renders in its own copy of this context, so an active `profile()` sees it
+    contexts = [copy_context() for _ in gts]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tables_html = list(
+            executor.map(lambda ctx, gt: ctx.run(gt.as_raw_html), contexts, gts)
+        )
+
+    # Pull each table's <style> block out, keyed on its CSS with the table ID removed,
+    # so that identically styled tables can share one stylesheet.
+    stylesheets: dict[str, str] = {}
+    cells_html = []
+    for table_html in tables_html:
+        table_id, css, body = _split_table_style(table_html)
+
+        if table_id is None:
+            cells_html.append(table_html)
+            continue
+
+        normalized_css = css.replace(f"#{table_id}", "#__gte_table_id__")
+        style_class = stylesheets.setdefault(
+            normalized_css, f"gte-grid-style-{len(stylesheets)}"
+        )
+
+        cells_html.append(
+            body.replace(
+                f'<div id="{table_id}"',
+                f'<div id="{table_id}" class="{style_class}"',
+                1,
             )
-        else:
-            double_table.show(target)
+        )
+
+    style_html = "\n".join(
+        f"<style>{css.replace('#__gte_table_id__', f'.{style_class}')}</style>"
+        for css, style_class in stylesheets.items()
+    )
+    grid_parts = [
+        f"""
+    <div style="display: flex; justify-content: center; width: 100%;">
+        {style_html}
+        <div style="display: grid; grid-template-columns: repeat({ncol}, auto); gap: {gap}; align-items: start;">
+            """
+    ]
+    for i, cell_html in enumerate(cells_html):
+        if i > 0:
+            grid_parts.append("\n")
+        grid_parts.extend(['<div style="min-width: 0;">', cell_html, "</div>"])
+    grid_parts.append(
+        """
+        </div>
+    </div>
+    """
+    )
+
+    grid = GTCombinedLayout(grid_parts)
+
+    if target:
+        grid.show(target)
+
+    return grid
+
+
+def _split_table_style(table_html: str) -> tuple[str | None, str, str]:
+    """
+    Split a table rendered by `GT.as_raw_html()` into its ID, its CSS, and the remaining HTML.
+    The `<style>` block sits at the top of the output, so only the head of the string is scanned.
+    """
+    id_start = table_html.find('<div id="')
+    style_start = table_html.find("<style>")
+    style_end = table_html.find("</style>", style_start)
+
+    if id_start == -1 or style_start == -1 or style_end == -1:
+        return None, "", table_html
+
+    id_start += len('<div id="')
+    table_id = table_html[id_start : table_html.find('"', id_start)]
+    css = table_html[style_start + len("<style>") : style_end]
+    body = table_html[:style_start] + table_html[style_end + len("</style>") :]
 
-    return GTCombinedLayout(double_table_html)
+    return table_id, css, body
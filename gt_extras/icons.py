@@ -8,10 +8,12 @@ from great_tables import GT
 from great_tables._tbl_data import SelectExpr, is_na
 
 from gt_extras._utils_column import _validate_and_get_single_column
+from gt_extras.profiling import _profile_function, _profile_stage
 
 __all__ = ["fa_icon_repeat", "gt_fa_rating", "gt_fa_rank_change"]
 
 
+@_profile_stage("icon_generation")
 def fa_icon_repeat(
     name: str = "star",
     repeats: int = 1,
@@ -136,6 +138,7 @@ def fa_icon_repeat(
     return repeated_icon
 
 
+@_profile_function
 def gt_fa_rating(
     gt: GT,
     columns: SelectExpr,
@@ -204,6 +207,7 @@ def gt_fa_rating(
     ```
     """
 
+    @_profile_stage("icon_generation")
     def _make_rating_html(rating_value):
         if rating_value is None or is_na(gt._tbl_data, rating_value):
             return ""
@@ -263,6 +267,7 @@ def gt_fa_rating(
     return res
 
 
+@_profile_function
 def gt_fa_rank_change(
     gt: GT,
     column: SelectExpr,
@@ -361,6 +366,7 @@ def gt_fa_rank_change(
 
     # TODO: consider in this and in others, do I really need to pass all these params in?
     # I can just get them from the parent function, but maybe that's less clean.
+    @_profile_stage("icon_generation")
     def _make_ranked_cell_html(
         value: float,
         icon_type: Literal["angles", "arrow", "turn", "chevron", "caret"],
@@ -13,6 +13,8 @@ from great_tables._tbl_data import Agnostic, DataFrameLike, PlExpr, SelectExpr,
 from great_tables._text import Html
 from great_tables._utils import is_valid_http_schema
 
+from gt_extras.profiling import _profile_function, _profile_stage
+
 __all__ = ["add_text_img", "img_header", "gt_fmt_img_circle"]
 
 
@@ -23,6 +25,7 @@ def img_header(
     font_size: int = 12,
     border_color: str = "black",
     text_color: str = "black",
+    compact: bool = False,
 ) -> Html:
     """
     Create an HTML header with an image and a label, for a column label.
@@ -47,6 +50,9 @@ def img_header(
     text_color
         The color of the label text.
 
+    compact
+        Whether to emit minified HTML, without the whitespace used to indent the default output.
+
     Returns
     -------
     html
@@ -100,6 +106,15 @@ def img_header(
     [`add_text_img()`](https://posit-dev.github.io/gt-extras/reference/add_text_img)
     """
 
+    if compact:
+        return html(
+            f'<div style="text-align:center;">'
+            f'<img src="{img_url}" style="height:{px(height)};object-fit:contain;'
+            f'object-position:bottom;border-bottom:2px solid {border_color};"/>'
+            f'<div style="font-size:{px(font_size)};color:{text_color};'
+            f'text-align:center;width:100%;">{label}</div></div>'
+        )
+
     img_html = f"""
     <img src="{img_url}" style="
         height:{px(height)};
@@ -137,6 +152,7 @@ def add_text_img(
     gap: float = 3.0,
     left: bool = False,
     alt_text: str = "",
+    compact: bool = False,
 ) -> str:
     """
     Create an HTML element with text and an image, displayed inline.
@@ -166,6 +182,10 @@ def add_text_img(
         The alternative text for the image, used for accessibility and displayed if the image
         cannot be loaded.
 
+    compact
+        Whether to emit minified HTML, without the whitespace used to indent the default output.
+        This is worthwhile when the output is placed in many table cells.
+
     Returns
     -------
     str
@@ -240,6 +260,15 @@ def add_text_img(
 
     flex_direction = "row" if left else "row-reverse"
 
+    if compact:
+        return (
+            f"<div style='display:flex;flex-direction:{flex_direction};"
+            f"align-items:center;gap:{px(gap)};'>"
+            f"<div style='flex-shrink:0;'><img src='{img_url}' alt='{alt_text}' "
+            f"style='height:{px(height)};width:auto;object-fit:contain;'/></div>"
+            f"<div style='flex-grow:1;'>{text}</div></div>"
+        )
+
     combined_html = f"""
     <div style='display:flex; flex-direction:{flex_direction}; align-items:center; gap:{px(gap)};'>
         <div style='flex-shrink: 0;'>
@@ -256,6 +285,7 @@ def add_text_img(
 
 
 # Copied from https://github.com/posit-dev/great-tables/pull/676
+@_profile_function
 def gt_fmt_img_circle(
     gt: GT,
     columns: SelectExpr = None,
@@ -520,6 +550,7 @@ class FmtImage:
         return [file_pattern.format(file) for file in files]
 
     @classmethod
+    @_profile_stage("image_encoding")
     def _get_image_uri(cls, filename: str) -> str:
         import base64
 
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Callable
+
+__all__ = ["set_options", "get_options"]
+
+
+# The coordinate precision that glyphs over the render budget are lowered to
+BUDGET_PRECISION = 1
+
+# The lean value of each setting that glyphs over the render budget switch to, and how the
+# switch is described in the notice
+_LEAN_SETTINGS = {
+    "show_labels": (False, "per-cell labels"),
+    "labels": (False, "per-cell labels"),
+    "interactivity": (False, "interactivity CSS and tooltips"),
+    "precision": (
+        BUDGET_PRECISION,
+        f"coordinate precision (to {BUDGET_PRECISION} decimal place)",
+    ),
+}
+
+
+@dataclass
+class _Options:
+    precision: int | None = None
+    render_budget_cells: int | None = None
+    render_budget_bytes: int | None = None
+
+
+_OPTIONS = _Options()
+
+
+def set_options(**options: Any) -> dict[str, Any]:
+    """
+    Set global options that apply to every gt-extras function.
+
+    Options set here act as defaults. Where a function has a parameter of the same name, passing
+    that parameter overrides the global option for that call.
+
+    Parameters
+    ----------
+    **options
+        The options to set, by name. The available options are:
+
+        - `precision`: the number of decimal places to round the coordinates and sizes written
+        into SVG glyphs to. The default of `None` writes them at full precision.
+        - `render_budget_cells`: the largest number of glyph cells a single function call draws
+        in full. Past this, the function switches to a leaner variant of its glyphs: it drops
+        per-cell text labels and interactivity CSS, and lowers the coordinate precision to one
+        decimal place. A single warning lists what was switched off. The default of `None` sets
+        no budget.
+        - `render_budget_bytes`: like `render_budget_cells`, but a budget on the estimated size in
+        bytes of the glyphs of a single function call, estimated from one sample glyph.
+
+    Returns
+    -------
+    dict[str, Any]
+        The previous values of the options that were set, which can be passed back to
+        `set_options()` to restore them.
+
+    Examples
+    --------
+    ```{python}
+    from great_tables import GT
+    from great_tables.data import gtcars
+    import gt_extras as gte
+
+    gtcars_mini = gtcars.loc[0:8, ["model", "mfr", "hp", "trq", "mpg_c"]]
+
+    previous = gte.set_options(precision=1)
+    gt = GT(gtcars_mini).pipe(gte.gt_plt_donut, columns=["hp", "trq"])
+    gte.set_options(**previous)
+
+    gt
+    ```
+    """
+    known = {field.name for field in fields(_Options)}
+    unknown = set(options) - known
+    if unknown:
+        raise ValueError(f"Unknown gt-extras options: {sorted(unknown)}")
+
+    if "precision" in options:
+        _validate_precision(options["precision"])
+    for name in ("render_budget_cells", "render_budget_bytes"):
+        if name in options:
+            _validate_budget(name, options[name])
+
+    previous = {name: getattr(_OPTIONS, name) for name in options}
+    for name, value in options.items():
+        setattr(_OPTIONS, name, value)
+
+    return previous
+
+
+def get_options() -> dict[str, Any]:
+    """
+    Get the current values of the global gt-extras options.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dictionary of every option and its current value. See
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options)
+        for the available options.
+    """
+    return asdict(_OPTIONS)
+
+
+def _validate_precision(precision: int | None):
+    if precision is None:
+        return
+    if isinstance(precision, bool) or not isinstance(precision, int) or precision < 0:
+        raise ValueError("Precision must be a non-negative integer or None.")
+
+
+def _validate_budget(name: str, budget: int | None):
+    if budget is None:
+        return
+    if isinstance(budget, bool) or not isinstance(budget, int) or budget <= 0:
+        raise ValueError(f"The {name} option must be a positive integer or None.")
+
+
+def _resolve_precision(precision: int | None) -> int | None:
+    """
+    Return the per-call `precision` if given, and the global option otherwise.
+    """
+    if precision is None:
+        return _OPTIONS.precision
+    _validate_precision(precision)
+    return precision
+
+
+def _apply_render_budget(
+    function: str,
+    n_cells: int,
+    sample_glyph: Callable[[], str] | None = None,
+    **settings: Any,
+) -> tuple[Any, ...]:
+    """
+    Switch settings to their lean values if a function's glyphs exceed the render budget.
+
+    Parameters
+    ----------
+    function
+        The name of the public function, used in the notice.
+    n_cells
+        The number of glyph cells the function draws.
+    sample_glyph
+        Builds one glyph with the current settings, to estimate the size in bytes of all of them.
+        Only called when a byte budget is set.
+    **settings
+        The current value of each setting that can be made leaner, by name. A `precision` is
+        only ever lowered.
+
+    Returns
+    -------
+    tuple
+        The value to use for each setting, in the order they were passed.
+    """
+    current = tuple(settings.values())
+
+    cells_budget = _OPTIONS.render_budget_cells
+    bytes_budget = _OPTIONS.render_budget_bytes
+
+    reason = None
+    if cells_budget is not None and n_cells > cells_budget:
+        reason = f"{n_cells:,} glyph cells exceed the budget of {cells_budget:,} cells"
+    elif bytes_budget is not None and sample_glyph is not None and n_cells > 0:
+        n_bytes = n_cells * len(sample_glyph().encode("utf-8"))
+        if n_bytes > bytes_budget:
+            reason = (
+                f"an estimated {n_bytes:,} bytes of glyphs exceed the budget of "
+                f"{bytes_budget:,} bytes"
+            )
+
+    if reason is None:
+        return current
+
+    values = []
+    degraded = []
+    for name, value in settings.items():
+        lean, description = _LEAN_SETTINGS[name]
+        if name == "precision":
+            is_leaner = value is None or value > lean
+        else:
+            is_leaner = value != lean
+
+        if is_leaner:
+            values.append(lean)
+            degraded.append(description)
+        else:
+            values.append(value)
+
+    if degraded:
+        warnings.warn(
+            f"{function}(): {reason}, so these were switched off or reduced: "
+            f"{', '.join(degraded)}.",
+            category=UserWarning,
+        )
+
+    return tuple(values)
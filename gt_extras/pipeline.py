@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from great_tables import GT
+
+from gt_extras._utils_column import _cache_column_reads
+from gt_extras.profiling import _profile_function
+
+__all__ = ["apply_plots"]
+
+
+@_profile_function
+def apply_plots(gt: GT, plots: Iterable[Callable[[GT], GT]]) -> GT:
+    """
+    Apply many gt-extras functions to a `GT` object in a single pass over its data.
+
+    The `apply_plots()` function takes an existing `GT` object and a list of functions to apply to
+    it in order, such as `functools.partial(gte.gt_plt_bar, columns="hp")`. The result is the same
+    as piping the `GT` object through each function in turn, but each column is only read once:
+    its values, missing values, range, and categories are shared by every function that uses it,
+    rather than read again from the underlying data by each one.
+
+    A cell can only show the output of one formatter, the last one applied to it. Any formatter
+    added by `plots` whose cells are all formatted again by a later one is dropped, so it is not
+    run when the table is rendered.
+
+    Parameters
+    ----------
+    gt
+        A `GT` object to modify.
+
+    plots
+        The functions to apply, in order. Each is called with a `GT` object and must return a
+        `GT` object, like the functions passed to `GT.pipe()`.
+
+    Returns
+    -------
+    GT
+        A `GT` object with all of `plots` applied.
+
+    Examples
+    --------
+    ```{python}
+    from functools import partial
+    from great_tables import GT
+    from great_tables.data import gtcars
+    import gt_extras as gte
+
+    gtcars_mini = gtcars.loc[0:8, ["model", "mfr", "hp", "trq", "mpg_c"]]
+
+    gte.apply_plots(
+        GT(gtcars_mini, rowname_col="model"),
+        [
+            partial(gte.gt_plt_bar, columns="hp"),
+            partial(gte.gt_plt_donut, columns="trq"),
+            partial(gte.gt_color_box, columns="mpg_c"),
+        ],
+    )
+    ```
+    """
+    n_formats = len(gt._formats)
+
+    res = gt
+    with _cache_column_reads():
+        for plot in plots:
+            res = plot(res)
+            if not isinstance(res, GT):
+                raise TypeError(
+                    f"Each plot must return a GT object, but {plot!r} returned "
+                    f"{type(res).__name__}."
+                )
+
+    return _drop_overwritten_formats(res, start=n_formats)
+
+
+def _drop_overwritten_formats(gt: GT, start: int) -> GT:
+    """
+    Drop the formatters from position `start` on whose cells are all formatted by a later one.
+
+    Only a later formatter with a default function is counted as formatting a cell, as it applies
+    in every rendering context.
+    """
+    formats = gt._formats
+    kept = []
+    covered: set[tuple[str, int]] = set()
+
+    for fmt in reversed(formats[start:]):
+        cells = set(fmt.cells.resolve())
+        if cells and cells <= covered:
+            continue
+
+        kept.append(fmt)
+        if fmt.func.default is not None:
+            covered |= cells
+
+    if len(kept) == len(formats) - start:
+        return gt
+
+    return gt._replace(_formats=[*formats[:start], *reversed(kept)])
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
 import math
+import numbers
 import warnings
+from array import array
+from functools import partial
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 from great_tables import GT, html
 from great_tables._data_color.base import (
     _html_color,
     _ideal_fgnd_color,
 )
 from great_tables._locations import resolve_cols_c
-from great_tables._tbl_data import SelectExpr, is_na
+from great_tables._tbl_data import DataFrameLike, SelectExpr, is_na
+from narwhals.stable.v1.dependencies import is_pandas_dataframe, is_polars_dataframe
 from scipy.stats import sem, t, tmean
 from svg import (
     SVG,
     Arc,
     Circle,
     ClosePath,
+    HorizontalLineToRel,
     Length,
     Line,
     LineTo,
@@ -24,15 +30,31 @@ from svg import (
     Path,
     Rect,
     Text,
+    VerticalLineToRel,
 )
 
-from gt_extras import gt_duplicate_column
-from gt_extras._utils_color import _get_discrete_colors_from_palette
+from gt_extras._utils_color import (
+    _get_category_colors,
+    _get_discrete_colors_from_palette,
+)
 from gt_extras._utils_column import (
+    _factorize_column,
+    _fmt_with_row_payloads,
     _format_numeric_text,
+    _get_global_range,
+    _get_na_mask,
+    _has_numeric_dtype,
+    _register_within_render_budget,
+    _resolve_single_column,
     _scale_numeric_column,
+    _validate_and_get_list_column,
     _validate_and_get_single_column,
 )
+from gt_extras._utils_svg import _round_number
+from gt_extras.formatting import _duplicate_columns
+from gt_extras.options import _apply_render_budget, _resolve_precision
+from gt_extras.profiling import _profile_function, _profile_stage
+from gt_extras.summary import _make_histogram_svg
 
 __all__ = [
     "gt_plt_bar",
@@ -40,9 +62,11 @@ __all__ = [
     "gt_plt_bar_stack",
     "gt_plt_bullet",
     "gt_plt_conf_int",
+    "gt_plt_dist",
     "gt_plt_donut",
     "gt_plt_dot",
     "gt_plt_dumbbell",
+    "gt_plt_sparkline",
     "gt_plt_winloss",
 ]
 
@@ -51,6 +75,7 @@ __all__ = [
 # TODO: how to handle negative values? Plots can't really have negative length
 
 
+@_profile_function
 def gt_plt_bar(
     gt: GT,
     columns: SelectExpr = None,
@@ -63,6 +88,10 @@ def gt_plt_bar(
     label_color: str = "white",
     domain: list[int] | list[float] | None = None,
     keep_columns: bool = False,
+    resolution: float | None = None,
+    precision: int | None = None,
+    renderer: Literal["svg", "css"] = "svg",
+    engine: Literal["python", "polars"] = "python",
 ) -> GT:
     """
     Create horizontal bar plots in `GT` cells.
@@ -109,6 +138,29 @@ def gt_plt_bar(
         name. See [`gt_duplicate_column()`](https://posit-dev.github.io/gt-extras/reference/gt_duplicate_column)
         for more details.
 
+    resolution
+        An optional step, in pixels, to round the length of the bars to. Cells whose bars round to
+        the same length, and that have the same label, reuse the same SVG, which speeds up
+        rendering large tables. For example, `resolution=0.5` draws bars to the nearest half
+        pixel. The default of `None` draws bars at their exact lengths.
+
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    renderer
+        How to draw the bars. The default of `"svg"` draws each bar as an SVG. `"css"` draws each
+        bar as a `<div>` with a percentage width instead, which is lighter for the browser to lay
+        out in tables with many bars, and displays in email clients that remove SVG.
+
+    engine
+        How to build the bars. The default of `"python"` builds each bar when the table is
+        rendered. `"polars"` builds the HTML of every bar at once, in a single polars query, which
+        is much faster for large tables. It requires a table built from a polars DataFrame and the
+        `"svg"` renderer, and ignores `resolution`. The bars are the same with either engine.
 
     Returns
     -------
@@ -145,6 +197,8 @@ def gt_plt_bar(
     --------
     Each column's bars are scaled independently based on that column's min/max values.
     """
+    precision = _resolve_precision(precision)
+
     if bar_height > height:
         bar_height = height
         warnings.warn(
@@ -163,7 +217,53 @@ def gt_plt_bar(
     if stroke_color is None:
         stroke_color = "transparent"
 
-    def _make_bar(scaled_val: float, original_val: int | float) -> str:
+    _validate_resolution(resolution)
+    _validate_renderer(renderer)
+    _validate_engine(engine, gt._tbl_data)
+    if engine == "polars" and renderer != "svg":
+        raise ValueError("The polars engine only supports the 'svg' renderer.")
+
+    def _make_bar(
+        scaled_val: float,
+        original_val: int | float,
+        show_labels: bool,
+        precision: int | None,
+        bar_cache: dict[tuple[float, str], str],
+    ) -> str:
+        if resolution is None:
+            return _make_exact_bar(scaled_val, original_val, show_labels, precision)
+
+        # Bars of the same quantized length and label share one SVG string
+        scaled_val = _quantize(scaled_val, resolution / width)
+        key = (scaled_val, str(original_val) if show_labels else "")
+        # Another render of the table may clear the cache at any time, so keep a local reference
+        glyph = bar_cache.get(key)
+        if glyph is None:
+            glyph = bar_cache[key] = _make_exact_bar(
+                scaled_val, original_val, show_labels, precision
+            )
+        return glyph
+
+    def _make_exact_bar(
+        scaled_val: float,
+        original_val: int | float,
+        show_labels: bool,
+        precision: int | None,
+    ) -> str:
+        if renderer == "css":
+            return _make_bar_css(
+                scaled_val=scaled_val,
+                original_val=original_val,
+                fill=fill,
+                bar_height=bar_height,
+                height=height,
+                width=width,
+                stroke_color=stroke_color,
+                show_labels=show_labels,
+                label_color=label_color,
+                precision=precision,
+            )
+
         svg = _make_bar_svg(
             scaled_val=scaled_val,
             original_val=original_val,
@@ -174,6 +274,7 @@ def gt_plt_bar(
             stroke_color=stroke_color,
             show_labels=show_labels,
             label_color=label_color,
+            precision=precision,
         )
 
         return f'<div style="display: flex;">{svg.as_str()}</div>'
@@ -182,6 +283,34 @@ def gt_plt_bar(
     columns_resolved = resolve_cols_c(data=gt, expr=columns)
 
     res = gt
+
+    # The plot columns are placed right after their original columns, in a single update
+    if keep_columns:
+        res = _duplicate_columns(
+            res,
+            {column: column + " plot" for column in columns_resolved},
+            after_original=True,
+        )
+
+    if engine == "polars":
+        return _compile_bars_with_polars(
+            res,
+            columns_resolved,
+            keep_columns=keep_columns,
+            domain=domain,
+            fill=fill,
+            bar_height=bar_height,
+            height=height,
+            width=width,
+            stroke_color=stroke_color,
+            show_labels=show_labels,
+            label_color=label_color,
+            precision=precision,
+        )
+
+    # Scale every column up front, so that the bars are only registered once the render budget
+    # has been applied
+    scaled_cols = {}
     for column in columns_resolved:
         # Validate this is a single column and get values
         col_name, col_vals = _validate_and_get_single_column(
@@ -196,30 +325,103 @@ def gt_plt_bar(
             domain,
         )
 
-        # The location of the plot column will be right after the original column
         if keep_columns:
-            res = gt_duplicate_column(
-                res,
-                col_name,
-                after=col_name,
-                append_text=" plot",
-            )
             col_name = col_name + " plot"
-
-        # Apply the scaled value for each row, so the bar is proportional
-        for i, scaled_val in enumerate(scaled_vals):
-            res = res.fmt(
-                lambda original_val, scaled_val=scaled_val: _make_bar(
-                    original_val=original_val,
-                    scaled_val=scaled_val,
+        scaled_cols[col_name] = array("d", scaled_vals)
+
+    def _register(show_labels: bool, precision: int | None) -> GT:
+        bar_cache: dict[tuple[float, str], str] = {}
+
+        registered = res
+        for col_name, scaled_vals in scaled_cols.items():
+            # Look up the scaled value of each row, so the bar is proportional
+            registered = _fmt_with_row_payloads(
+                registered,
+                lambda original_val, scaled_val: _make_bar(
+                    scaled_val, original_val, show_labels, precision, bar_cache
                 ),
-                columns=col_name,
-                rows=[i],
+                column=col_name,
+                payloads={"scaled_val": scaled_vals},
+                render_caches=[bar_cache],
             )
+        return registered
+
+    return _register_within_render_budget(
+        "gt_plt_bar",
+        n_cells=len(columns_resolved) * len(gt._tbl_data),
+        register=_register,
+        show_labels=show_labels,
+        precision=precision,
+    )
+
+
+def _compile_bars_with_polars(
+    gt: GT,
+    columns: list[str],
+    keep_columns: bool,
+    domain: list[int] | list[float] | None,
+    fill: str,
+    bar_height: float,
+    height: float,
+    width: float,
+    stroke_color: str,
+    show_labels: bool,
+    label_color: str,
+    precision: int | None,
+) -> GT:
+    """
+    Add the bars of `gt_plt_bar()` with the polars engine, building their HTML up front.
+    """
+    from gt_extras._polars_glyphs import _compile_bar_html, _scale_polars_column
+
+    data_table = gt._tbl_data
+
+    # Scale every column first, so the settings of the render budget apply to all their bars
+    scaled_cols = {
+        column: _scale_polars_column(data_table[column], domain) for column in columns
+    }
+
+    def _compile(
+        column: str,
+        show_labels: bool,
+        precision: int | None,
+        n_rows: int | None = None,
+    ):
+        return _compile_bar_html(
+            data_table[column][:n_rows],
+            scaled_cols[column][:n_rows],
+            fill=fill,
+            bar_height=bar_height,
+            height=height,
+            width=width,
+            stroke_color=stroke_color,
+            show_labels=show_labels,
+            label_color=label_color,
+            precision=precision,
+        )
+
+    lean_show_labels, lean_precision = _apply_render_budget(
+        "gt_plt_bar",
+        n_cells=len(columns) * len(data_table),
+        sample_glyph=lambda: _compile(columns[0], show_labels, precision, n_rows=1)[0],
+        show_labels=show_labels,
+        precision=precision,
+    )
+
+    res = gt
+    for column in columns:
+        bars = _compile(column, lean_show_labels, lean_precision).to_list()
+        res = _fmt_with_row_payloads(
+            res,
+            lambda _, html: html,
+            column=column + " plot" if keep_columns else column,
+            payloads={"html": bars},
+        )
 
     return res
 
 
+@_profile_function
 def gt_plt_bullet(
     gt: GT,
     data_column: SelectExpr,
@@ -234,6 +436,8 @@ def gt_plt_bullet(
     # show_labels: bool = False, # Maybe include in later version of fn, to label target or data?
     # label_color: str = "white",
     keep_data_column: bool = False,
+    precision: int | None = None,
+    engine: Literal["python", "polars"] = "python",
 ) -> GT:
     """
     Create bullet chart plots in `GT` cells.
@@ -281,6 +485,19 @@ def gt_plt_bullet(
         column name. See [`gt_duplicate_column()`](https://posit-dev.github.io/gt-extras/reference/gt_duplicate_column)
         for more details.
 
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    engine
+        How to build the bullet charts. The default of `"python"` builds each chart when the table
+        is rendered. `"polars"` builds the HTML of every chart at once, in a single polars query,
+        which is much faster for large tables. It requires a table built from a polars DataFrame.
+        The charts are the same with either engine.
+
     Returns
     -------
     GT
@@ -334,6 +551,8 @@ def gt_plt_bullet(
     Both data and target values are scaled to a common domain for consistent visualization.
     The scaling domain is automatically determined as `[0, max(data_values, target_values)]`.
     """
+    precision = _resolve_precision(precision)
+
     if bar_height > height:
         bar_height = height
         warnings.warn(
@@ -352,11 +571,12 @@ def gt_plt_bullet(
     if stroke_color is None:
         stroke_color = "transparent"
 
+    @_profile_stage("svg_building")
     def _make_bullet_plot_svg(
-        scaled_val: float,
         original_val: int | float,
+        scaled_val: float,
         target_val: float,
-        original_target_val: float | int | None,
+        precision: int | None,
     ) -> str:
         svg = _make_bar_svg(
             scaled_val=scaled_val,
@@ -368,6 +588,7 @@ def gt_plt_bullet(
             stroke_color=stroke_color,
             show_labels=False,
             label_color="black",  # placeholder
+            precision=precision,
         )
 
         # this should never be reached, but is needed for the type checker
@@ -377,88 +598,169 @@ def gt_plt_bullet(
                     "Unreachable code: svg.elements should never be None here."
                 )
 
-        if not is_na(res._tbl_data, original_target_val):
+        if not math.isnan(target_val):
             _stroke_width = height / 10
             _x_location = max(_stroke_width, width * target_val - _stroke_width / 2)
 
             svg.elements.append(
                 Line(
-                    x1=Length(_x_location, "px"),
-                    x2=Length(_x_location, "px"),
+                    x1=Length(_round_number(_x_location, precision), "px"),
+                    x2=Length(_round_number(_x_location, precision), "px"),
                     y1=0,
-                    y2=Length(height, "px"),
-                    stroke_width=Length(_stroke_width, "px"),
+                    y2=Length(_round_number(height, precision), "px"),
+                    stroke_width=Length(_round_number(_stroke_width, precision), "px"),
                     stroke=target_color,
                 ),
             )
 
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
+    _validate_engine(engine, gt._tbl_data)
+
     res = gt
 
-    data_col_name, data_col_vals = _validate_and_get_single_column(
-        gt,
-        data_column,
-    )
-    target_col_name, target_col_vals = _validate_and_get_single_column(
-        gt,
-        target_column,
-    )
+    # The polars engine reads the columns natively, so only their names are needed here
+    if engine == "polars":
+        data_col_name = _resolve_single_column(gt, data_column)
+        target_col_name = _resolve_single_column(gt, target_column)
+    else:
+        data_col_name, data_col_vals = _validate_and_get_single_column(
+            gt,
+            data_column,
+        )
+        target_col_name, target_col_vals = _validate_and_get_single_column(
+            gt,
+            target_column,
+        )
 
-    # Only consider numeric values for scaling domain
+    # Scale the data and targets to a shared domain, from 0 to the largest of either column.
+    # Non-numeric columns are left to `_scale_numeric_column()` to raise on.
     domain = None
-    numeric_data_vals = [v for v in data_col_vals if isinstance(v, (int, float))]
-    numeric_target_vals = [v for v in target_col_vals if isinstance(v, (int, float))]
-    if numeric_data_vals or numeric_target_vals:
-        domain = [0, max([*numeric_data_vals, *numeric_target_vals])]
+    if _has_numeric_dtype(gt._tbl_data, data_col_name) and _has_numeric_dtype(
+        gt._tbl_data, target_col_name
+    ):
+        _, data_max = _get_global_range(gt._tbl_data, [data_col_name, target_col_name])
+        if not math.isnan(data_max):
+            domain = [0, data_max]
+
+    if engine == "polars":
+        bullets = _compile_bullets_with_polars(
+            gt._tbl_data,
+            data_col_name,
+            target_col_name,
+            domain=domain,
+            fill=fill,
+            bar_height=bar_height,
+            height=height,
+            width=width,
+            target_color=target_color,
+            stroke_color=stroke_color,
+            precision=precision,
+        )
+    else:
+        scaled_data_vals = _scale_numeric_column(
+            res._tbl_data,
+            data_col_name,
+            data_col_vals,
+            domain,
+        )
 
-    scaled_data_vals = _scale_numeric_column(
-        res._tbl_data,
-        data_col_name,
-        data_col_vals,
-        domain,
-    )
+        scaled_target_vals = _scale_numeric_column(
+            res._tbl_data,
+            target_col_name,
+            target_col_vals,
+            domain,
+        )
 
-    scaled_target_vals = _scale_numeric_column(
-        res._tbl_data,
-        target_col_name,
-        target_col_vals,
-        domain,
+    if keep_data_column:
+        res = _duplicate_columns(
+            res, {data_col_name: data_col_name + " plot"}, after_original=True
+        )
+        data_col_name = data_col_name + " plot"
+
+    if engine == "polars":
+        res = _fmt_with_row_payloads(
+            res,
+            lambda _, html: html,
+            column=data_col_name,
+            payloads={"html": bullets},
+        )
+        return res.cols_hide(target_col_name)
+
+    # Missing targets are kept as NaN, so no target line is drawn for them
+    target_vals = _to_float_array(
+        scaled_target_vals, _get_na_mask(res._tbl_data, target_col_name)
     )
 
-    if keep_data_column:
-        res = gt_duplicate_column(
+    payloads = {
+        "scaled_val": array("d", scaled_data_vals),
+        "target_val": target_vals,
+    }
+
+    def _register(precision: int | None) -> GT:
+        # Look up the scaled values of each row, so the bar is proportional
+        return _fmt_with_row_payloads(
             res,
-            data_col_name,
-            after=data_col_name,
-            append_text=" plot",
+            partial(_make_bullet_plot_svg, precision=precision),
+            column=data_col_name,
+            payloads=payloads,
         )
-        data_col_name = data_col_name + " plot"
 
-    # Apply the scaled value for each row, so the bar is proportional
-    for i, scaled_val in enumerate(scaled_data_vals):
-        target_val = scaled_target_vals[i]
-        original_target_val = target_col_vals[i]
+    res = _register_within_render_budget(
+        "gt_plt_bullet",
+        n_cells=len(gt._tbl_data),
+        register=_register,
+        precision=precision,
+    )
 
-        res = res.fmt(
-            lambda original_val,
-            scaled_val=scaled_val,
-            target_val=target_val,
-            original_target_val=original_target_val: _make_bullet_plot_svg(
-                original_val=original_val,
-                scaled_val=scaled_val,
-                target_val=target_val,
-                original_target_val=original_target_val,
-            ),
-            columns=data_col_name,
-            rows=[i],
+    return res.cols_hide(target_col_name)
+
+
+def _compile_bullets_with_polars(
+    data_table,
+    data_col_name: str,
+    target_col_name: str,
+    domain: list[float] | None,
+    fill: str,
+    bar_height: float,
+    height: float,
+    width: float,
+    target_color: str,
+    stroke_color: str,
+    precision: int | None,
+) -> list[str]:
+    """
+    Build the HTML of every bullet chart of `gt_plt_bullet()` with the polars engine.
+    """
+    from gt_extras._polars_glyphs import _compile_bullet_html, _scale_polars_column
+
+    scaled_data = _scale_polars_column(data_table[data_col_name], domain)
+    scaled_target = _scale_polars_column(data_table[target_col_name], domain)
+
+    def _compile(precision: int | None, n_rows: int | None = None):
+        return _compile_bullet_html(
+            scaled_data[:n_rows],
+            scaled_target[:n_rows],
+            fill=fill,
+            bar_height=bar_height,
+            height=height,
+            width=width,
+            target_color=target_color,
+            stroke_color=stroke_color,
+            precision=precision,
         )
 
-    res = res.cols_hide(target_col_name)
+    (lean_precision,) = _apply_render_budget(
+        "gt_plt_bullet",
+        n_cells=len(data_table),
+        sample_glyph=lambda: _compile(precision, n_rows=1)[0],
+        precision=precision,
+    )
 
-    return res
+    return _compile(lean_precision).to_list()
 
 
+@_profile_function
 def gt_plt_dot(
     gt: GT,
     category_col: SelectExpr,
@@ -468,6 +770,7 @@ def gt_plt_dot(
     font_size: int = 16,
     domain: list[int] | list[float] | None = None,
     palette: list[str] | str | None = None,
+    precision: int | None = None,
 ) -> GT:
     """
     Create dot plots with thin horizontal bars in `GT` cells.
@@ -509,6 +812,13 @@ def gt_plt_dot(
         just supply the name (see [`GT.data_color()`](https://posit-dev.github.io/great-tables/reference/GT.data_color) for additional reference).
         If `None`, then a default palette will be used.
 
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
     Returns
     -------
     GT
@@ -536,9 +846,12 @@ def gt_plt_dot(
     If your category label text is cut off or does not fit, you likely need to increase the `width`
     parameter to allow more space for the text and plot.
     """
+    precision = _resolve_precision(precision)
+
     # Get the underlying Dataframe
     data_table = gt._tbl_data
 
+    @_profile_stage("svg_building")
     def _make_dot_and_bar_svg(
         bar_val: float,
         fill: str,
@@ -546,9 +859,10 @@ def gt_plt_dot(
         svg_width: float,
         svg_height: float,
         font_size: float,
+        precision: int | None,
     ) -> str:
-        if is_na(data_table, bar_val) or is_na(data_table, dot_category_label):
-            return "<div></div>"
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
 
         # Layout parameters
         dot_radius = font_size / 2.75
@@ -568,33 +882,33 @@ def gt_plt_dot(
         elements = [
             # Dot
             Circle(
-                cx=dot_x,
-                cy=dot_y,
-                r=dot_radius,
+                cx=_num(dot_x),
+                cy=_num(dot_y),
+                r=_num(dot_radius),
                 fill=fill,
             ),
             # Category label text
             Text(
                 text=dot_category_label,
-                x=text_x,
-                y=text_y,
+                x=_num(text_x),
+                y=_num(text_y),
                 fill="black",
-                font_size=font_size,
+                font_size=_num(font_size),
                 dominant_baseline="central",
                 text_anchor="start",
             ),
             # Bar
             Rect(
-                x=bar_start_x,
-                y=bar_y,
-                width=bar_width,
-                height=bar_height,
+                x=_num(bar_start_x),
+                y=_num(bar_y),
+                width=_num(bar_width),
+                height=_num(bar_height),
                 fill=fill,
                 rx=2,
             ),
         ]
 
-        svg = SVG(width=svg_width, height=svg_height, elements=elements)
+        svg = SVG(width=_num(svg_width), height=_num(svg_height), elements=elements)
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
     # Validate and get data column
@@ -612,37 +926,51 @@ def gt_plt_dot(
     )
 
     # Validate and get category column
-    _, category_col_vals = _validate_and_get_single_column(
+    category_col_name, _ = _validate_and_get_single_column(
         gt,
         category_col,
     )
 
-    color_vals = _get_discrete_colors_from_palette(
-        palette=palette, data=category_col_vals, data_table=data_table
-    )
+    # Color each distinct category once, and look up each row's color by its category code
+    category_codes, categories = _factorize_column(data_table, category_col_name)
+    colors = _get_category_colors(palette=palette, n_categories=len(categories))
 
-    # Apply gt.fmt() to each row individually, so we can access the data_value for that row
-    res = gt
-    for i in range(len(data_table)):
-        data_val = scaled_data_vals[i]
-        color_val = color_vals[i]
+    def _make_dot(
+        dot_category_label: str, bar_val: float, code: int, precision: int | None
+    ) -> str:
+        if code < 0:
+            return "<div></div>"
 
-        res = res.fmt(
-            lambda x, data=data_val, fill=color_val: _make_dot_and_bar_svg(
-                dot_category_label=x,
-                fill=fill,
-                bar_val=data,
-                svg_height=height,
-                svg_width=width,
-                font_size=font_size,
-            ),
-            columns=category_col,
-            rows=[i],
+        return _make_dot_and_bar_svg(
+            dot_category_label=dot_category_label,
+            fill=colors[code],
+            bar_val=bar_val,
+            svg_height=height,
+            svg_width=width,
+            font_size=font_size,
+            precision=precision,
         )
 
-    return res
+    def _register(precision: int | None) -> GT:
+        return _fmt_with_row_payloads(
+            gt,
+            partial(_make_dot, precision=precision),
+            column=category_col_name,
+            payloads={
+                "bar_val": scaled_data_vals,
+                "code": category_codes,
+            },
+        )
+
+    return _register_within_render_budget(
+        "gt_plt_dot",
+        n_cells=len(data_table),
+        register=_register,
+        precision=precision,
+    )
 
 
+@_profile_function
 def gt_plt_conf_int(
     gt: GT,
     column: SelectExpr,
@@ -657,6 +985,7 @@ def gt_plt_conf_int(
     font_size: int = 10,
     num_decimals: int = 1,
     # TODO: "none" vs None in text_size
+    precision: int | None = None,
 ) -> GT:
     """
     Create confidence interval plots in `GT` cells.
@@ -713,6 +1042,13 @@ def gt_plt_conf_int(
         The number of decimals to display when rounding the value of the
         confidence interval labels.
 
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
     Returns
     -------
     GT
@@ -780,7 +1116,9 @@ def gt_plt_conf_int(
     ----
     All confidence intervals are scaled to a common range for visual alignment.
     """
+    precision = _resolve_precision(precision)
 
+    @_profile_stage("svg_building")
     def _make_conf_int_svg(
         mean: float,
         c1: float,
@@ -795,12 +1133,12 @@ def gt_plt_conf_int(
         dot_color: str,
         text_color: str,
         num_decimals: int,
+        precision: int | None,
     ) -> str:
-        if (
-            is_na(gt._tbl_data, mean)
-            or is_na(gt._tbl_data, c1)
-            or is_na(gt._tbl_data, c2)
-        ):
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        if math.isnan(mean) or math.isnan(c1) or math.isnan(c2):
             return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
 
         span = max_val - min_val
@@ -828,45 +1166,45 @@ def gt_plt_conf_int(
         elements = [
             # Confidence interval bar
             Rect(
-                x=c1_pos,
-                y=bar_y,
-                width=c2_pos - c1_pos,
-                height=bar_height,
+                x=_num(c1_pos),
+                y=_num(bar_y),
+                width=_num(c2_pos - c1_pos),
+                height=_num(bar_height),
                 fill=line_color,
                 rx=2,
             ),
             # Mean dot
             Circle(
-                cx=mean_pos,
-                cy=dot_y + dot_size / 2,
-                r=dot_size / 2,
+                cx=_num(mean_pos),
+                cy=_num(dot_y + dot_size / 2),
+                r=_num(dot_size / 2),
                 fill=dot_color,
                 stroke=dot_border_color,
-                stroke_width=dot_border,
+                stroke_width=_num(dot_border),
             ),
             # Lower bound label
             Text(
                 text=c1_text,
-                x=c1_pos,
-                y=label_y,
+                x=_num(c1_pos),
+                y=_num(label_y),
                 fill=text_color,
-                font_size=font_size,
+                font_size=_num(font_size),
                 text_anchor="start",
                 dominant_baseline="central",
             ),
             # Upper bound label
             Text(
                 text=c2_text,
-                x=c2_pos,
-                y=label_y,
+                x=_num(c2_pos),
+                y=_num(label_y),
                 fill=text_color,
-                font_size=font_size,
+                font_size=_num(font_size),
                 text_anchor="end",
                 dominant_baseline="central",
             ),
         ]
 
-        svg = SVG(width=width, height=height, elements=elements)
+        svg = SVG(width=_num(width), height=_num(height), elements=elements)
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
     data_col_name, data_vals = _validate_and_get_single_column(gt, column)
@@ -895,6 +1233,19 @@ def gt_plt_conf_int(
         stats = list(map(_compute_mean_and_conf_int, data_vals))
         means, c1_vals, c2_vals = zip(*stats) if stats else ([], [], [])
 
+        # Rows without data have no statistics, and the mean is missing only for those rows
+        is_missing = [mean is None for mean in means]
+        mean_vals = _to_float_array(means, is_missing)
+        c1_vals = _to_float_array(c1_vals, is_missing)
+        c2_vals = _to_float_array(c2_vals, is_missing)
+
+        # Compute a global range to ensure conf int bars align, skipping missing values
+        stacked = np.array([mean_vals, c1_vals, c2_vals])
+        data_min = float(np.nanmin(stacked, initial=np.inf))
+        data_max = float(np.nanmax(stacked, initial=-np.inf))
+        padding = (data_max - data_min) * 0.1
+        global_min, global_max = data_min - padding, data_max + padding
+
     # we were given the ci already computed
     else:
         ci_columns_resolved = resolve_cols_c(data=gt, expr=ci_columns)
@@ -903,41 +1254,39 @@ def gt_plt_conf_int(
                 f"Expected 2 ci_columns, instead received {len(ci_columns_resolved)}."
             )
 
-        _, c1_vals = _validate_and_get_single_column(
+        c1_name, c1_vals = _validate_and_get_single_column(
             gt,
             ci_columns_resolved[0],
         )
-        _, c2_vals = _validate_and_get_single_column(
+        c2_name, c2_vals = _validate_and_get_single_column(
             gt,
             ci_columns_resolved[1],
         )
-        means = data_vals
 
-        if any(val is not None and not isinstance(val, (int, float)) for val in means):
+        if not _has_numeric_dtype(gt._tbl_data, data_col_name) and any(
+            val is not None and not isinstance(val, (int, float)) for val in data_vals
+        ):
             raise ValueError(
                 f"Expected all entries in {data_col_name} to be numeric or None,"
                 "since ci_columns were given."
             )
 
-    # Compute a global range to ensure conf int bars align
-    all_values = [val for val in [*means, *c1_vals, *c2_vals] if val is not None]
-    data_min = min(all_values)
-    data_max = max(all_values)
-    data_range = data_max - data_min
-
-    # Add 10% padding on each side
-    padding = data_range * 0.1
-    global_min = data_min - padding
-    global_max = data_max + padding
+        mean_vals = _to_float_array(
+            data_vals, _get_na_mask(gt._tbl_data, data_col_name)
+        )
+        c1_vals = _to_float_array(c1_vals, _get_na_mask(gt._tbl_data, c1_name))
+        c2_vals = _to_float_array(c2_vals, _get_na_mask(gt._tbl_data, c2_name))
 
-    res = gt
-    for i in range(len(gt._tbl_data)):
-        c1 = c1_vals[i]
-        c2 = c2_vals[i]
-        mean = means[i]
+        # Compute a global range to ensure conf int bars align, with 10% padding on each side
+        global_min, global_max = _get_global_range(
+            gt._tbl_data, [data_col_name, c1_name, c2_name], padding=0.1
+        )
 
-        res = res.fmt(
-            lambda _, c1=c1, c2=c2, mean=mean: _make_conf_int_svg(
+    # Missing values are kept as NaN, which leaves the cell empty
+    def _register(precision: int | None) -> GT:
+        return _fmt_with_row_payloads(
+            gt,
+            lambda _, mean, c1, c2: _make_conf_int_svg(
                 mean=mean,
                 c1=c1,
                 c2=c2,
@@ -951,14 +1300,25 @@ def gt_plt_conf_int(
                 dot_color=dot_color,
                 text_color=text_color,
                 num_decimals=num_decimals,
+                precision=precision,
             ),
-            columns=data_col_name,
-            rows=[i],
+            column=data_col_name,
+            payloads={
+                "mean": mean_vals,
+                "c1": c1_vals,
+                "c2": c2_vals,
+            },
         )
 
-    return res
+    return _register_within_render_budget(
+        "gt_plt_conf_int",
+        n_cells=len(gt._tbl_data),
+        register=_register,
+        precision=precision,
+    )
 
 
+@_profile_function
 def gt_plt_dumbbell(
     gt: GT,
     col1: SelectExpr,  # exactly 1 col
@@ -972,6 +1332,8 @@ def gt_plt_dumbbell(
     dot_border_color="white",
     font_size: int = 10,
     num_decimals: int = 1,
+    precision: int | None = None,
+    engine: Literal["python", "polars"] = "python",
 ) -> GT:
     """
     Create dumbbell plots in `GT` cells.
@@ -1021,6 +1383,19 @@ def gt_plt_dumbbell(
     num_decimals
         The number of decimal places to display in the value labels.
 
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    engine
+        How to build the dumbbells. The default of `"python"` builds each dumbbell when the table
+        is rendered. `"polars"` builds the HTML of every dumbbell at once, in a single polars
+        query, which is much faster for large tables. It requires a table built from a polars
+        DataFrame. The dumbbells are the same with either engine.
+
     Returns
     -------
     GT
@@ -1071,7 +1446,9 @@ def gt_plt_dumbbell(
     All dumbbells are scaled to a common range for visual alignment across rows.
     The `col2` column is automatically hidden from the final table display.
     """
+    precision = _resolve_precision(precision)
 
+    @_profile_stage("svg_building")
     def _make_dumbbell_svg(
         value_1: float,
         value_2: float,
@@ -1085,8 +1462,12 @@ def gt_plt_dumbbell(
         min_val: float,
         font_size: int,
         num_decimals: int,
+        precision: int | None,
     ) -> str:
-        if is_na(gt._tbl_data, value_1) or is_na(gt._tbl_data, value_2):
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        if math.isnan(value_1) or math.isnan(value_2):
             return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
 
         # Normalize positions based on global min/max, then scale to width
@@ -1116,38 +1497,38 @@ def gt_plt_dumbbell(
         elements = [
             # Connecting bar
             Rect(
-                x=bar_left,
-                y=bar_y,
-                width=bar_width,
-                height=bar_height,
+                x=_num(bar_left),
+                y=_num(bar_y),
+                width=_num(bar_width),
+                height=_num(bar_height),
                 fill=bar_color,
                 rx=2,
             ),
             # Value 1 dot
             Circle(
-                cx=pos_1,
-                cy=dot_y,
-                r=dot_radius,
+                cx=_num(pos_1),
+                cy=_num(dot_y),
+                r=_num(dot_radius),
                 fill=value_1_color,
                 stroke=dot_border_color,
-                stroke_width=dot_border,
+                stroke_width=_num(dot_border),
             ),
             # Value 2 dot
             Circle(
-                cx=pos_2,
-                cy=dot_y,
-                r=dot_radius,
+                cx=_num(pos_2),
+                cy=_num(dot_y),
+                r=_num(dot_radius),
                 fill=value_2_color,
                 stroke=dot_border_color,
-                stroke_width=dot_border,
+                stroke_width=_num(dot_border),
             ),
             # Value 1 label
             Text(
                 text=value_1_text,
-                x=pos_1,
-                y=label_y,
+                x=_num(pos_1),
+                y=_num(label_y),
                 fill=value_1_color,
-                font_size=font_size,
+                font_size=_num(font_size),
                 font_weight="bold",
                 text_anchor="middle",
                 dominant_baseline="lower",
@@ -1155,19 +1536,40 @@ def gt_plt_dumbbell(
             # Value 2 label
             Text(
                 text=value_2_text,
-                x=pos_2,
-                y=label_y,
+                x=_num(pos_2),
+                y=_num(label_y),
                 fill=value_2_color,
-                font_size=font_size,
+                font_size=_num(font_size),
                 font_weight="bold",
                 text_anchor="middle",
                 dominant_baseline="lower",
             ),
         ]
 
-        svg = SVG(width=width, height=height, elements=elements)
+        svg = SVG(width=_num(width), height=_num(height), elements=elements)
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
+    _validate_engine(engine, gt._tbl_data)
+
+    if engine == "polars":
+        col1_name = _resolve_single_column(gt, col1)
+        col2_name = _resolve_single_column(gt, col2)
+        return _compile_dumbbells_with_polars(
+            gt,
+            col1_name,
+            col2_name,
+            label=label,
+            width=width,
+            height=height,
+            col1_color=col1_color,
+            col2_color=col2_color,
+            bar_color=bar_color,
+            dot_border_color=dot_border_color,
+            font_size=font_size,
+            num_decimals=num_decimals,
+            precision=precision,
+        )
+
     col1_name, col1_vals = _validate_and_get_single_column(
         gt,
         col1,
@@ -1177,28 +1579,25 @@ def gt_plt_dumbbell(
         col2,
     )
 
-    # Check for bad input
-    all_values = [val for val in [*col1_vals, *col2_vals] if val is not None]
-    if any(val is not None and not isinstance(val, (int, float)) for val in all_values):
-        raise ValueError("Expected all entries to be numeric or None.")
-
-    # Compute the global bounds for the column.
-    data_min = min(all_values)
-    data_max = max(all_values)
-    data_range = data_max - data_min
-
-    padding = data_range * 0.1  # Add 10% padding on each side
-    global_min = data_min - padding
-    global_max = data_max + padding
+    # Check for bad input, looking at the values only of columns without a numeric dtype
+    for col_name, col_vals in ((col1_name, col1_vals), (col2_name, col2_vals)):
+        if not _has_numeric_dtype(gt._tbl_data, col_name) and any(
+            val is not None and not isinstance(val, (int, float)) for val in col_vals
+        ):
+            raise ValueError("Expected all entries to be numeric or None.")
 
-    res = gt
+    # Compute the global bounds for the columns, with 10% padding on each side
+    global_min, global_max = _get_global_range(
+        gt._tbl_data, [col1_name, col2_name], padding=0.1
+    )
 
-    for i in range(len(gt._tbl_data)):
-        col1_value = col1_vals[i]
-        col2_value = col2_vals[i]
+    value_1_vals = _to_float_array(col1_vals, _get_na_mask(gt._tbl_data, col1_name))
+    value_2_vals = _to_float_array(col2_vals, _get_na_mask(gt._tbl_data, col2_name))
 
-        res = res.fmt(
-            lambda _, value_1=col1_value, value_2=col2_value: _make_dumbbell_svg(
+    def _register(precision: int | None) -> GT:
+        return _fmt_with_row_payloads(
+            gt,
+            lambda _, value_1, value_2: _make_dumbbell_svg(
                 value_1=value_1,
                 value_2=value_2,
                 width=width,
@@ -1211,11 +1610,90 @@ def gt_plt_dumbbell(
                 min_val=global_min,
                 font_size=font_size,
                 num_decimals=num_decimals,
+                precision=precision,
             ),
-            columns=col1_name,
-            rows=[i],
+            column=col1_name,
+            payloads={"value_1": value_1_vals, "value_2": value_2_vals},
+        )
+
+    res = _register_within_render_budget(
+        "gt_plt_dumbbell",
+        n_cells=len(gt._tbl_data),
+        register=_register,
+        precision=precision,
+    )
+
+    res = res.cols_hide(col2_name)
+    if label is not None:
+        res = res.cols_label({col1_name: label})
+
+    return res
+
+
+def _compile_dumbbells_with_polars(
+    gt: GT,
+    col1_name: str,
+    col2_name: str,
+    label: str | None,
+    width: float,
+    height: float,
+    col1_color: str,
+    col2_color: str,
+    bar_color: str,
+    dot_border_color: str,
+    font_size: int,
+    num_decimals: int,
+    precision: int | None,
+) -> GT:
+    """
+    Add the dumbbells of `gt_plt_dumbbell()` with the polars engine, building their HTML up front.
+    """
+    import polars as pl
+
+    from gt_extras._polars_glyphs import _compile_dumbbell_html
+
+    data_table = gt._tbl_data
+    for col_name in (col1_name, col2_name):
+        dtype = data_table[col_name].dtype
+        if not (dtype.is_numeric() or dtype == pl.Null):
+            raise ValueError("Expected all entries to be numeric or None.")
+
+    # Compute the global bounds for the columns, with 10% padding on each side
+    global_min, global_max = _get_global_range(
+        data_table, [col1_name, col2_name], padding=0.1
+    )
+
+    def _compile(precision: int | None, n_rows: int | None = None):
+        return _compile_dumbbell_html(
+            data_table[col1_name][:n_rows],
+            data_table[col2_name][:n_rows],
+            width=width,
+            height=height,
+            value_1_color=col1_color,
+            value_2_color=col2_color,
+            bar_color=bar_color,
+            dot_border_color=dot_border_color,
+            max_val=global_max,
+            min_val=global_min,
+            font_size=font_size,
+            num_decimals=num_decimals,
+            precision=precision,
         )
 
+    (lean_precision,) = _apply_render_budget(
+        "gt_plt_dumbbell",
+        n_cells=len(data_table),
+        sample_glyph=lambda: _compile(precision, n_rows=1)[0],
+        precision=precision,
+    )
+
+    res = _fmt_with_row_payloads(
+        gt,
+        lambda _, html: html,
+        column=col1_name,
+        payloads={"html": _compile(lean_precision).to_list()},
+    )
+
     res = res.cols_hide(col2_name)
     if label is not None:
         res = res.cols_label({col1_name: label})
@@ -1223,6 +1701,7 @@ def gt_plt_dumbbell(
     return res
 
 
+@_profile_function
 def gt_plt_donut(
     gt: GT,
     columns: SelectExpr = None,
@@ -1234,6 +1713,8 @@ def gt_plt_donut(
     label_color: str = "black",
     domain: list[int] | list[float] | None = None,
     keep_columns: bool = False,
+    resolution: float | None = None,
+    precision: int | None = None,
 ) -> GT:
     """
     Create donut charts in `GT` cells.
@@ -1281,6 +1762,19 @@ def gt_plt_donut(
         name. See [`gt_duplicate_column()`](https://posit-dev.github.io/gt-extras/reference/gt_duplicate_column)
         for more details.
 
+    resolution
+        An optional step, in pixels along the donut's circumference, to round the length of the
+        segments to. Cells whose segments round to the same length, and that have the same label,
+        reuse the same SVG, which speeds up rendering large tables. The default of `None` draws
+        segments at their exact lengths.
+
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
     Returns
     -------
     GT
@@ -1319,23 +1813,75 @@ def gt_plt_donut(
     Each column's donut charts are scaled independently based on that column's min/max values.
     A value equal to the column maximum will display as a full circle (360 degrees).
     """
+    precision = _resolve_precision(precision)
 
     # Allow the user to hide the stroke
     if stroke_color is None:
         stroke_color = "transparent"
         stroke_width = 0
 
+    _validate_resolution(resolution)
+
+    def _make_pie(
+        scaled_val: float,
+        original_val: int | float,
+        is_missing: bool,
+        show_labels: bool,
+        precision: int | None,
+        pie_cache: dict[tuple[float, str, bool], str],
+    ) -> str:
+        if resolution is None:
+            return _make_exact_pie(
+                scaled_val, original_val, is_missing, show_labels, precision
+            )
+
+        # Segments of the same quantized length and label share one SVG string
+        scaled_val = _quantize(scaled_val, resolution / (math.pi * size))
+        key = (scaled_val, str(original_val) if show_labels else "", is_missing)
+        glyph = pie_cache.get(key)
+        if glyph is None:
+            glyph = pie_cache[key] = _make_exact_pie(
+                scaled_val, original_val, is_missing, show_labels, precision
+            )
+        return glyph
+
+    def _make_exact_pie(
+        scaled_val: float,
+        original_val: int | float,
+        is_missing: bool,
+        show_labels: bool,
+        precision: int | None,
+    ) -> str:
+        return _make_pie_svg(
+            original_val=original_val,
+            scaled_val=scaled_val,
+            is_missing=is_missing,
+            fill=fill,
+            size=size,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            show_labels=show_labels,
+            label_color=label_color,
+            precision=precision,
+        )
+
+    @_profile_stage("svg_building")
     def _make_pie_svg(
         scaled_val: float,
         original_val: int | float,
+        is_missing: bool,
         fill: str,
         size: float,
         stroke_color: str,
         stroke_width: float,
         show_labels: bool,
         label_color: str,
+        precision: int | None,
     ) -> str:
-        if is_na(gt._tbl_data, original_val):
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        if is_missing:
             return f'<div style="display: flex;"><div style="width:{size}px; height:{size}px;"></div></div>'
 
         elements = []
@@ -1370,12 +1916,12 @@ def gt_plt_donut(
 
             # Draw empty donut with just stroke/outline
             outer_circle = Circle(
-                cx=center_x,
-                cy=center_y,
-                r=radius - stroke_width / 2,
+                cx=_num(center_x),
+                cy=_num(center_y),
+                r=_num(radius - stroke_width / 2),
                 fill="transparent",
                 stroke=stroke_color,
-                stroke_width=stroke_width,
+                stroke_width=_num(stroke_width),
                 stroke_dasharray=3,
             )
             elements.append(outer_circle)
@@ -1386,47 +1932,49 @@ def gt_plt_donut(
                 # Create full donut using two semicircular arcs with evenodd fill rule
                 path_commands = [
                     # Outer circle - first semicircle (top to bottom)
-                    MoveTo(center_x, stroke_width / 2),  # Top
+                    MoveTo(_num(center_x), _num(stroke_width / 2)),  # Top
                     Arc(
-                        radius - stroke_width / 2,
-                        radius - stroke_width / 2,
+                        _num(radius - stroke_width / 2),
+                        _num(radius - stroke_width / 2),
                         0,
                         False,  # small arc
                         True,  # clockwise
-                        center_x,
-                        center_y + (radius - stroke_width / 2),  # Bottom
+                        _num(center_x),
+                        _num(center_y + (radius - stroke_width / 2)),  # Bottom
                     ),
                     # Outer circle - second semicircle (bottom to top)
                     Arc(
-                        radius - stroke_width / 2,
-                        radius - stroke_width / 2,
+                        _num(radius - stroke_width / 2),
+                        _num(radius - stroke_width / 2),
                         0,
                         False,  # small arc
                         True,  # clockwise
-                        center_x,
-                        stroke_width / 2,  # Back to top
+                        _num(center_x),
+                        _num(stroke_width / 2),  # Back to top
                     ),
                     ClosePath(),
                     # Inner circle - first semicircle (top to bottom, counter-clockwise)
-                    MoveTo(center_x, center_y - inner_radius),  # Top of inner circle
+                    MoveTo(
+                        _num(center_x), _num(center_y - inner_radius)
+                    ),  # Top of inner circle
                     Arc(
-                        inner_radius,
-                        inner_radius,
+                        _num(inner_radius),
+                        _num(inner_radius),
                         0,
                         False,  # small arc
                         False,  # counter-clockwise
-                        center_x,
-                        center_y + inner_radius,  # Bottom of inner circle
+                        _num(center_x),
+                        _num(center_y + inner_radius),  # Bottom of inner circle
                     ),
                     # Inner circle - second semicircle (bottom to top, counter-clockwise)
                     Arc(
-                        inner_radius,
-                        inner_radius,
+                        _num(inner_radius),
+                        _num(inner_radius),
                         0,
                         False,  # small arc
                         False,  # counter-clockwise
-                        center_x,
-                        center_y - inner_radius,  # Back to top
+                        _num(center_x),
+                        _num(center_y - inner_radius),  # Back to top
                     ),
                     ClosePath(),
                 ]
@@ -1434,25 +1982,27 @@ def gt_plt_donut(
             else:
                 # Partial donut using path: outer arc -> line to inner end -> inner arc (reverse) -> close
                 path_commands = [
-                    MoveTo(outer_start_x, outer_start_y),  # Start at outer edge
+                    MoveTo(
+                        _num(outer_start_x), _num(outer_start_y)
+                    ),  # Start at outer edge
                     Arc(
-                        radius - stroke_width / 2,
-                        radius - stroke_width / 2,
+                        _num(radius - stroke_width / 2),
+                        _num(radius - stroke_width / 2),
                         0,
                         large_arc,
                         True,
-                        outer_end_x,
-                        outer_end_y,
+                        _num(outer_end_x),
+                        _num(outer_end_y),
                     ),  # Outer arc
-                    LineTo(inner_end_x, inner_end_y),  # Line to inner edge
+                    LineTo(_num(inner_end_x), _num(inner_end_y)),  # Line to inner edge
                     Arc(
-                        inner_radius,
-                        inner_radius,
+                        _num(inner_radius),
+                        _num(inner_radius),
                         0,
                         large_arc,
                         False,  # Reverse direction for inner arc
-                        inner_start_x,
-                        inner_start_y,
+                        _num(inner_start_x),
+                        _num(inner_start_y),
                     ),  # Inner arc (reverse)
                     ClosePath(),
                 ]
@@ -1461,12 +2011,12 @@ def gt_plt_donut(
                 d=path_commands,
                 fill=fill,
                 stroke=stroke_color,
-                stroke_width=stroke_width,
+                stroke_width=_num(stroke_width),
             )
             elements.append(path)
 
         # Add label if requested
-        if show_labels and not is_na(gt._tbl_data, original_val):
+        if show_labels:
             label_text = str(original_val)
 
             # Position label in the center of the donut
@@ -1476,23 +2026,37 @@ def gt_plt_donut(
 
             text = Text(
                 text=label_text,
-                x=label_x,
-                y=label_y,
+                x=_num(label_x),
+                y=_num(label_y),
                 fill=label_color,
-                font_size=font_size,
+                font_size=_num(font_size),
                 text_anchor="middle",
                 dominant_baseline="central",
                 font_weight="bold",
             )
             elements.append(text)
 
-        svg = SVG(width=size, height=size, elements=elements, style=svg_style)
+        svg = SVG(
+            width=_num(size), height=_num(size), elements=elements, style=svg_style
+        )
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
     # Get names of columns
     columns_resolved = resolve_cols_c(data=gt, expr=columns)
 
     res = gt
+
+    # The plot columns are placed right after their original columns, in a single update
+    if keep_columns:
+        res = _duplicate_columns(
+            res,
+            {column: column + " plot" for column in columns_resolved},
+            after_original=True,
+        )
+
+    # Scale every column up front, so that the donuts are only registered once the render budget
+    # has been applied
+    scaled_cols = {}
     for column in columns_resolved:
         # Validate this is a single column and get values
         col_name, col_vals = _validate_and_get_single_column(
@@ -1507,36 +2071,43 @@ def gt_plt_donut(
             domain,
         )
 
-        # The location of the plot column will be right after the original column
+        is_missing = _get_na_mask(gt._tbl_data, column)
         if keep_columns:
-            res = gt_duplicate_column(
-                res,
-                col_name,
-                after=col_name,
-                append_text=" plot",
-            )
             col_name = col_name + " plot"
-
-        # Apply the scaled value for each row, so the donut is proportional
-        for i, scaled_val in enumerate(scaled_vals):
-            res = res.fmt(
-                lambda original_val, scaled_val=scaled_val: _make_pie_svg(
-                    original_val=original_val,
-                    scaled_val=scaled_val,
-                    fill=fill,
-                    size=size,
-                    stroke_color=stroke_color,
-                    stroke_width=stroke_width,
-                    show_labels=show_labels,
-                    label_color=label_color,
+        scaled_cols[col_name] = (array("d", scaled_vals), is_missing)
+
+    def _register(show_labels: bool, precision: int | None) -> GT:
+        pie_cache: dict[tuple[float, str, bool], str] = {}
+
+        registered = res
+        for col_name, (scaled_vals, is_missing) in scaled_cols.items():
+            # Look up the scaled value of each row, so the donut is proportional
+            registered = _fmt_with_row_payloads(
+                registered,
+                lambda original_val, scaled_val, is_missing: _make_pie(
+                    scaled_val,
+                    original_val,
+                    is_missing,
+                    show_labels,
+                    precision,
+                    pie_cache,
                 ),
-                columns=col_name,
-                rows=[i],
+                column=col_name,
+                payloads={"scaled_val": scaled_vals, "is_missing": is_missing},
+                render_caches=[pie_cache],
             )
-
-    return res
+        return registered
+
+    return _register_within_render_budget(
+        "gt_plt_donut",
+        n_cells=len(columns_resolved) * len(gt._tbl_data),
+        register=_register,
+        show_labels=show_labels,
+        precision=precision,
+    )
 
 
+@_profile_function
 def gt_plt_winloss(
     gt: GT,
     column: SelectExpr,
@@ -1547,6 +2118,9 @@ def gt_plt_winloss(
     tie_color: str = "grey",
     shape: Literal["pill", "square"] = "pill",
     spacing: float = 2,
+    compact: bool = False,
+    precision: int | None = None,
+    aggregate: bool = False,
 ) -> GT:
     """
     Create win/loss charts in `GT` cells.
@@ -1593,6 +2167,27 @@ def gt_plt_winloss(
         The horizontal gap, in pixels, between each bar. Note that if the spacing is too large, it
         may obstruct the bars from view.
 
+    compact
+        Whether to draw each outcome type as a single `<path>` instead of one `<rect>` per game.
+        When `spacing` is `0`, consecutive games with the same outcome are also merged into one
+        bar. This greatly reduces the size of the output for long sequences, at the cost of the
+        rounded corners given by `shape`.
+
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    aggregate
+        Whether to group consecutive games into windows one pixel wide when the longest sequence
+        has more games than the chart has pixels of `width`. Each window is drawn as a single bar
+        showing its win share, counting ties as half a win: a window won more often than lost
+        rises towards the wins in `win_color`, one lost more often falls towards the losses in
+        `loss_color`, and an even window is drawn as a tie. `spacing` and `compact` do not apply
+        to aggregated charts. Columns whose sequences fit within the width are drawn as usual.
+
     Returns
     -------
     GT
@@ -1698,9 +2293,11 @@ def gt_plt_winloss(
     )
     ```
     """
+    precision = _resolve_precision(precision)
 
+    @_profile_stage("svg_building")
     def _make_winloss_svg(
-        values: list[float],
+        outcomes: np.ndarray,
         max_length: int,
         width: float,
         height: float,
@@ -1709,84 +2306,179 @@ def gt_plt_winloss(
         tie_color: str,
         shape: Literal["pill", "square"],
         spacing: float,
+        compact: bool,
+        precision: int | None,
     ) -> str:
-        if len(values) == 0:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        if len(outcomes) == 0:
             return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
 
         available_width = width - (max_length) * spacing
         bar_width = available_width / max_length
         win_bar_height = height * 0.2 if shape == "square" else height * 0.4
 
-        elements = []
-
-        for i, value in enumerate(values):
-            if is_na(gt._tbl_data, value):
-                continue
+        # The color, y position and height of the bars for each outcome
+        outcome_styles = {
+            1: (win_color, height * 0.2, win_bar_height),
+            0.5: (tie_color, height * 0.4, height * 0.2),
+            0: (loss_color, height * 0.8 - win_bar_height, win_bar_height),
+        }
 
-            if value == 1:  # Win
-                color = win_color
-                bar_y = height * 0.2
-                bar_height = win_bar_height
-            elif value == 0.5:  # Tie
-                color = tie_color
-                bar_y = height * 0.4
-                bar_height = height * 0.2
-            elif value == 0:  # Loss
-                color = loss_color
-                bar_y = height * 0.8 - win_bar_height
-                bar_height = win_bar_height
-            else:
-                warnings.warn(
-                    f"Invalid value '{value}' encountered in win/loss data. Skipping.",
-                    category=UserWarning,
-                )
-                continue
+        elements = []
 
+        if compact:
+            for outcome, (color, bar_y, bar_height) in outcome_styles.items():
+                path_commands = []
+                for run_start, run_length in _find_outcome_runs(
+                    outcomes, outcome, merge_adjacent=spacing == 0
+                ):
+                    run_width = run_length * bar_width + (run_length - 1) * spacing
+                    path_commands += [
+                        MoveTo(_num(run_start * (bar_width + spacing)), _num(bar_y)),
+                        HorizontalLineToRel(_num(run_width)),
+                        VerticalLineToRel(_num(bar_height)),
+                        HorizontalLineToRel(_num(-run_width)),
+                        ClosePath(),
+                    ]
+
+                if path_commands:
+                    elements.append(Path(d=path_commands, fill=color))
+
+            svg = SVG(width=_num(width), height=_num(height), elements=elements)
+            return f'<div style="display: flex;">{svg.as_str()}</div>'
+
+        border_radius = 0.5 if shape == "square" else 2
+
+        for i in np.flatnonzero(~np.isnan(outcomes)).tolist():
+            color, bar_y, bar_height = outcome_styles[outcomes[i]]
             bar_x = i * (bar_width + spacing)
-            border_radius = 0.5 if shape == "square" else 2
 
             bar_rect = Rect(
-                x=bar_x,
-                y=bar_y,
-                width=bar_width,
-                height=bar_height,
+                x=_num(bar_x),
+                y=_num(bar_y),
+                width=_num(bar_width),
+                height=_num(bar_height),
                 fill=color,
-                rx=border_radius,
+                rx=_num(border_radius),
             )
             elements.append(bar_rect)
 
-        svg = SVG(width=width, height=height, elements=elements)
+        svg = SVG(width=_num(width), height=_num(height), elements=elements)
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
-    res = gt
-    _, col_vals = _validate_and_get_single_column(gt, expr=column)
-    max_length = max(len(entry) for entry in col_vals)
+    @_profile_stage("svg_building")
+    def _make_aggregated_winloss_svg(
+        bar_ys: np.ndarray,
+        bar_heights: np.ndarray,
+        bar_colors: np.ndarray,
+        width: float,
+        height: float,
+        precision: int | None,
+    ) -> str:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
 
-    if spacing * max_length >= width:
-        warnings.warn(
-            "Spacing is too large relative to the width. No bars will be displayed.",
-            category=UserWarning,
+        windows = np.flatnonzero(~np.isnan(bar_heights)).tolist()
+        if len(windows) == 0:
+            return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
+
+        window_width = width / len(bar_heights)
+        colors = (win_color, tie_color, loss_color)
+
+        elements = [
+            Rect(
+                x=_num(i * window_width),
+                y=_num(bar_ys[i]),
+                width=_num(window_width),
+                height=_num(bar_heights[i]),
+                fill=colors[bar_colors[i]],
+            )
+            for i in windows
+        ]
+
+        svg = SVG(width=_num(width), height=_num(height), elements=elements)
+        return f'<div style="display: flex;">{svg.as_str()}</div>'
+
+    col_name, flat_vals, offsets = _validate_and_get_list_column(gt, expr=column)
+
+    # Classify every game in the column at once, rather than value by value in each cell
+    outcomes = _classify_winloss_values(flat_vals, gt._tbl_data)
+    max_length = int(np.diff(offsets).max(initial=0))
+    n_windows = int(width)
+
+    if aggregate and max_length > n_windows:
+        win_shares = _aggregate_winloss(outcomes, offsets, max_length, n_windows)
+
+        # Bars grow from the middle of the cell, up for winning windows and down for losing ones
+        lean = 2 * win_shares - 1
+        max_bar_height = height * 0.3
+        tie_height = height * 0.2
+        bar_heights = np.where(lean == 0, tie_height, np.abs(lean) * max_bar_height)
+        bar_ys = np.where(
+            lean > 0,
+            height / 2 - bar_heights,
+            np.where(lean < 0, height / 2, (height - tie_height) / 2),
         )
+        bar_colors = np.select([lean > 0, lean == 0], [0, 1], default=2)
+
+        def _register(precision: int | None) -> GT:
+            return _fmt_with_row_payloads(
+                gt,
+                lambda _, bar_ys, bar_heights, bar_colors: _make_aggregated_winloss_svg(
+                    bar_ys,
+                    bar_heights,
+                    bar_colors,
+                    width=width,
+                    height=height,
+                    precision=precision,
+                ),
+                column=col_name,
+                payloads={
+                    "bar_ys": bar_ys,
+                    "bar_heights": bar_heights,
+                    "bar_colors": bar_colors,
+                },
+            )
 
-    # I don't have to loop like with the others since I dont need to access other columns
-    res = res.fmt(
-        lambda x: _make_winloss_svg(
-            x,
-            max_length=max_length,
-            width=width,
-            height=height,
-            win_color=win_color,
-            loss_color=loss_color,
-            tie_color=tie_color,
-            shape=shape,
-            spacing=spacing,
-        ),
-        columns=column,
-    )
+    else:
+        if spacing * max_length >= width:
+            warnings.warn(
+                "Spacing is too large relative to the width. No bars will be displayed.",
+                category=UserWarning,
+            )
 
-    return res
+        # Each row's games are the slice of the classified column between its offsets
+        def _register(precision: int | None) -> GT:
+            return _fmt_with_row_payloads(
+                gt,
+                lambda _, start, stop: _make_winloss_svg(
+                    outcomes[start:stop],
+                    max_length=max_length,
+                    width=width,
+                    height=height,
+                    win_color=win_color,
+                    loss_color=loss_color,
+                    tie_color=tie_color,
+                    shape=shape,
+                    spacing=spacing,
+                    compact=compact,
+                    precision=precision,
+                ),
+                column=col_name,
+                payloads={"start": offsets[:-1], "stop": offsets[1:]},
+            )
+
+    return _register_within_render_budget(
+        "gt_plt_winloss",
+        n_cells=len(offsets) - 1,
+        register=_register,
+        precision=precision,
+    )
 
 
+@_profile_function
 def gt_plt_bar_stack(
     gt: GT,
     column: SelectExpr,
@@ -1798,6 +2490,9 @@ def gt_plt_bar_stack(
     spacing: float = 2,
     num_decimals: int = 0,
     scale_type: Literal["relative", "absolute"] = "relative",
+    precision: int | None = None,
+    renderer: Literal["svg", "css"] = "svg",
+    show_labels: bool = True,
 ) -> GT:
     """
     Create stacked horizontal bar plots in `GT` cells.
@@ -1847,6 +2542,21 @@ def gt_plt_bar_stack(
         the sum of the values in each cell) and `"absolute"` (bars are scaled relative to the
         maximum value across all rows).
 
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    renderer
+        How to draw the bars. The default of `"svg"` draws each stack as an SVG. `"css"` draws each
+        bar of the stack as a `<div>` instead, which is lighter for the browser to lay out in
+        tables with many stacks, and displays in email clients that remove SVG.
+
+    show_labels
+        Whether or not to show the value of each bar as a label on it.
+
     Returns
     -------
     GT
@@ -1929,9 +2639,11 @@ def gt_plt_bar_stack(
     -------
     Values of `0` will not be displayed in the plots.
     """
+    precision = _resolve_precision(precision)
 
+    @_profile_stage("svg_building")
     def _make_bar_stack_svg(
-        values: list[float],
+        values: np.ndarray,
         max_sum: float,
         width: float,
         height: float,
@@ -1940,11 +2652,16 @@ def gt_plt_bar_stack(
         num_decimals: int,
         font_size: int,
         scale_type: Literal["relative", "absolute"],
+        show_labels: bool,
+        precision: int | None,
     ) -> str:
-        if not values:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        if len(values) == 0:
             return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
 
-        non_na_vals = [val if not is_na(gt._tbl_data, val) else 0 for val in values]
+        non_na_vals = np.where(np.isnan(values), 0, values).tolist()
         # Count how many values will be displayed in the chart
         len_non_zero_values = sum(1 for val in non_na_vals if val != 0)
 
@@ -1978,45 +2695,128 @@ def gt_plt_bar_stack(
 
             # Create the bar rectangle
             bar_rect = Rect(
-                x=current_left,
+                x=_num(current_left),
                 y=0,
-                width=bar_width,
-                height=height,
+                width=_num(bar_width),
+                height=_num(height),
                 fill=color,
             )
             elements.append(bar_rect)
 
             # Create the label text
-            label = f"{non_na_vals[i]:.{num_decimals}f}"
-            label_text = Text(
-                text=label,
-                x=current_left + bar_width / 2,  # Center horizontally in the bar
-                y=height / 2,  # Center vertically
-                fill=_ideal_fgnd_color(_html_color([color])[0]),
-                font_size=font_size,
-                text_anchor="middle",
-                dominant_baseline="central",
-            )
-            elements.append(label_text)
+            if show_labels:
+                label = f"{non_na_vals[i]:.{num_decimals}f}"
+                label_text = Text(
+                    text=label,
+                    x=_num(
+                        current_left + bar_width / 2
+                    ),  # Center horizontally in the bar
+                    y=_num(height / 2),  # Center vertically
+                    fill=_ideal_fgnd_color(_html_color([color])[0]),
+                    font_size=_num(font_size),
+                    text_anchor="middle",
+                    dominant_baseline="central",
+                )
+                elements.append(label_text)
 
             current_left += bar_width + spacing
 
-        svg = SVG(width=width, height=height, elements=elements)
+        svg = SVG(width=_num(width), height=_num(height), elements=elements)
         return f'<div style="display: flex;">{svg.as_str()}</div>'
 
+    @_profile_stage("svg_building")
+    def _make_bar_stack_css(
+        values: np.ndarray,
+        max_sum: float,
+        width: float,
+        height: float,
+        colors: list[str],
+        spacing: float,
+        num_decimals: int,
+        font_size: int,
+        scale_type: Literal["relative", "absolute"],
+        show_labels: bool,
+        precision: int | None,
+    ) -> str:
+        def _px(val: float) -> str:
+            return _round_number(val, precision) + "px"
+
+        empty = f'<div style="width:{_px(width)};height:{_px(height)};"></div>'
+        if len(values) == 0:
+            return empty
+
+        non_na_vals = np.where(np.isnan(values), 0, values).tolist()
+        len_non_zero_values = sum(1 for val in non_na_vals if val != 0)
+
+        if scale_type == "absolute":
+            total = max_sum
+        else:
+            total = sum(non_na_vals)
+
+        # Avoid div by 0
+        if total == 0:
+            total = 1
+
+        available_width = width - (len_non_zero_values - 1) * spacing
+        if available_width <= 0:
+            warnings.warn(
+                "Spacing is too large relative to the width. No bars will be displayed.",
+                category=UserWarning,
+            )
+            return empty
+
+        # Each bar is an inline block, so the stack needs no flexbox support
+        bars = []
+        for i, val in enumerate(non_na_vals):
+            if val == 0:
+                continue
+
+            color = colors[i % len(colors)]
+            margin = f"margin-left:{_px(spacing)};" if bars else ""
+            style = (
+                f"display:inline-block;vertical-align:top;{margin}"
+                f"width:{_px(available_width * val / total)};height:{_px(height)};"
+                f"background:{color};"
+            )
+
+            label = ""
+            if show_labels:
+                label = f"{val:.{num_decimals}f}"
+                style += (
+                    f"color:{_ideal_fgnd_color(_html_color([color])[0])};"
+                    f"font-size:{_px(font_size)};line-height:{_px(height)};"
+                    "text-align:center;overflow:hidden;"
+                )
+
+            bars.append(f'<div style="{style}">{label}</div>')
+
+        return (
+            f'<div style="width:{_px(width)};height:{_px(height)};'
+            f'white-space:nowrap;font-size:0;">{"".join(bars)}</div>'
+        )
+
     # Throw if `scale_type` is not one of the allowed values
     if scale_type not in ["relative", "absolute"]:
         raise ValueError("Scale_type must be either 'relative' or 'absolute'")
 
-    col_name, col_vals = _validate_and_get_single_column(gt, expr=column)
-    cleaned_col_vals = [
-        [val for val in col if val is not None and not is_na(gt._tbl_data, val)]
-        for col in col_vals
-        if col is not None
-    ]
+    _validate_renderer(renderer)
+    _make_stack = _make_bar_stack_css if renderer == "css" else _make_bar_stack_svg
+
+    col_name, flat_vals, offsets = _validate_and_get_list_column(gt, expr=column)
+    flat_vals = np.asarray(flat_vals, dtype=float)
 
-    max_sum = max(sum(col) for col in cleaned_col_vals if col is not None)
-    max_num_values = max(len(col) for col in cleaned_col_vals)
+    # Compute the per-row sums and counts of non-NA values over the flattened column
+    n_rows = len(offsets) - 1
+    row_ids = np.repeat(np.arange(n_rows), np.diff(offsets))
+    is_missing = np.isnan(flat_vals)
+
+    row_sums = np.bincount(
+        row_ids, weights=np.where(is_missing, 0, flat_vals), minlength=n_rows
+    )
+    row_counts = np.bincount(row_ids[~is_missing], minlength=n_rows)
+
+    max_sum = float(row_sums.max(initial=0))
+    max_num_values = int(row_counts.max(initial=0))
 
     # If user passes a list, accept those colors, otherwise use palette functionality.
     if isinstance(palette, list) and len(palette) >= max_num_values:
@@ -2028,20 +2828,33 @@ def gt_plt_bar_stack(
             data_table=gt._tbl_data,
         )
 
-    res = gt
-    res = res.fmt(
-        lambda x: _make_bar_stack_svg(
-            x,
-            max_sum=max_sum,
-            width=width,
-            height=height,
-            colors=color_list,
-            spacing=spacing,
-            font_size=font_size,
-            num_decimals=num_decimals,
-            scale_type=scale_type,
-        ),
-        columns=column,
+    # Each row's values are the slice of the flattened column between its offsets
+    def _register(show_labels: bool, precision: int | None) -> GT:
+        return _fmt_with_row_payloads(
+            gt,
+            lambda _, start, stop: _make_stack(
+                flat_vals[start:stop],
+                max_sum=max_sum,
+                width=width,
+                height=height,
+                colors=color_list,
+                spacing=spacing,
+                font_size=font_size,
+                num_decimals=num_decimals,
+                scale_type=scale_type,
+                show_labels=show_labels,
+                precision=precision,
+            ),
+            column=col_name,
+            payloads={"start": offsets[:-1], "stop": offsets[1:]},
+        )
+
+    res = _register_within_render_budget(
+        "gt_plt_bar_stack",
+        n_cells=n_rows,
+        register=_register,
+        show_labels=show_labels,
+        precision=precision,
     )
 
     if labels is not None:
@@ -2057,6 +2870,7 @@ def gt_plt_bar_stack(
     return res
 
 
+@_profile_function
 def gt_plt_bar_pct(
     gt: GT,
     column: SelectExpr,
@@ -2070,6 +2884,9 @@ def gt_plt_bar_pct(
     decimals: int = 1,
     font_style: Literal["oblique", "italic", "normal"] = "normal",
     font_size: int = 10,
+    resolution: float | None = None,
+    precision: int | None = None,
+    renderer: Literal["svg", "css"] = "svg",
 ):
     """
     Create horizontal bar plots in percentage in `GT` cells.
@@ -2129,6 +2946,25 @@ def gt_plt_bar_pct(
     font_size
         The font size for the text labels displayed on the bars.
 
+    resolution
+        An optional step, in pixels, to round the length of the bars to. Cells whose bars round to
+        the same length, and that have the same label, reuse the same SVG, which speeds up
+        rendering large tables. Labels always show the exact percentage. The default of `None`
+        draws bars at their exact lengths.
+
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    renderer
+        How to draw the bars. The default of `"svg"` draws each bar as an SVG. `"css"` draws each
+        bar as a single `<div>` with a `linear-gradient` background instead, which is lighter for
+        the browser to lay out in tables with many bars, and displays in email clients that remove
+        SVG.
+
     Returns
     -------
     GT
@@ -2179,12 +3015,7 @@ def gt_plt_bar_pct(
     Finally, label colors are automatically adjusted based on the `fill` and `background` parameters
     to ensure optimal readability.
     """
-
-    def _not_na(val, tbl_data) -> bool:
-        return val is not None and not is_na(tbl_data, val)
-
-    def _is_na(val, tbl_data) -> bool:
-        return not _not_na(val, tbl_data)
+    precision = _resolve_precision(precision)
 
     def _is_effective_int(val) -> bool:
         return isinstance(val, int) or (isinstance(val, float) and val.is_integer())
@@ -2195,11 +3026,22 @@ def gt_plt_bar_pct(
     if font_style not in ["bold", "italic", "normal"]:
         raise ValueError("Font_style must be one of 'bold', 'italic', or 'normal'.")
 
+    _validate_resolution(resolution)
+    _validate_renderer(renderer)
+
+    def _format_label(scaled_val: int | float) -> str:
+        _decimals = decimals
+        if _is_effective_int(scaled_val):
+            _decimals = 0
+        return f"{scaled_val:.{_decimals}f}%"
+
     # Helper function to make the individual bars
 
+    @_profile_stage("svg_building")
     def _make_bar_pct_svg(
         # original_val: int | float,
         scaled_val: int | float,
+        bar_val: int | float,
         height: int,
         width: int,
         fill: str,
@@ -2210,14 +3052,18 @@ def gt_plt_bar_pct(
         decimals: int,
         font_style: Literal["oblique", "italic", "normal"],
         font_size: int,
+        precision: int | None,
     ) -> str:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
         elements = []
-        if _is_na(scaled_val, tbl_data):
+        if math.isnan(scaled_val):
             outer_rect = Rect(
                 x=0,
                 y=0,
-                width=Length(width, "%"),
-                height=Length(height, "px"),
+                width=Length(_num(width), "%"),
+                height=Length(_num(height), "px"),
                 fill="transparent",
             )
             elements.append(outer_rect)
@@ -2225,19 +3071,19 @@ def gt_plt_bar_pct(
             outer_rect = Rect(
                 x=0,
                 y=0,
-                width=Length(width, "px"),
-                height=Length(height, "px"),
+                width=Length(_num(width), "px"),
+                height=Length(_num(height), "px"),
                 fill=background,
             )
             elements.append(outer_rect)
 
-            _width = width * scaled_val * 0.01
+            _width = width * bar_val * 0.01
 
             inner_rect = Rect(
                 x=0,
                 y=0,
-                width=Length(_width, "px"),
-                height=Length(height, "px"),
+                width=Length(_num(_width), "px"),
+                height=Length(_num(height), "px"),
                 fill=fill,
             )
             elements.append(inner_rect)
@@ -2252,17 +3098,14 @@ def gt_plt_bar_pct(
                     _x = padding
                     _fill = _ideal_fgnd_color(_html_color([fill])[0])
 
-                _decimals = decimals
-                if _is_effective_int(scaled_val):
-                    _decimals = 0
-                _text = f"{scaled_val:.{_decimals}f}%"
+                _text = _format_label(scaled_val)
 
                 inner_text = Text(
                     text=_text,
-                    x=Length(_x, "px"),
-                    y=Length(height / 2, "px"),
+                    x=Length(_num(_x), "px"),
+                    y=Length(_num(height / 2), "px"),
                     fill=_fill,
-                    font_size=Length(font_size, "px"),
+                    font_size=Length(_num(font_size), "px"),
                     font_style=font_style,
                     text_anchor="start",
                     dominant_baseline="central",
@@ -2270,16 +3113,105 @@ def gt_plt_bar_pct(
                 elements.append(inner_text)
 
         canvas = SVG(
-            width=Length(width, "px"),
-            height=Length(height, "px"),
+            width=Length(_num(width), "px"),
+            height=Length(_num(height), "px"),
             elements=elements,
         )
         return f'<div style="display: flex;">{canvas.as_str()}</div>'
 
-    def _make_bar_pct(scaled_val: int) -> str:
+    @_profile_stage("svg_building")
+    def _make_bar_pct_css(
+        scaled_val: int | float,
+        bar_val: int | float,
+        height: int,
+        width: int,
+        fill: str,
+        background: str,
+        labels: bool,
+        label_cutoff: float,
+        font_style: Literal["oblique", "italic", "normal"],
+        font_size: int,
+        precision: int | None,
+    ) -> str:
+        def _px(val: float) -> str:
+            return _round_number(val, precision) + "px"
+
+        style = f"width:{_px(width)};height:{_px(height)};"
+        if math.isnan(scaled_val):
+            return f'<div style="{style}"></div>'
+
+        # The bar and its background are the two halves of a single hard-stop gradient
+        stop = _round_number(bar_val, precision) + "%"
+        style += (
+            f"background-color:{background};"
+            f"background-image:linear-gradient(to right,{fill} {stop},{background} {stop});"
+        )
+
+        text = ""
+        if labels:
+            padding = 5.0
+            _width = width * bar_val * 0.01
+
+            if _width < (label_cutoff * 100):
+                _x = _width + padding
+                _fill = _ideal_fgnd_color(_html_color([background])[0])
+            else:
+                _x = padding
+                _fill = _ideal_fgnd_color(_html_color([fill])[0])
+
+            text = _format_label(scaled_val)
+            style += (
+                f"box-sizing:border-box;padding-left:{_px(_x)};color:{_fill};"
+                f"font-size:{_px(font_size)};font-style:{font_style};"
+                f"line-height:{_px(height)};white-space:nowrap;overflow:hidden;"
+            )
+
+        return f'<div style="{style}">{text}</div>'
+
+    def _make_bar_pct(
+        scaled_val: int | float,
+        labels: bool,
+        precision: int | None,
+        bar_pct_cache: dict[tuple[float, str], str],
+    ) -> str:
+        if resolution is None or math.isnan(scaled_val):
+            return _make_exact_bar_pct(scaled_val, scaled_val, labels, precision)
+
+        # Bars of the same quantized length and label share one SVG string
+        bar_val = _quantize(scaled_val, resolution / width * 100)
+        key = (bar_val, _format_label(scaled_val) if labels else "")
+        glyph = bar_pct_cache.get(key)
+        if glyph is None:
+            glyph = bar_pct_cache[key] = _make_exact_bar_pct(
+                scaled_val, bar_val, labels, precision
+            )
+        return glyph
+
+    def _make_exact_bar_pct(
+        scaled_val: int | float,
+        bar_val: int | float,
+        labels: bool,
+        precision: int | None,
+    ) -> str:
+        if renderer == "css":
+            return _make_bar_pct_css(
+                scaled_val=scaled_val,
+                bar_val=bar_val,
+                height=height,
+                width=width,
+                fill=fill,
+                background=background,
+                labels=labels,
+                label_cutoff=label_cutoff,
+                font_style=font_style,
+                font_size=font_size,
+                precision=precision,
+            )
+
         return _make_bar_pct_svg(
             # original_val=original_val,
             scaled_val=scaled_val,
+            bar_val=bar_val,
             height=height,
             width=width,
             fill=fill,
@@ -2290,36 +3222,551 @@ def gt_plt_bar_pct(
             decimals=decimals,
             font_style=font_style,
             font_size=font_size,
+            precision=precision,
         )
 
-    _, col_vals = _validate_and_get_single_column(gt, expr=column)
-    tbl_data = gt._tbl_data
-    if all(_is_na(val, tbl_data) for val in col_vals):
+    col_name, col_vals = _validate_and_get_single_column(gt, expr=column)
+    is_missing = _get_na_mask(gt._tbl_data, col_name)
+    if is_missing.all():
         raise ValueError("All values in the column are None.")
 
-    max_x = max(val for val in col_vals if _not_na(val, tbl_data))
+    max_x = max(val for val, missing in zip(col_vals, is_missing) if not missing)
 
     scaled_vals = col_vals
     if autoscale:
         scaled_vals = [
-            val if _is_na(val, tbl_data) else (val / max_x * 100) for val in col_vals
+            val if missing else (val / max_x * 100)
+            for val, missing in zip(col_vals, is_missing)
         ]
 
-    res = gt
-    # Apply the scaled value for each row, so the bar is proportional
-    for i, scaled_val in enumerate(scaled_vals):
-        res = res.fmt(
-            lambda _, scaled_val=scaled_val: _make_bar_pct(scaled_val=scaled_val),
-            columns=column,
-            rows=[i],
+    scaled_vals = _to_float_array(scaled_vals, is_missing)
+
+    def _register(labels: bool, precision: int | None) -> GT:
+        bar_pct_cache: dict[tuple[float, str], str] = {}
+
+        # Look up the scaled value of each row, so the bar is proportional
+        return _fmt_with_row_payloads(
+            gt,
+            lambda _, scaled_val: _make_bar_pct(
+                scaled_val, labels, precision, bar_pct_cache
+            ),
+            column=col_name,
+            payloads={"scaled_val": scaled_vals},
+            render_caches=[bar_pct_cache],
         )
-    return res
+
+    return _register_within_render_budget(
+        "gt_plt_bar_pct",
+        n_cells=len(col_vals),
+        register=_register,
+        labels=labels,
+        precision=precision,
+    )
+
+
+@_profile_function
+def gt_plt_sparkline(
+    gt: GT,
+    column: SelectExpr,
+    width: float = 80,
+    height: float = 30,
+    line_color: str = "black",
+    line_width: float = 1.5,
+    same_scale: bool = True,
+    precision: int | None = None,
+) -> GT:
+    """
+    Create line sparklines in `GT` cells.
+
+    The `gt_plt_sparkline()` function takes an existing `GT` object and adds a line sparkline to a
+    specified column of numeric lists. Each cell draws its list as a line from left to right, with
+    each value plotted at its position in the list.
+
+    Long series are downsampled to about one point per pixel of `width` with the
+    Largest-Triangle-Three-Buckets (LTTB) algorithm, which keeps the peaks and troughs that shape
+    the line. Each sparkline is drawn as a single `<path>`, so the size of the output depends on
+    the width of the plot rather than the length of the series.
+
+    Parameters
+    ----------
+    gt
+        A `GT` object to modify.
+
+    column
+        The column containing lists of numeric values. Missing values within a list are skipped,
+        and missing or empty lists leave the cell empty.
+
+    width
+        The width of the sparkline in pixels. Series with more points than this are downsampled.
+
+    height
+        The height of the sparkline in pixels.
+
+    line_color
+        The color of the line.
+
+    line_width
+        The width of the line in pixels.
+
+    same_scale
+        Whether all sparklines share one vertical scale, from the minimum to the maximum of the
+        whole column. If `False`, each sparkline is scaled to its own minimum and maximum.
+
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    Returns
+    -------
+    GT
+        A `GT` object with sparklines added to the specified column.
+
+    Examples
+    --------
+    ```{python}
+    import numpy as np
+    import pandas as pd
+    from great_tables import GT
+    import gt_extras as gte
+
+    rng = np.random.default_rng(23)
+
+    df = pd.DataFrame(
+        {
+            "Sensor": ["A", "B", "C"],
+            "Readings": [rng.normal(0, 1, 2000).cumsum().tolist() for _ in range(3)],
+        }
+    )
+
+    GT(df).pipe(gte.gt_plt_sparkline, column="Readings", width=100, precision=1)
+    ```
+
+    Note
+    --------
+    Each value's horizontal position is its index in its list, so every sparkline spans the full
+    width, whatever the length of its series.
+    """
+    precision = _resolve_precision(precision)
+
+    @_profile_stage("svg_building")
+    def _make_sparkline_svg(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        width: float,
+        height: float,
+        line_color: str,
+        line_width: float,
+        precision: int | None,
+    ) -> str:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        if len(xs) == 0:
+            return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
+
+        # One compact path, with the line-to command implied for every point after the second
+        points = [f"{_num(x)} {_num(y)}" for x, y in zip(xs.tolist(), ys.tolist())]
+        if len(points) == 1:
+            points.append(points[0])
+        path_data = f"M{points[0]}L{' '.join(points[1:])}"
+
+        line = Path(
+            d=path_data,
+            fill="none",
+            stroke=line_color,
+            stroke_width=_num(line_width),
+            stroke_linecap="round",
+            stroke_linejoin="round",
+        )
+
+        svg = SVG(width=_num(width), height=_num(height), elements=[line])
+        return f'<div style="display: flex;">{svg.as_str()}</div>'
+
+    col_name, flat_vals, offsets = _validate_and_get_list_column(gt, expr=column)
+
+    try:
+        flat_vals = np.asarray(flat_vals, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("Expected all entries to be numeric or None.")
+
+    # Missing values are skipped, but each value keeps its index in its list as its x position
+    row_ids = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    positions = np.arange(len(flat_vals)) - offsets[row_ids]
+    series_lengths = np.diff(offsets)
+
+    is_valid = ~np.isnan(flat_vals)
+    xs, ys, row_ids = (
+        positions[is_valid].astype(float),
+        flat_vals[is_valid],
+        row_ids[is_valid],
+    )
+    valid_offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(row_ids, minlength=len(offsets) - 1))]
+    )
+
+    # Keep about one point per pixel, whatever the length of each series
+    xs, ys, point_offsets = _lttb_downsample(
+        xs, ys, valid_offsets, threshold=max(int(width), 3)
+    )
+
+    point_lengths = np.diff(point_offsets)
+    point_rows = np.repeat(np.arange(len(point_lengths)), point_lengths)
+
+    # Scale every kept point to pixels at once, leaving room for the width of the line
+    pad = line_width
+    if same_scale:
+        y_min = np.full(len(point_lengths), ys.min(initial=np.inf))
+        y_max = np.full(len(point_lengths), ys.max(initial=-np.inf))
+    else:
+        y_min, y_max = _row_min_max(ys, point_offsets)
+
+    y_range = (y_max - y_min)[point_rows]
+    x_range = np.maximum(series_lengths - 1, 1)[point_rows]
+
+    px = pad + xs / x_range * (width - 2 * pad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        py = np.where(
+            y_range > 0,
+            height - pad - (ys - y_min[point_rows]) / y_range * (height - 2 * pad),
+            height / 2,
+        )
+
+    def _register(precision: int | None) -> GT:
+        return _fmt_with_row_payloads(
+            gt,
+            lambda _, start, stop: _make_sparkline_svg(
+                px[start:stop],
+                py[start:stop],
+                width=width,
+                height=height,
+                line_color=line_color,
+                line_width=line_width,
+                precision=precision,
+            ),
+            column=col_name,
+            payloads={"start": point_offsets[:-1], "stop": point_offsets[1:]},
+        )
+
+    return _register_within_render_budget(
+        "gt_plt_sparkline",
+        n_cells=len(offsets) - 1,
+        register=_register,
+        precision=precision,
+    )
+
+
+@_profile_function
+def gt_plt_dist(
+    gt: GT,
+    column: SelectExpr,
+    plot_type: Literal["histogram", "density", "boxplot"] = "histogram",
+    width: float = 100,
+    height: float = 30,
+    fill_color: str = "grey",
+    line_color: str = "black",
+    bins: int = 20,
+    bw: float | None = None,
+    same_limit: bool = True,
+    precision: int | None = None,
+) -> GT:
+    """
+    Create distribution plots in `GT` cells.
+
+    The `gt_plt_dist()` function takes an existing `GT` object and adds a small distribution plot
+    to a specified column of numeric lists. Each cell summarizes its list as a histogram, a density
+    curve or a boxplot.
+
+    All cells are binned at once: every value in the column is assigned to its bin in one pass,
+    rather than one pass per cell, so large tables of long lists stay quick to build.
+
+    Parameters
+    ----------
+    gt
+        A `GT` object to modify.
+
+    column
+        The column containing lists of numeric values. Missing values within a list are skipped,
+        and missing or empty lists leave the cell empty.
+
+    plot_type
+        The type of plot to draw: `"histogram"`, `"density"` or `"boxplot"`. The histogram also
+        marks the mean with a vertical line, and the boxplot draws its whiskers to the most
+        extreme values within 1.5 times the interquartile range, with the values beyond them as
+        points.
+
+    width
+        The width of each plot in pixels.
+
+    height
+        The height of each plot in pixels.
+
+    fill_color
+        The color of the bars, the area under the density curve, or the box.
+
+    line_color
+        The color of the lines and outlines.
+
+    bins
+        The number of bins of each histogram.
+
+    bw
+        The bandwidth of the density curves, in the units of the data. If `None`, each cell uses
+        Scott's rule, the default of `scipy.stats.gaussian_kde`.
+
+    same_limit
+        Whether all plots share one horizontal axis, from the minimum to the maximum of the
+        whole column, so that the cells can be compared. If `False`, each plot spans the range of
+        its own values.
+
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
+    Returns
+    -------
+    GT
+        A `GT` object with distribution plots added to the specified column.
+
+    Examples
+    --------
+    ```{python}
+    import numpy as np
+    import pandas as pd
+    from great_tables import GT
+    import gt_extras as gte
+
+    rng = np.random.default_rng(23)
+
+    df = pd.DataFrame(
+        {
+            "Group": ["A", "B", "C"],
+            "Values": [
+                rng.normal(0, 1, 500).tolist(),
+                rng.normal(1, 0.5, 500).tolist(),
+                rng.exponential(1, 500).tolist(),
+            ],
+        }
+    )
+
+    (
+        GT(df)
+        .pipe(gte.gt_duplicate_column, column="Values", dupe_name="Density")
+        .pipe(gte.gt_duplicate_column, column="Values", dupe_name="Boxplot")
+        .pipe(gte.gt_plt_dist, column="Values")
+        .pipe(gte.gt_plt_dist, column="Density", plot_type="density")
+        .pipe(gte.gt_plt_dist, column="Boxplot", plot_type="boxplot")
+    )
+    ```
+
+    Note
+    --------
+    Each density curve is estimated from a fine histogram of its values, smoothed with a Gaussian
+    kernel, which closely follows an exact kernel density estimate at the size of a cell.
+    """
+    if plot_type not in ("histogram", "density", "boxplot"):
+        raise ValueError(
+            "Plot type must be one of 'histogram', 'density', or 'boxplot'."
+        )
+    if bins < 1:
+        raise ValueError("Number of bins must be a positive integer.")
+    if bw is not None and bw <= 0:
+        raise ValueError("Bandwidth must be a positive number or None.")
+
+    precision = _resolve_precision(precision)
+    pad = 1
+
+    @_profile_stage("svg_building")
+    def _make_histogram(
+        counts: np.ndarray, normalized_mean: float, precision: int | None
+    ) -> str:
+        svg = _make_histogram_svg(
+            width_px=width,
+            height_px=height,
+            fill=fill_color,
+            plot_id="",
+            normalized_mean=normalized_mean,
+            data_min="",
+            data_max="",
+            counts=counts.tolist(),
+            bin_edges=[],
+            interactivity=False,
+            compact=True,
+            precision=precision,
+        )
+        return f'<div style="display: flex;">{svg.as_str()}</div>'
+
+    @_profile_stage("svg_building")
+    def _make_density(density: np.ndarray, precision: int | None) -> str:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        baseline = height - pad
+        xs = np.linspace(pad, width - pad, len(density))
+        ys = baseline - density * (height - 2 * pad)
+
+        # One closed area, with the line-to command implied for every point after the second
+        points = [f"{_num(xs[0])} {_num(baseline)}"]
+        points += [f"{_num(x)} {_num(y)}" for x, y in zip(xs.tolist(), ys.tolist())]
+        points.append(f"{_num(xs[-1])} {_num(baseline)}")
+
+        area = Path(
+            d=f"M{points[0]}L{' '.join(points[1:])}Z",
+            fill=fill_color,
+            stroke=line_color,
+            stroke_width=1,
+            stroke_linejoin="round",
+        )
+        svg = SVG(width=_num(width), height=_num(height), elements=[area])
+        return f'<div style="display: flex;">{svg.as_str()}</div>'
+
+    @_profile_stage("svg_building")
+    def _make_boxplot(
+        stats: np.ndarray, outliers: np.ndarray, precision: int | None
+    ) -> str:
+        def _num(val: float) -> str:
+            return _round_number(val, precision)
+
+        whisker_lo, q1, median, q3, whisker_hi = stats.tolist()
+        mid = height / 2
+        box_height = height / 2
+
+        elements = [
+            Line(
+                x1=_num(whisker_lo),
+                x2=_num(q1),
+                y1=_num(mid),
+                y2=_num(mid),
+                stroke=line_color,
+            ),
+            Line(
+                x1=_num(q3),
+                x2=_num(whisker_hi),
+                y1=_num(mid),
+                y2=_num(mid),
+                stroke=line_color,
+            ),
+            Rect(
+                x=_num(q1),
+                y=_num(mid - box_height / 2),
+                width=_num(q3 - q1),
+                height=_num(box_height),
+                fill=fill_color,
+                stroke=line_color,
+            ),
+            Line(
+                x1=_num(median),
+                x2=_num(median),
+                y1=_num(mid - box_height / 2),
+                y2=_num(mid + box_height / 2),
+                stroke=line_color,
+                stroke_width=2,
+            ),
+        ]
+        elements += [
+            Circle(cx=_num(x), cy=_num(mid), r=_num(1.5), fill=line_color)
+            for x in outliers.tolist()
+        ]
+
+        svg = SVG(width=_num(width), height=_num(height), elements=elements)
+        return f'<div style="display: flex;">{svg.as_str()}</div>'
+
+    def _make_empty() -> str:
+        return f'<div style="display: flex;"><div style="width:{width}px; height:{height}px;"></div></div>'
+
+    col_name, flat_vals, offsets = _validate_and_get_list_column(gt, expr=column)
+
+    try:
+        flat_vals = np.asarray(flat_vals, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("Expected all entries to be numeric or None.")
+
+    n_rows = len(offsets) - 1
+    row_ids = np.repeat(np.arange(n_rows), np.diff(offsets))
+    is_valid = ~np.isnan(flat_vals)
+    vals, row_ids = flat_vals[is_valid], row_ids[is_valid]
+    lengths = np.bincount(row_ids, minlength=n_rows)
+    has_values = lengths > 0
+
+    # The range of each row, widened around rows whose values are all the same
+    if same_limit:
+        lo = np.full(n_rows, vals.min(initial=np.inf))
+        hi = np.full(n_rows, vals.max(initial=-np.inf))
+    else:
+        lo, hi = _row_min_max(vals, np.concatenate([[0], np.cumsum(lengths)]))
+    is_flat = has_values & (hi == lo)
+    lo = np.where(is_flat, lo - 1.5, lo)
+    hi = np.where(is_flat, hi + 1.5, hi)
+    span = np.where(has_values, hi - lo, 1)
+
+    # Each value's position along its row's range, from 0 to 1
+    positions = (vals - lo[row_ids]) / span[row_ids]
+
+    if plot_type == "histogram":
+        counts = _bin_rows(positions, row_ids, n_rows, bins)
+        sums = np.bincount(row_ids, weights=positions, minlength=n_rows)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / lengths
+        payloads = {"counts": counts, "mean": means}
+
+    elif plot_type == "density":
+        bandwidths = None if bw is None else np.full(n_rows, bw) / span
+        density = _binned_density(positions, row_ids, n_rows, bandwidths)
+        payloads = {"density": density}
+
+    else:
+        stats, outlier_offsets, outliers = _boxplot_stats(positions, row_ids, n_rows)
+        stats_px = pad + stats * (width - 2 * pad)
+        outliers_px = pad + outliers * (width - 2 * pad)
+        payloads = {
+            "stats": stats_px,
+            "start": outlier_offsets[:-1],
+            "stop": outlier_offsets[1:],
+        }
+
+    def _make_dist(_, precision: int | None, **payload) -> str:
+        if plot_type == "histogram":
+            if payload["counts"].sum() == 0:
+                return _make_empty()
+            return _make_histogram(payload["counts"], payload["mean"], precision)
+        if plot_type == "density":
+            if np.isnan(payload["density"]).all():
+                return _make_empty()
+            return _make_density(payload["density"], precision)
+        if np.isnan(payload["stats"]).all():
+            return _make_empty()
+        return _make_boxplot(
+            payload["stats"],
+            outliers_px[payload["start"] : payload["stop"]],
+            precision,
+        )
+
+    def _register(precision: int | None) -> GT:
+        return _fmt_with_row_payloads(
+            gt,
+            partial(_make_dist, precision=precision),
+            column=col_name,
+            payloads=payloads,
+        )
+
+    return _register_within_render_budget(
+        "gt_plt_dist",
+        n_cells=n_rows,
+        register=_register,
+        precision=precision,
+    )
 
 
 ########### Helper functions that get reused across plots ###########
 
 
 # Helper function to make the individual bars
+@_profile_stage("svg_building")
 def _make_bar_svg(
     scaled_val: float,
     original_val: int | float,
@@ -2330,7 +3777,11 @@ def _make_bar_svg(
     stroke_color: str,
     show_labels: bool,
     label_color: str | None,
+    precision: int | None = None,
 ) -> SVG:
+    def _num(val: float) -> str:
+        return _round_number(val, precision)
+
     text = ""
     if show_labels:
         text = str(original_val)
@@ -2338,19 +3789,19 @@ def _make_bar_svg(
     elements = [
         Rect(
             x=0,
-            y=Length((height - bar_height) / 2, "px"),
-            width=Length(width * scaled_val, "px"),
-            height=Length(bar_height, "px"),
+            y=Length(_num((height - bar_height) / 2), "px"),
+            width=Length(_num(width * scaled_val), "px"),
+            height=Length(_num(bar_height), "px"),
             fill=fill,
             # onmouseover="this.style.fill= 'blue';",
             # onmouseout=f"this.style.fill='{fill}';",
         ),
         Text(
             text=text,
-            x=Length((width * scaled_val) * 0.98, "px"),
-            y=Length(height / 2, "px"),
+            x=Length(_num((width * scaled_val) * 0.98), "px"),
+            y=Length(_num(height / 2), "px"),
             fill=label_color,
-            font_size=bar_height * 0.6,
+            font_size=_num(bar_height * 0.6),
             text_anchor="end",
             dominant_baseline="central",
         ),
@@ -2358,10 +3809,409 @@ def _make_bar_svg(
             x1=0,
             x2=0,
             y1=0,
-            y2=Length(height, "px"),
-            stroke_width=Length(height / 10, "px"),
+            y2=Length(_num(height), "px"),
+            stroke_width=Length(_num(height / 10), "px"),
             stroke=stroke_color,
         ),
     ]
 
-    return SVG(width=width, height=height, elements=elements)
+    return SVG(width=_num(width), height=_num(height), elements=elements)
+
+
+# Helper function to make the individual bars without SVG
+@_profile_stage("svg_building")
+def _make_bar_css(
+    scaled_val: float,
+    original_val: int | float,
+    fill: str,
+    bar_height: float,
+    height: float,
+    width: float,
+    stroke_color: str,
+    show_labels: bool,
+    label_color: str | None,
+    precision: int | None = None,
+) -> str:
+    def _px(val: float) -> str:
+        return _round_number(val, precision) + "px"
+
+    # The outer div draws the axis as its left border, and the bar is a percentage of the rest
+    outer_style = (
+        f"width:{_px(width)};height:{_px(height)};box-sizing:border-box;"
+        f"padding-top:{_px((height - bar_height) / 2)};"
+        f"border-left:{_px(height / 20)} solid {stroke_color};"
+    )
+    bar_style = (
+        f"width:{_round_number(scaled_val * 100, precision)}%;"
+        f"height:{_px(bar_height)};background:{fill};"
+    )
+
+    text = ""
+    if show_labels:
+        text = str(original_val)
+        bar_style += (
+            f"box-sizing:border-box;padding-right:{_px(width * scaled_val * 0.02)};"
+            f"color:{label_color};font-size:{_px(bar_height * 0.6)};"
+            f"line-height:{_px(bar_height)};text-align:right;white-space:nowrap;"
+        )
+
+    return f'<div style="{outer_style}"><div style="{bar_style}">{text}</div></div>'
+
+
+def _validate_renderer(renderer: str):
+    if renderer not in ["svg", "css"]:
+        raise ValueError("Renderer must be either 'svg' or 'css'.")
+
+
+def _validate_engine(engine: str, data_table):
+    if engine not in ["python", "polars"]:
+        raise ValueError("Engine must be either 'python' or 'polars'.")
+    if engine == "polars" and not is_polars_dataframe(data_table):
+        raise ValueError(
+            "The polars engine requires a table built from a polars DataFrame."
+        )
+
+
+def _validate_resolution(resolution: float | None):
+    if resolution is not None and not resolution > 0:
+        raise ValueError("Resolution must be a positive number of pixels.")
+
+
+def _quantize(val: float, step: float) -> float:
+    """
+    Round a value to the nearest multiple of `step`.
+    """
+    return round(val / step) * step
+
+
+def _to_float_array(vals, is_missing) -> array:
+    """
+    Pack numeric values into a compact float array, with the missing values as `NaN`.
+    """
+    return array(
+        "d", [math.nan if missing else val for val, missing in zip(vals, is_missing)]
+    )
+
+
+def _classify_winloss_values(
+    flat_vals: np.ndarray | list, data_table: DataFrameLike
+) -> np.ndarray:
+    """
+    Classify all the games of a flattened win/loss column in a single pass.
+
+    Each game becomes `1` (win), `0.5` (tie), `0` (loss), or `NaN` if it is missing or invalid.
+    Invalid values are warned about once here, instead of on every render.
+    """
+    # Games that are all numbers or None are converted at once, others are checked one by one
+    if isinstance(flat_vals, np.ndarray) or all(
+        issubclass(val_type, numbers.Real) or val_type is type(None)
+        for val_type in set(map(type, flat_vals))
+    ):
+        values = np.asarray(flat_vals, dtype=float)
+    else:
+        values = np.array(
+            [_winloss_value(val, data_table) for val in flat_vals], dtype=float
+        )
+
+    is_missing = np.isnan(values)
+    is_valid = np.isin(values, [0, 0.5, 1])
+
+    for i in np.flatnonzero(~is_valid & ~is_missing):
+        warnings.warn(
+            f"Invalid value '{flat_vals[i]}' encountered in win/loss data. Skipping.",
+            category=UserWarning,
+        )
+
+    outcomes = np.where(is_valid, values, np.nan)
+
+    return outcomes
+
+
+def _winloss_value(val, data_table: DataFrameLike) -> float:
+    """
+    Return a game as a float, `NaN` if it is missing, or `inf` if it can never be an outcome.
+    """
+    if isinstance(val, numbers.Real):
+        return float(val)
+
+    # Only pandas has missing values besides None, such as `pd.NA` in object columns
+    if val is None or (
+        is_pandas_dataframe(data_table) and is_na(data_table, val) is True
+    ):
+        return np.nan
+
+    # Other values, such as the string "1", are never valid outcomes
+    return np.inf
+
+
+def _aggregate_winloss(
+    outcomes: np.ndarray,
+    offsets: np.ndarray,
+    max_length: int,
+    n_windows: int,
+) -> np.ndarray:
+    """
+    Find the win share of every window of consecutive games, for all rows at once.
+
+    Game `i` of every row falls in window `i * n_windows // max_length`, so windows line up
+    across rows. Ties count as half a win. Returns an array of shape `(n_rows, n_windows)`, with
+    NaN for windows without valid games.
+    """
+    n_rows = len(offsets) - 1
+    row_ids = np.repeat(np.arange(n_rows), np.diff(offsets))
+    positions = np.arange(len(outcomes)) - offsets[row_ids]
+
+    is_valid = ~np.isnan(outcomes)
+    windows = row_ids * n_windows + positions * n_windows // max_length
+    windows = windows[is_valid]
+
+    games = np.bincount(windows, minlength=n_rows * n_windows)
+    wins = np.bincount(
+        windows, weights=outcomes[is_valid], minlength=n_rows * n_windows
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (wins / games).reshape(n_rows, n_windows)
+
+
+def _find_outcome_runs(
+    outcomes: np.ndarray,
+    outcome: float,
+    merge_adjacent: bool,
+) -> list[tuple[int, int]]:
+    """
+    Find the (start, length) of the runs of `outcome` in a row of win/loss outcomes.
+
+    If `merge_adjacent` is `False`, every game is its own run of length 1.
+    """
+    positions = np.flatnonzero(outcomes == outcome)
+    if not merge_adjacent or len(positions) == 0:
+        return [(int(pos), 1) for pos in positions]
+
+    # A new run starts wherever the position jumps by more than one game
+    run_breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    run_starts = positions[np.concatenate([[0], run_breaks])]
+    run_ends = positions[np.concatenate([run_breaks - 1, [len(positions) - 1]])]
+
+    return [
+        (int(start), int(end - start + 1)) for start, end in zip(run_starts, run_ends)
+    ]
+
+
+def _lttb_downsample(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    offsets: np.ndarray,
+    threshold: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Downsample every row of a flattened column of series with Largest-Triangle-Three-Buckets.
+
+    Rows with more than `threshold` points keep their first and last points, and one point from
+    each of `threshold - 2` buckets in between: the point forming the largest triangle with the
+    point kept from the previous bucket and the average of the next bucket. Each bucket is
+    processed for all rows at once, so the number of Python iterations depends on `threshold`
+    rather than on the number or length of the series.
+
+    Returns the x values, y values, and offsets of the kept points.
+    """
+    lengths = np.diff(offsets)
+    n_rows = len(lengths)
+    row_ids = np.repeat(np.arange(n_rows), lengths)
+
+    long_rows = np.flatnonzero(lengths > threshold)
+    if len(long_rows) == 0:
+        return xs, ys, offsets
+
+    starts = offsets[long_rows]
+    ends = starts + lengths[long_rows] - 1
+    n_buckets = threshold - 2
+
+    # The first and last points are always kept, and the rest are split into equal buckets
+    bucket_edges = (
+        starts[:, None]
+        + 1
+        + (np.arange(n_buckets + 1) * (lengths[long_rows, None] - 2)) // n_buckets
+    )
+
+    # The average point of every bucket, from cumulative sums over the flattened series
+    x_sums = np.concatenate([[0], np.cumsum(xs)])
+    y_sums = np.concatenate([[0], np.cumsum(ys)])
+    bucket_sizes = np.diff(bucket_edges, axis=1)
+    x_means = (
+        x_sums[bucket_edges[:, 1:]] - x_sums[bucket_edges[:, :-1]]
+    ) / bucket_sizes
+    y_means = (
+        y_sums[bucket_edges[:, 1:]] - y_sums[bucket_edges[:, :-1]]
+    ) / bucket_sizes
+
+    # The last bucket looks ahead to the last point instead of to a next bucket
+    next_x = np.column_stack([x_means[:, 1:], xs[ends]])
+    next_y = np.column_stack([y_means[:, 1:], ys[ends]])
+
+    selected = np.empty((len(long_rows), n_buckets), dtype=np.int64)
+    previous = starts
+    for j in range(n_buckets):
+        sizes = bucket_sizes[:, j]
+        segment_starts = np.cumsum(sizes) - sizes
+        segments = np.repeat(np.arange(len(long_rows)), sizes)
+        candidates = (
+            np.repeat(bucket_edges[:, j], sizes)
+            + np.arange(sizes.sum())
+            - np.repeat(segment_starts, sizes)
+        )
+
+        ax = xs[previous][segments]
+        ay = ys[previous][segments]
+        cx = next_x[segments, j]
+        cy = next_y[segments, j]
+        areas = np.abs(
+            (ax - cx) * (ys[candidates] - ay) - (ax - xs[candidates]) * (cy - ay)
+        )
+
+        # Sort by row, then by decreasing area, and take the first candidate of each row
+        order = np.lexsort((-areas, segments))
+        previous = candidates[order[segment_starts]]
+        selected[:, j] = previous
+
+    keep = np.ones(len(xs), dtype=bool)
+    keep[np.isin(row_ids, long_rows)] = False
+    keep[starts] = True
+    keep[ends] = True
+    keep[selected.ravel()] = True
+
+    kept_offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(row_ids[keep], minlength=n_rows))]
+    )
+
+    return xs[keep], ys[keep], kept_offsets
+
+
+def _row_min_max(
+    values: np.ndarray, offsets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the minimum and maximum of each row of a flattened column, with NaN for empty rows.
+    """
+    lengths = np.diff(offsets)
+    row_min = np.full(len(lengths), np.nan)
+    row_max = np.full(len(lengths), np.nan)
+
+    non_empty = lengths > 0
+    if non_empty.any():
+        row_starts = offsets[:-1][non_empty]
+        row_min[non_empty] = np.minimum.reduceat(values, row_starts)
+        row_max[non_empty] = np.maximum.reduceat(values, row_starts)
+
+    return row_min, row_max
+
+
+def _bin_rows(
+    positions: np.ndarray, row_ids: np.ndarray, n_rows: int, bins: int
+) -> np.ndarray:
+    """
+    Count the values of every row into `bins` equal bins over [0, 1], in one pass.
+
+    Returns an array of shape `(n_rows, bins)`. A position of exactly 1 falls in the last bin.
+    """
+    bin_ids = np.clip((positions * bins).astype(np.int64), 0, bins - 1)
+    counts = np.bincount(row_ids * bins + bin_ids, minlength=n_rows * bins)
+    return counts.reshape(n_rows, bins)
+
+
+# The number of points each density curve is estimated at
+DENSITY_GRID_POINTS = 64
+
+
+@_profile_stage("scaling")
+def _binned_density(
+    positions: np.ndarray,
+    row_ids: np.ndarray,
+    n_rows: int,
+    bandwidths: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Estimate the density of every row at evenly spaced points over [0, 1].
+
+    The values of each row are counted into a fine grid of bins, and the counts are smoothed with
+    a Gaussian kernel of the row's bandwidth. Each shift of the kernel is applied to all rows at
+    once. If `bandwidths` is `None`, each row uses Scott's rule. Returns an array of shape
+    `(n_rows, DENSITY_GRID_POINTS)`, with each row scaled to a maximum of 1 and NaN for rows
+    without values.
+    """
+    n_points = DENSITY_GRID_POINTS
+    counts = _bin_rows(positions, row_ids, n_rows, n_points).astype(float)
+    step = 1 / (n_points - 1)
+
+    if bandwidths is None:
+        lengths = np.bincount(row_ids, minlength=n_rows)
+        sums = np.bincount(row_ids, weights=positions, minlength=n_rows)
+        squares = np.bincount(row_ids, weights=positions**2, minlength=n_rows)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / lengths
+            variances = np.maximum(squares / lengths - means**2, 0)
+            bandwidths = np.sqrt(variances * lengths / np.maximum(lengths - 1, 1))
+            bandwidths *= lengths ** (-1 / 5)
+
+    # A row with one distinct value has no spread, so smooth it over one grid step
+    bandwidths = np.where(np.nan_to_num(bandwidths) > 0, bandwidths, step)
+
+    density = np.zeros_like(counts)
+    for shift in range(-(n_points - 1), n_points):
+        weights = np.exp(-0.5 * (shift * step / bandwidths) ** 2)
+        if shift >= 0:
+            density[:, shift:] += counts[:, : n_points - shift] * weights[:, None]
+        else:
+            density[:, :shift] += counts[:, -shift:] * weights[:, None]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return density / density.max(axis=1, keepdims=True)
+
+
+@_profile_stage("scaling")
+def _boxplot_stats(
+    positions: np.ndarray, row_ids: np.ndarray, n_rows: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the whiskers, quartiles and outliers of every row of a flattened column at once.
+
+    Returns an array of shape `(n_rows, 5)` holding the lower whisker, first quartile, median,
+    third quartile and upper whisker of each row (NaN for rows without values), and the offsets
+    and values of each row's outliers. The whiskers reach the most extreme values within 1.5
+    times the interquartile range of the quartiles.
+    """
+    order = np.lexsort((positions, row_ids))
+    values, row_ids = positions[order], row_ids[order]
+    lengths = np.bincount(row_ids, minlength=n_rows)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    has_values = lengths > 0
+    starts = offsets[:-1][has_values]
+    last = lengths[has_values] - 1
+
+    stats = np.full((n_rows, 5), np.nan)
+    for i, q in enumerate((0.25, 0.5, 0.75), start=1):
+        # Linear interpolation between the closest ranks, as numpy.quantile does by default
+        rank = q * last
+        below = np.floor(rank).astype(np.int64)
+        above = np.minimum(below + 1, last)
+        fraction = rank - below
+        stats[has_values, i] = (
+            values[starts + below] * (1 - fraction) + values[starts + above] * fraction
+        )
+
+    iqr = stats[:, 3] - stats[:, 1]
+    lower_fence = (stats[:, 1] - 1.5 * iqr)[row_ids]
+    upper_fence = (stats[:, 3] + 1.5 * iqr)[row_ids]
+    is_inside = (values >= lower_fence) & (values <= upper_fence)
+
+    # The quartiles lie within the fences, so every row with values has some inside them
+    inside_offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(row_ids[is_inside], minlength=n_rows))]
+    )
+    stats[:, 0], stats[:, 4] = _row_min_max(values[is_inside], inside_offsets)
+
+    outlier_offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(row_ids[~is_inside], minlength=n_rows))]
+    )
+
+    return stats, outlier_offsets, values[~is_inside]
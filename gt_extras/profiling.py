@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterator, TypeVar
+
+__all__ = ["profile", "ProfileReport"]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The stages that gt-extras internals are instrumented with
+STAGES = (
+    "column_resolution",
+    "scaling",
+    "color_mapping",
+    "svg_building",
+    "icon_generation",
+    "image_encoding",
+)
+
+# The report currently collecting timings, scoped to the thread or task that opened it.
+# `gt_grid_layout()` copies the context into its worker threads, so their renders are recorded too.
+_ACTIVE_REPORT: ContextVar[ProfileReport | None] = ContextVar(
+    "_ACTIVE_REPORT", default=None
+)
+
+
+@dataclass
+class _StageStats:
+    calls: int = 0
+    total_time: float = 0.0
+
+
+class ProfileReport:
+    """
+    Timings and call counts collected by [`profile()`](https://posit-dev.github.io/gt-extras/reference/profile).
+
+    Methods
+    -------
+    to_dict()
+        Returns the per-stage and per-function statistics as a dictionary.
+
+    to_chrome_trace()
+        Returns the recorded calls as a Chrome trace, optionally writing it to a JSON file that
+        can be opened in `chrome://tracing` or [Perfetto](https://ui.perfetto.dev).
+    """
+
+    def __init__(self):
+        self._stages: dict[str, _StageStats] = {}
+        self._functions: dict[str, _StageStats] = {}
+        self._formatters: dict[str, int] = {}
+        self._events: list[dict[str, Any]] = []
+        self._origin = perf_counter()
+        self._lock = threading.Lock()
+
+    def _record(self, category: str, name: str, start: float, duration: float):
+        with self._lock:
+            stats = self._stages.setdefault(category, _StageStats())
+            stats.calls += 1
+            stats.total_time += duration
+
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    def _record_function(
+        self, name: str, start: float, duration: float, n_formatters: int
+    ):
+        with self._lock:
+            stats = self._functions.setdefault(name, _StageStats())
+            stats.calls += 1
+            stats.total_time += duration
+            self._formatters[name] = self._formatters.get(name, 0) + n_formatters
+
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": "function",
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"formatters": n_formatters},
+                }
+            )
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        """
+        Summarize the recorded timings.
+
+        Returns
+        -------
+        dict
+            A dictionary with a `"stages"` entry, holding the call count and total time in seconds
+            of each instrumented internal stage, and a `"functions"` entry, holding the call count,
+            total time, and number of formatters registered by each public function.
+        """
+        with self._lock:
+            return {
+                "stages": {
+                    stage: {"calls": stats.calls, "total_time": stats.total_time}
+                    for stage, stats in self._stages.items()
+                },
+                "functions": {
+                    name: {
+                        "calls": stats.calls,
+                        "total_time": stats.total_time,
+                        "formatters": self._formatters[name],
+                    }
+                    for name, stats in self._functions.items()
+                },
+            }
+
+    def to_chrome_trace(self, file: str | Path | None = None) -> dict[str, Any]:
+        """
+        Export the recorded calls in the Chrome trace event format.
+
+        Parameters
+        ----------
+        file
+            If provided, the path of a JSON file to write the trace to.
+
+        Returns
+        -------
+        dict
+            The trace, with one complete (`"ph": "X"`) event per recorded call.
+        """
+        with self._lock:
+            trace = {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+
+        if file is not None:
+            Path(file).write_text(json.dumps(trace), encoding="utf-8")
+
+        return trace
+
+
+@contextmanager
+def profile() -> Iterator[ProfileReport]:
+    """
+    Record where gt-extras spends time within a block of code.
+
+    Inside the `with` block, gt-extras records the time and call count of its internal stages:
+    column resolution, scaling, color mapping, SVG building, icon generation, and image encoding.
+    It also records how many formatters each function registers on the table. Most glyphs are
+    built when the table is rendered, so include the call to `as_raw_html()` (or the display of
+    the table) inside the block.
+
+    Outside of a `profile()` block the instrumentation is a no-op.
+
+    Returns
+    -------
+    ProfileReport
+        A report that is filled in as the block runs. Use `.to_dict()` for a summary, or
+        `.to_chrome_trace()` to export a trace viewable in `chrome://tracing`.
+
+    Examples
+    --------
+    ```{python}
+    from great_tables import GT
+    from great_tables.data import gtcars
+    import gt_extras as gte
+
+    gtcars_mini = gtcars.loc[0:8, ["model", "mfr", "hp", "trq", "mpg_c"]]
+
+    with gte.profile() as report:
+        gt = GT(gtcars_mini).pipe(gte.gt_plt_bar, columns=["hp", "trq"])
+        gt.as_raw_html()
+
+    report.to_dict()
+    ```
+    """
+    report = ProfileReport()
+    token = _ACTIVE_REPORT.set(report)
+    try:
+        yield report
+    finally:
+        _ACTIVE_REPORT.reset(token)
+
+
+def _profile_stage(stage: str) -> Callable[[F], F]:
+    """
+    Decorate an internal helper so that its calls are recorded under `stage` while profiling.
+    """
+    if stage not in STAGES:
+        raise ValueError(f"Unknown profiling stage: {stage}")
+
+    def decorator(fn: F) -> F:
+        name = fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            report = _ACTIVE_REPORT.get()
+            if report is None:
+                return fn(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                report._record(stage, name, start, perf_counter() - start)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def _profile_function(fn: F) -> F:
+    """
+    Decorate a public function that returns a `GT`, recording its time and the number of
+    formatters it registers while profiling.
+    """
+    name = fn.__name__
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        report = _ACTIVE_REPORT.get()
+        if report is None:
+            return fn(*args, **kwargs)
+
+        gt = args[0] if args else kwargs.get("gt")
+        n_before = len(getattr(gt, "_formats", ()))
+
+        start = perf_counter()
+        res = fn(*args, **kwargs)
+        duration = perf_counter() - start
+
+        n_formatters = len(getattr(res, "_formats", ())) - n_before
+        report._record_function(name, start, duration, n_formatters)
+
+        return res
+
+    return wrapper  # type: ignore
@@ -11,7 +11,13 @@ from great_tables import GT, loc, style
 from narwhals.stable.v1.typing import IntoDataFrame, IntoDataFrameT
 from svg import SVG, Element, G, Line, Rect, Style, Text
 
-from gt_extras._utils_column import _format_numeric_text
+from gt_extras._utils_column import (
+    _format_numeric_text,
+    _register_within_render_budget,
+)
+from gt_extras._utils_svg import _round_number
+from gt_extras.options import _resolve_precision
+from gt_extras.profiling import _profile_function, _profile_stage
 from gt_extras.themes import gt_theme_espn
 
 __all__ = ["gt_plt_summary"]
@@ -30,6 +36,7 @@ PLOT_HEIGHT_RATIO = 0.8
 FONT_SIZE_RATIO = 0.2  # height_px / 5
 
 
+@_profile_function
 def gt_plt_summary(
     df: IntoDataFrame,
     title: str | None = None,
@@ -37,6 +44,7 @@ def gt_plt_summary(
     add_mode: bool = False,
     interactivity: bool = True,
     new_color_mapping: dict | None = None,
+    precision: int | None = None,
 ) -> GT:
     """
     Create a comprehensive data summary table with visualizations.
@@ -72,6 +80,13 @@ def gt_plt_summary(
         A dictionary that maps data types (string, numeric, datetime, boolean, and other) to their
         corresponding color codes in hexadecimal format.
 
+    precision
+        The number of decimal places to round the coordinates and sizes in each SVG to, which
+        shortens the HTML of large tables without visibly changing the plots. If `None`, the
+        global `precision` option set with
+        [`set_options()`](https://posit-dev.github.io/gt-extras/reference/set_options) is used,
+        which by default writes them at full precision.
+
     Returns
     -------
     GT
@@ -176,6 +191,8 @@ def gt_plt_summary(
     summary table. Keep in mind that sometimes pandas or polars have differing behaviors with
     datatypes, especially when null values are present.
     """
+    precision = _resolve_precision(precision)
+
     summary_df = _create_summary_df(
         df, show_desc_stats=show_desc_stats, add_mode=add_mode
     )
@@ -238,26 +255,37 @@ def gt_plt_summary(
 
     gt = gt_theme_espn(gt)
 
-    for i, col_name in enumerate(nw_summary_df.get_column("Column")):
-        vals = nw.from_native(df, eager_only=True)[col_name]
-        vals = _clean_series(vals, vals.dtype.is_numeric())
-
-        col_type = nw_summary_df.item(row=i, column="Type")
-        gt = gt.fmt(
-            lambda _,
-            vals=vals,
-            col_type=col_type,
-            plot_id="id" + str(i): _make_summary_plot(
-                nw_series=vals,
+    def _register(interactivity: bool, precision: int | None) -> GT:
+        registered = gt
+        for i, col_name in enumerate(nw_summary_df.get_column("Column")):
+            vals = nw.from_native(df, eager_only=True)[col_name]
+            vals = _clean_series(vals, vals.dtype.is_numeric())
+
+            col_type = nw_summary_df.item(row=i, column="Type")
+            registered = registered.fmt(
+                lambda _,
+                vals=vals,
                 col_type=col_type,
-                plot_id=plot_id,
-                color_mapping=color_mapping,
-                interactivity=interactivity,
-            ),
-            columns="Plot Overview",
-            rows=i,
-        )
-    return gt
+                plot_id="id" + str(i): _make_summary_plot(
+                    nw_series=vals,
+                    col_type=col_type,
+                    plot_id=plot_id,
+                    color_mapping=color_mapping,
+                    interactivity=interactivity,
+                    precision=precision,
+                ),
+                columns="Plot Overview",
+                rows=i,
+            )
+        return registered
+
+    return _register_within_render_budget(
+        "gt_plt_summary",
+        n_cells=len(nw_summary_df),
+        register=_register,
+        interactivity=interactivity,
+        precision=precision,
+    )
 
 
 ############### Helpers for gt_plt_summary ###############
@@ -366,6 +394,7 @@ def _make_summary_plot(
     plot_id: str,
     color_mapping: dict[str, str],
     interactivity: bool = True,
+    precision: int | None = None,
 ) -> str:
     if len(nw_series) == 0:
         return "<div></div>"
@@ -378,6 +407,7 @@ def _make_summary_plot(
             plot_id=plot_id,
             interactivity=interactivity,
             color_mapping=color_mapping,
+            precision=precision,
         )
     elif col_type == "numeric":
         return _plot_numeric(
@@ -385,6 +415,7 @@ def _make_summary_plot(
             plot_id=plot_id,
             interactivity=interactivity,
             color_mapping=color_mapping,
+            precision=precision,
         )
     elif col_type == "datetime":
         return _plot_datetime(
@@ -392,6 +423,7 @@ def _make_summary_plot(
             plot_id=plot_id,
             interactivity=interactivity,
             color_mapping=color_mapping,
+            precision=precision,
         )
     elif col_type == "boolean":
         return _plot_boolean(
@@ -399,6 +431,7 @@ def _make_summary_plot(
             plot_id=plot_id,
             interactivity=interactivity,
             color_mapping=color_mapping,
+            precision=precision,
         )
     else:
         return "<div></div>"
@@ -409,6 +442,7 @@ def _plot_categorical(
     plot_id: str,
     color_mapping: dict[str, str],
     interactivity: bool = True,
+    precision: int | None = None,
 ) -> str:
     category_counts = {}
     for item in data:
@@ -433,6 +467,7 @@ def _plot_categorical(
         categories=categories,
         counts=counts,
         interactivity=interactivity,
+        precision=precision,
     )
 
     return svg.as_str()
@@ -443,6 +478,7 @@ def _plot_boolean(
     plot_id: str,
     color_mapping: dict[str, str],
     interactivity: bool = True,
+    precision: int | None = None,
 ) -> str:
     true_count = sum(data)
     false_count = len(data) - true_count
@@ -476,11 +512,13 @@ def _plot_boolean(
         counts=counts,
         opacities=opacities,
         interactivity=interactivity,
+        precision=precision,
     )
 
     return svg.as_str()
 
 
+@_profile_stage("svg_building")
 def _make_categories_bar_svg(
     width_px: float,
     height_px: float,
@@ -491,7 +529,11 @@ def _make_categories_bar_svg(
     counts: list[int],
     opacities: list[float] | None = None,
     interactivity: bool = True,
+    precision: int | None = None,
 ) -> SVG:
+    def _num(val: float) -> str:
+        return _round_number(val, precision)
+
     plot_width_px = width_px * PLOT_WIDTH_RATIO
     plot_height_px = height_px * PLOT_HEIGHT_RATIO
 
@@ -539,10 +581,10 @@ def _make_categories_bar_svg(
         visual_bar = Rect(
             id=bar_id,
             class_=[visual_bar_class],
-            x=x_loc,
-            y=y_offset,
-            width=section_width,
-            height=plot_height_px,
+            x=_num(x_loc),
+            y=_num(y_offset),
+            width=_num(section_width),
+            height=_num(plot_height_px),
             fill=fill,
             fill_opacity=opacity,
             stroke="transparent",
@@ -579,20 +621,20 @@ def _make_categories_bar_svg(
                 elements=[
                     Text(
                         text=text_top,
-                        x=tooltip_x,
-                        y=font_size_px * 1.25,
+                        x=_num(tooltip_x),
+                        y=_num(font_size_px * 1.25),
                         fill="black",
-                        font_size=font_size_px,
+                        font_size=_num(font_size_px),
                         dominant_baseline="hanging",
                         text_anchor="middle",
                         font_weight="bold",
                     ),
                     Text(
                         text=text_bottom,
-                        x=tooltip_x,
-                        y=font_size_px * 2.5,
+                        x=_num(tooltip_x),
+                        y=_num(font_size_px * 2.5),
                         fill="black",
-                        font_size=font_size_px,
+                        font_size=_num(font_size_px),
                         dominant_baseline="hanging",
                         text_anchor="middle",
                         font_weight="bold",
@@ -602,7 +644,7 @@ def _make_categories_bar_svg(
             elements.append(tooltip)
         x_loc += section_width
 
-    return SVG(height=height_px, width=width_px, elements=elements)
+    return SVG(height=_num(height_px), width=_num(width_px), elements=elements)
 
 
 def _plot_numeric(
@@ -610,6 +652,7 @@ def _plot_numeric(
     plot_id: str,
     color_mapping: dict[str, str],
     interactivity: bool = True,
+    precision: int | None = None,
 ) -> str:
     data_min, data_max = min(data), max(data)
     data_range = data_max - data_min
@@ -662,6 +705,7 @@ def _plot_numeric(
         counts=counts,
         bin_edges=bin_edges,
         interactivity=interactivity,
+        precision=precision,
     )
 
     return svg.as_str()
@@ -672,6 +716,7 @@ def _plot_datetime(
     plot_id: str,
     color_mapping: dict[str, str],
     interactivity: bool = True,
+    precision: int | None = None,
 ) -> str:
     date_timestamps = [x.timestamp() for x in dates]
     data_min, data_max = min(date_timestamps), max(date_timestamps)
@@ -729,11 +774,13 @@ def _plot_datetime(
         counts=counts,
         bin_edges=bin_edges,
         interactivity=interactivity,
+        precision=precision,
     )
 
     return svg.as_str()
 
 
+@_profile_stage("svg_building")
 def _make_histogram_svg(
     width_px: float,
     height_px: float,
@@ -745,7 +792,19 @@ def _make_histogram_svg(
     counts: list[float],
     bin_edges: list[str],
     interactivity: bool = True,
+    compact: bool = False,
+    precision: int | None = None,
 ) -> SVG:
+    """
+    Make a histogram with a mean line and labels for the minimum and maximum.
+
+    With `compact=True` only the axis, mean line and non-empty bars are drawn, without labels,
+    hover areas or element ids, for use as a small glyph repeated in many cells.
+    """
+
+    def _num(val: float) -> str:
+        return _round_number(val, precision)
+
     max_count = max(counts)
     normalized_counts = [c / max_count for c in counts] if max_count > 0 else counts
 
@@ -789,35 +848,59 @@ def _make_histogram_svg(
         # Bottom line
         Line(
             x1=0,
-            x2=width_px,
-            y1=y_loc,
-            y2=y_loc,
+            x2=_num(width_px),
+            y1=_num(y_loc),
+            y2=_num(y_loc),
             stroke="black",
-            stroke_width=line_stroke_width,
+            stroke_width=_num(line_stroke_width),
         ),
         # Mean line
         Line(
-            x1=mean_px,
-            x2=mean_px,
-            y1=y_loc - line_stroke_width / 2,
-            y2=y_loc - max_bar_height_px - line_stroke_width / 2,
+            x1=_num(mean_px),
+            x2=_num(mean_px),
+            y1=_num(y_loc - line_stroke_width / 2),
+            y2=_num(y_loc - max_bar_height_px - line_stroke_width / 2),
             stroke="black",
-            stroke_width=line_stroke_width,
+            stroke_width=_num(line_stroke_width),
         ),
+    ]
+
+    if compact:
+        bars: list[Element] = []
+        for count, normalized_count in zip(counts, normalized_counts):
+            bar_height = normalized_count * max_bar_height_px
+            if count > 0:
+                bars.append(
+                    Rect(
+                        y=_num(y_loc - bar_height - line_stroke_width / 2),
+                        x=_num(x_loc + gap / 2),
+                        width=_num(bin_width_px - gap),
+                        height=_num(bar_height),
+                        fill=fill,
+                    )
+                )
+            x_loc += bin_width_px
+
+        # Draw the bars first, so the lines stay on top of them
+        return SVG(
+            height=_num(height_px), width=_num(width_px), elements=bars + elements
+        )
+
+    elements += [
         Text(
             text=data_min,
-            x=min_text_x,
-            y=height_px,
+            x=_num(min_text_x),
+            y=_num(height_px),
             text_anchor="middle",
-            font_size=font_size_px,
+            font_size=_num(font_size_px),
             dominant_baseline="text-top",
         ),
         Text(
             text=data_max,
-            x=max_text_x,
-            y=height_px,
+            x=_num(max_text_x),
+            y=_num(height_px),
             text_anchor="middle",
-            font_size=font_size_px,
+            font_size=_num(font_size_px),
             dominant_baseline="text-top",
         ),
     ]
@@ -844,10 +927,10 @@ def _make_histogram_svg(
         bar = Rect(
             id=bar_id,
             class_=[bar_class],
-            y=y_loc_bar,
-            x=x_loc + gap / 2,
-            width=bin_width_px - gap,
-            height=bar_height,
+            y=_num(y_loc_bar),
+            x=_num(x_loc + gap / 2),
+            width=_num(bin_width_px - gap),
+            height=_num(bar_height),
             fill=fill,
         )
 
@@ -882,20 +965,20 @@ def _make_histogram_svg(
                 elements=[
                     Text(
                         text=text_top,
-                        x=x_loc_tooltip,
-                        y=font_size_px * 0.25,
+                        x=_num(x_loc_tooltip),
+                        y=_num(font_size_px * 0.25),
                         fill="black",
-                        font_size=font_size_px,
+                        font_size=_num(font_size_px),
                         dominant_baseline="hanging",
                         text_anchor="middle",
                         font_weight="bold",
                     ),
                     Text(
                         text=text_bottom,
-                        x=x_loc_tooltip,
-                        y=font_size_px * 1.5,
+                        x=_num(x_loc_tooltip),
+                        y=_num(font_size_px * 1.5),
                         fill="black",
-                        font_size=font_size_px,
+                        font_size=_num(font_size_px),
                         dominant_baseline="hanging",
                         text_anchor="middle",
                         font_weight="bold",
@@ -908,10 +991,10 @@ def _make_histogram_svg(
         hover_area = Rect(
             id=hover_area_id,
             class_=[hover_area_class],
-            x=x_loc + gap / 2,
+            x=_num(x_loc + gap / 2),
             y=0,
-            width=bin_width_px - gap,
-            height=y_loc_bar,
+            width=_num(bin_width_px - gap),
+            height=_num(y_loc_bar),
             fill="transparent",
             stroke="transparent",
         )
@@ -921,7 +1004,7 @@ def _make_histogram_svg(
         elements.insert(0, hover_area)
         x_loc += bin_width_px
 
-    return SVG(height=height_px, width=width_px, elements=elements)
+    return SVG(height=_num(height_px), width=_num(width_px), elements=elements)
 
 
 def _clean_series(series: nw.Series, is_numeric: bool):
@@ -17,6 +17,15 @@ __all__ = [
 ]
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--payload-budget-update",
+        action="store_true",
+        default=False,
+        help="Record the current HTML payload sizes as the new payload budgets.",
+    )
+
+
 @pytest.fixture(scope="module")
 def mini_gt():
     mini_exibble = exibble.head(3)  # type: ignore
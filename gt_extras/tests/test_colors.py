@@ -235,3 +235,18 @@ def test_gt_color_box_custom_domain(mini_gt):
     assert "background-color:#000000;" in html
     assert "background-color:#56a6da;" in html
     assert "background-color:#9e9e9e;" in html
+
+
+def test_gt_color_box_compact(mini_gt):
+    default_html = gt_color_box(mini_gt, columns="num")._build_data("html")
+    compact_html = gt_color_box(mini_gt, columns="num", compact=True)._build_data(
+        "html"
+    )
+
+    default_cell = default_html._body.body["num"][0]
+    compact_cell = compact_html._body.body["num"][0]
+
+    assert "\n" not in compact_cell
+    assert "min-height:20px;min-width:70px;" in compact_cell
+    assert ">0.1111</div></div></div>" in compact_cell
+    assert len(compact_cell.encode()) < len(default_cell.encode())
@@ -1,3 +1,5 @@
+import io
+
 import numpy as np
 import pandas as pd
 import polars as pl
@@ -6,8 +8,10 @@ from great_tables import GT, google_font, loc, style
 
 from gt_extras.formatting import (
     GTCombinedLayout,
+    _duplicate_columns,
     fmt_pct_extra,
     gt_duplicate_column,
+    gt_grid_layout,
     gt_two_column_layout,
 )
 from gt_extras.tests.conftest import assert_rendered_body
@@ -156,6 +160,51 @@ def test_gt_duplicate_column_invalid_name(mini_gt):
         gt_duplicate_column(mini_gt, column="num", dupe_name="num")
 
 
+def test_gt_duplicate_column_leaves_original_unmodified(mini_gt):
+    original_body_columns = list(mini_gt._body.body.columns)
+    original_boxhead = list(mini_gt._boxhead)
+
+    gt_duplicate_column(mini_gt, column="num")
+
+    assert list(mini_gt._body.body.columns) == original_body_columns
+    assert list(mini_gt._boxhead) == original_boxhead
+
+
+def test_duplicate_columns_batch(mini_gt):
+    res = _duplicate_columns(mini_gt, {"num": "num_a", "currency": "currency_a"})
+
+    assert list(res._tbl_data.columns[-2:]) == ["num_a", "currency_a"]
+    assert list(res._body.body.columns[-2:]) == ["num_a", "currency_a"]
+    assert [col_info.var for col_info in list(res._boxhead)[-2:]] == [
+        "num_a",
+        "currency_a",
+    ]
+    assert "num_a" not in mini_gt._tbl_data.columns
+
+
+def test_duplicate_columns_after_original(mini_gt):
+    res = _duplicate_columns(
+        mini_gt, {"num": "num plot", "currency": "currency plot"}, after_original=True
+    )
+    boxhead_vars = [col_info.var for col_info in res._boxhead]
+
+    assert boxhead_vars.index("num plot") == boxhead_vars.index("num") + 1
+    assert boxhead_vars.index("currency plot") == boxhead_vars.index("currency") + 1
+    assert list(res._tbl_data.columns[-2:]) == ["num plot", "currency plot"]
+
+
+def test_duplicate_columns_shares_buffers():
+    df = pd.DataFrame({"num": np.arange(5.0), "char": list("abcde")})
+    res = _duplicate_columns(GT(df), {"num": "num_dupe"})
+
+    assert np.shares_memory(res._tbl_data["num_dupe"].to_numpy(), df["num"].to_numpy())
+
+
+def test_duplicate_columns_missing_column(mini_gt):
+    with pytest.raises(ValueError, match="Column 'missing' not found in boxhead."):
+        _duplicate_columns(mini_gt, {"missing": "missing_dupe"})
+
+
 @pytest.fixture
 def two_dfs():
     df1 = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
@@ -256,6 +305,36 @@ def test_gt_two_column_layout_with_styles(two_dfs):
     assert 'style="width:100%; font-family: Chivo;font-weight: bold;"' in html
 
 
+def test_gt_two_column_layout_renders_each_table_once(two_dfs, monkeypatch):
+    df1, df2 = two_dfs
+    gt1 = GT(df1).tab_header(title="Header 1", subtitle="Subtitle 1")
+    gt2 = GT(df2).tab_header(title="Header 2", subtitle="Subtitle 2")
+
+    calls = []
+    original = GT.as_raw_html
+
+    def counting_as_raw_html(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(GT, "as_raw_html", counting_as_raw_html)
+    gt_two_column_layout(gt1, gt2, table_header_from=1)
+
+    assert len(calls) == 2
+
+
+def test_gt_two_column_layout_header_classes(two_dfs):
+    df1, df2 = two_dfs
+    gt1 = GT(df1).tab_header(title="Header 1", subtitle="Subtitle 1")
+    gt2 = GT(df2)
+
+    html = str(gt_two_column_layout(gt1, gt2, table_header_from=1))
+
+    assert 'class="gt_table gt_heading gt_title gt_font_normal"' in html
+    assert 'class="gt_table gt_heading gt_subtitle gt_font_normal"' in html
+    assert "#mycombinedtable div {" in html
+
+
 def test_gt_combined_layout_repr_html():
     html = "<div>hello world</div>"
     layout = GTCombinedLayout(html)
@@ -266,10 +345,8 @@ def test_gt_two_column_layout_save_target(two_dfs):
     df1, df2 = two_dfs
     gt1 = GT(df1)
     gt2 = GT(df2)
-    with pytest.raises(
-        NotImplementedError,
-        match="At the moment, only notebook and browser display options are available.",
-    ):
+    # Layouts are saved with `.save()`, which needs a file to write to
+    with pytest.raises(Exception, match="Unknown target display"):
         gt_two_column_layout(gt1, gt2, target="save")  # type: ignore
 
 
@@ -281,14 +358,14 @@ def test_gt_two_column_layout_invalid_target(two_dfs):
         gt_two_column_layout(gt1, gt2, target="invalid")  # type: ignore
 
 
-def test_gt_combined_layout_save_incomplete(two_dfs):
+def test_gt_two_column_layout_save(tmp_path, two_dfs):
     df1, df2 = two_dfs
     gt1 = GT(df1)
     gt2 = GT(df2)
     gt_combined = gt_two_column_layout(gt1, gt2)
 
-    with pytest.raises(NotImplementedError):
-        gt_combined.save()
+    f_path = gt_combined.save(tmp_path / "combined.html")
+    assert f_path.read_text(encoding="utf-8") == str(gt_combined)
 
 
 @pytest.mark.xfail(reason="Notebook target test not implemented yet")
@@ -299,3 +376,114 @@ def test_gt_two_column_layout_notebook_target():
 @pytest.mark.xfail(reason="Browser target test not implemented yet")
 def test_gt_two_column_layout_browser_target():
     assert False
+
+
+def test_gt_combined_layout_save(tmp_path):
+    layout = GTCombinedLayout("<div>hello world</div>")
+    f_path = layout.save(tmp_path / "layout.html")
+
+    assert f_path.read_text(encoding="utf-8") == "<div>hello world</div>"
+
+
+def test_gt_combined_layout_parts():
+    layout = GTCombinedLayout(["<div>", "hello world", "</div>"])
+    assert str(layout) == "<div>hello world</div>"
+    assert layout.html_content == "<div>hello world</div>"
+
+
+def test_gt_combined_layout_set_html_content():
+    layout = GTCombinedLayout(["<div>", "hello world", "</div>"])
+    layout.html_content = "<p>bye</p>"
+
+    assert layout.html_content == "<p>bye</p>"
+    assert str(layout) == "<p>bye</p>"
+
+
+def test_gt_combined_layout_write_to_chunks():
+    class RecordingWriter(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = []
+
+        def write(self, s):
+            self.writes.append(s)
+            return super().write(s)
+
+    layout = GTCombinedLayout(["<div>", "hello world", "</div>"])
+    writer = RecordingWriter()
+    layout.write_to(writer, chunk_size=4)
+
+    assert writer.getvalue() == "<div>hello world</div>"
+    assert max(len(chunk) for chunk in writer.writes) <= 4
+    assert writer.writes[:2] == ["<div", ">"]
+
+
+def test_gt_combined_layout_write_to_invalid_chunk_size():
+    layout = GTCombinedLayout("<div>hello world</div>")
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer."):
+        layout.write_to(io.StringIO(), chunk_size=0)
+
+
+def test_gt_two_column_layout_write_to_matches_str(two_dfs):
+    df1, df2 = two_dfs
+    gt1 = GT(df1).tab_header(title="Header 1", subtitle="Subtitle 1")
+    gt2 = GT(df2)
+    result = gt_two_column_layout(gt1, gt2, table_header_from=1)
+
+    buffer = io.StringIO()
+    result.write_to(buffer, chunk_size=128)
+    assert buffer.getvalue() == str(result)
+
+
+@pytest.fixture
+def four_gts(two_dfs):
+    df1, df2 = two_dfs
+    return [
+        GT(df1, id="grid1").tab_header(title="Grid 1"),
+        GT(df2, id="grid2").tab_header(title="Grid 2"),
+        GT(df1, id="grid3"),
+        GT(df2, id="grid4").opt_stylize(style=3),
+    ]
+
+
+def test_gt_grid_layout_snapshot(snapshot, four_gts):
+    result = gt_grid_layout(four_gts, ncol=2)
+    assert snapshot == str(result)
+
+
+def test_gt_grid_layout_basic(four_gts):
+    html = str(gt_grid_layout(four_gts, ncol=3, gap="2em"))
+
+    assert "grid-template-columns: repeat(3, auto); gap: 2em;" in html
+    assert "Grid 1" in html
+    assert "Grid 2" in html
+    for i in range(1, 5):
+        assert f'<div id="grid{i}" class="gte-grid-style-' in html
+
+
+def test_gt_grid_layout_dedupes_styles(four_gts):
+    html = str(gt_grid_layout(four_gts))
+
+    # The first three tables share default styling, the fourth is stylized
+    assert html.count("<style>") == 2
+    assert '<div id="grid1" class="gte-grid-style-0"' in html
+    assert '<div id="grid3" class="gte-grid-style-0"' in html
+    assert '<div id="grid4" class="gte-grid-style-1"' in html
+    assert "#grid1" not in html
+    assert ".gte-grid-style-0 .gt_table" in html
+
+
+def test_gt_grid_layout_single_worker(four_gts):
+    assert str(gt_grid_layout(four_gts, max_workers=1)) == str(gt_grid_layout(four_gts))
+
+
+def test_gt_grid_layout_invalid_ncol(four_gts):
+    with pytest.raises(ValueError, match="ncol must be a positive integer."):
+        gt_grid_layout(four_gts, ncol=0)
+
+
+def test_gt_grid_layout_save(tmp_path, four_gts):
+    result = gt_grid_layout(four_gts)
+    f_path = result.save(tmp_path / "grid.html")
+
+    assert f_path.read_text(encoding="utf-8") == str(result)
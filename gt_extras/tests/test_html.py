@@ -222,3 +222,31 @@ def test_gt_merge_stack_custom_styles(sample_gt):
     assert html.count("color:blue;") == 4
     assert html.count("color:red;") == 4
     assert html.count("small-caps") == 0
+
+
+def test_gt_merge_stack_compact(sample_gt):
+    default_gt = gt_merge_stack(sample_gt, col1="col1", col2="col2")
+    compact_gt = gt_merge_stack(sample_gt, col1="col1", col2="col2", compact=True)
+
+    default_cell = default_gt._build_data("html")._body.body["col1"][0]
+    compact_cell = compact_gt._build_data("html")._body.body["col1"][0]
+
+    assert compact_cell == (
+        '<div><div style="line-height:14px;">'
+        '<span style="font-weight:bold;font-variant:small-caps;color:black;font-size:14px;">'
+        "AA</span></div>"
+        '<div style="line-height:10px;">'
+        '<span style="font-weight:normal;color:grey;font-size:10px;">XX</span></div></div>'
+    )
+    assert "\n" not in compact_cell
+    assert len(compact_cell.encode()) < len(default_cell.encode()) / 2
+
+
+def test_gt_merge_stack_compact_na_values(sample_gt):
+    gt = gt_merge_stack(sample_gt, col1="col1", col2="col2", compact=True)
+    html = gt.as_raw_html()
+
+    assert html.count("</span>") == 8
+    assert html.count("color:grey;") == 4
+    assert "nan" not in html
+    assert "None" not in html
@@ -83,6 +83,23 @@ def test_img_header_no_border():
     assert "border-bottom:2px solid transparent;" in result.text
 
 
+def test_img_header_compact():
+    default = img_header(label="Test Label", img_url="https://example.com/image.png")
+    result = img_header(
+        label="Test Label", img_url="https://example.com/image.png", compact=True
+    )
+
+    assert isinstance(result, Html)
+    assert result.text == (
+        '<div style="text-align:center;">'
+        '<img src="https://example.com/image.png" style="height:60px;object-fit:contain;'
+        'object-position:bottom;border-bottom:2px solid black;"/>'
+        '<div style="font-size:12px;color:black;text-align:center;width:100%;">'
+        "Test Label</div></div>"
+    )
+    assert len(result.text) < len(default.text)
+
+
 def test_add_text_img_snapshot(snapshot):
     result = add_text_img(
         text="Test Text",
@@ -182,6 +199,19 @@ def test_add_text_img_empty_url():
     assert "src=''" in result
 
 
+def test_add_text_img_compact():
+    default = add_text_img(text="Compact", img_url="https://example.com/image.png")
+    result = add_text_img(
+        text="Compact", img_url="https://example.com/image.png", compact=True
+    )
+
+    assert "\n" not in result
+    assert "flex-direction:row-reverse;" in result
+    assert "height:30px;" in result
+    assert "<div style='flex-grow:1;'>Compact</div>" in result
+    assert len(result) < len(default)
+
+
 def test_gt_fmt_img_circle_snapshot(snapshot):
     df = pd.DataFrame({"img": ["https://www.avatar1.png", "https://www.avatar2.png"]})
     gt_test = GT(df)
@@ -0,0 +1,147 @@
+import copy
+import warnings
+
+import pandas as pd
+import pytest
+from great_tables import GT
+
+import gt_extras as gte
+
+
+def test_get_options_defaults():
+    assert gte.get_options() == {
+        "precision": None,
+        "render_budget_cells": None,
+        "render_budget_bytes": None,
+    }
+
+
+def test_set_options_returns_previous():
+    previous = gte.set_options(precision=2)
+    try:
+        assert previous == {"precision": None}
+        assert gte.get_options()["precision"] == 2
+    finally:
+        gte.set_options(**previous)
+
+    assert gte.get_options()["precision"] is None
+
+
+def test_set_options_unknown():
+    with pytest.raises(ValueError, match=r"Unknown gt-extras options: \['digits'\]"):
+        gte.set_options(digits=2)
+
+
+@pytest.mark.parametrize("precision", [-1, 1.5, "2", True])
+def test_set_options_invalid_precision(precision):
+    with pytest.raises(ValueError, match="Precision must be a non-negative integer"):
+        gte.set_options(precision=precision)
+
+    assert gte.get_options()["precision"] is None
+
+
+def test_global_precision_applies_to_plots():
+    gt = GT(pd.DataFrame({"num": [1, 2, 3]}))
+    exact = gte.gt_plt_donut(gt, columns="num").as_raw_html()
+
+    previous = gte.set_options(precision=1)
+    try:
+        rounded = gte.gt_plt_donut(gt, columns="num").as_raw_html()
+        overridden = gte.gt_plt_donut(gt, columns="num", precision=3).as_raw_html()
+    finally:
+        gte.set_options(**previous)
+
+    assert len(rounded) < len(overridden) < len(exact)
+
+
+@pytest.mark.parametrize("budget", [0, -5, 2.5, True])
+def test_set_options_invalid_render_budget(budget):
+    with pytest.raises(ValueError, match="option must be a positive integer"):
+        gte.set_options(render_budget_cells=budget)
+
+
+def test_render_budget_cells_degrades_once():
+    gt = GT(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+
+    previous = gte.set_options(render_budget_cells=5)
+    try:
+        with pytest.warns(UserWarning) as record:
+            html = gte.gt_plt_bar(
+                gt, columns=["a", "b"], show_labels=True
+            ).as_raw_html()
+    finally:
+        gte.set_options(**previous)
+
+    assert len(record) == 1
+    message = str(record[0].message)
+    assert message.startswith(
+        "gt_plt_bar(): 6 glyph cells exceed the budget of 5 cells"
+    )
+    assert "per-cell labels" in message
+    assert "coordinate precision" in message
+
+    assert "</text>" not in html
+    assert 'width="60px"' in html
+
+
+@pytest.mark.parametrize(
+    "plot, kwargs, labels",
+    [
+        (gte.gt_plt_bar, {"columns": "a", "resolution": 1}, "show_labels"),
+        (gte.gt_plt_donut, {"columns": "a", "resolution": 1}, "show_labels"),
+        (gte.gt_plt_bar_pct, {"column": "a", "resolution": 1}, "labels"),
+    ],
+)
+def test_render_budget_settings_are_registered(plot, kwargs, labels):
+    gt = GT(pd.DataFrame({"a": [1.23456, 2.34567, 3.45678]}), id="budget_table")
+    lean = plot(gt, **kwargs, **{labels: False}, precision=1).as_raw_html()
+
+    previous = gte.set_options(render_budget_cells=2)
+    try:
+        with pytest.warns(UserWarning):
+            res = plot(gt, **kwargs, **{labels: True})
+    finally:
+        gte.set_options(**previous)
+
+    # The leaner settings are bound to the formatters, so they survive a copy of the table
+    assert copy.deepcopy(res).as_raw_html() == lean
+
+
+def test_render_budget_within_budget_unchanged():
+    gt = GT(pd.DataFrame({"a": [1, 2, 3]}), id="budget_table")
+    full = gte.gt_plt_bar(gt, columns="a", show_labels=True).as_raw_html()
+
+    previous = gte.set_options(render_budget_cells=3)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            html = gte.gt_plt_bar(gt, columns="a", show_labels=True).as_raw_html()
+    finally:
+        gte.set_options(**previous)
+
+    assert html == full
+
+
+def test_render_budget_bytes_summary():
+    df = pd.DataFrame({"num": [1.5, 2.2, 3.3, 5.1], "cat": ["a", "b", "a", "c"]})
+
+    previous = gte.set_options(render_budget_bytes=1_000)
+    try:
+        with pytest.warns(UserWarning, match="interactivity CSS and tooltips"):
+            html = gte.gt_plt_summary(df).as_raw_html()
+    finally:
+        gte.set_options(**previous)
+
+    assert ":hover" not in html
+
+
+def test_render_budget_nothing_to_degrade():
+    gt = GT(pd.DataFrame({"a": [1, 2, 3]}))
+
+    previous = gte.set_options(render_budget_cells=1)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            gte.gt_plt_bar(gt, columns="a", precision=0)
+    finally:
+        gte.set_options(**previous)
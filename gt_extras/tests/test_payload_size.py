@@ -0,0 +1,173 @@
+import json
+from pathlib import Path
+
+import narwhals.stable.v1 as nw
+import pandas as pd
+import pytest
+from great_tables import GT
+
+import gt_extras as gte
+
+BUDGETS_PATH = Path(__file__).parent / "payload_budgets.json"
+
+# Allowed growth over the recorded budget before a test fails
+TOLERANCE = 0.05
+
+IMG_URL = "https://posit-dev.github.io/gt-extras/assets/logo.png"
+
+
+@pytest.fixture(scope="module")
+def payload_df():
+    return pd.DataFrame(
+        {
+            "name": [f"row {i}" for i in range(10)],
+            "group": ["a", "b", "c", "a", "b", "c", "a", "b", "c", "a"],
+            "num": [12.5, 40.0, 3.25, 88.0, 51.5, 0.0, 19.75, 66.0, 7.5, 100.0],
+            "other": [20.0, 35.5, 10.0, 70.25, 60.0, 5.0, 25.0, 50.0, 15.0, 90.0],
+            "lo": [10.0, 35.0, 1.0, 80.0, 45.0, -2.0, 15.0, 60.0, 5.0, 95.0],
+            "hi": [15.0, 45.0, 5.5, 96.0, 58.0, 2.0, 24.5, 72.0, 10.0, 105.0],
+            "rating": [0, 1, 2, 3, 4, 5, 4, 3, 2, 1],
+            "change": [3, -2, 0, 1, -5, 4, 0, -1, 2, -3],
+            "img": [IMG_URL] * 10,
+            "winloss": [[1, 0, 0.5, 1, 1, 0, 1, 0, 0, 1]] * 10,
+            "stack": [[3.0, 2.5, 4.5]] * 10,
+            "series": [[float((i * j) % 7) for j in range(200)] for i in range(10)],
+        }
+    )
+
+
+def _render_gt(res: GT, *columns: str) -> tuple[str, list[str]]:
+    html = res.as_raw_html()
+    body = nw.from_native(res._build_data("html")._body.body, eager_only=True)
+    cells = [str(cell) for col in columns for cell in body[col].to_list()]
+    return html, cells
+
+
+def _gt(df, *columns: str) -> GT:
+    return GT(df[list(columns)], id="payload_table")
+
+
+CASES = {
+    # plotting
+    "gt_plt_bar": lambda df: _render_gt(
+        gte.gt_plt_bar(_gt(df, "name", "num"), columns="num"), "num"
+    ),
+    "gt_plt_bar_pct": lambda df: _render_gt(
+        gte.gt_plt_bar_pct(_gt(df, "name", "num"), column="num"), "num"
+    ),
+    "gt_plt_bullet": lambda df: _render_gt(
+        gte.gt_plt_bullet(
+            _gt(df, "name", "num", "other"), data_column="num", target_column="other"
+        ),
+        "num",
+    ),
+    "gt_plt_dot": lambda df: _render_gt(
+        gte.gt_plt_dot(_gt(df, "group", "num"), category_col="group", data_col="num"),
+        "group",
+    ),
+    "gt_plt_conf_int": lambda df: _render_gt(
+        gte.gt_plt_conf_int(
+            _gt(df, "name", "num", "lo", "hi"), column="num", ci_columns=["lo", "hi"]
+        ),
+        "num",
+    ),
+    "gt_plt_dumbbell": lambda df: _render_gt(
+        gte.gt_plt_dumbbell(_gt(df, "name", "num", "other"), col1="num", col2="other"),
+        "num",
+    ),
+    "gt_plt_donut": lambda df: _render_gt(
+        gte.gt_plt_donut(_gt(df, "name", "num"), columns="num"), "num"
+    ),
+    "gt_plt_winloss": lambda df: _render_gt(
+        gte.gt_plt_winloss(_gt(df, "name", "winloss"), column="winloss"), "winloss"
+    ),
+    "gt_plt_bar_stack": lambda df: _render_gt(
+        gte.gt_plt_bar_stack(_gt(df, "name", "stack"), column="stack"), "stack"
+    ),
+    "gt_plt_sparkline": lambda df: _render_gt(
+        gte.gt_plt_sparkline(_gt(df, "name", "series"), column="series"), "series"
+    ),
+    "gt_plt_dist": lambda df: _render_gt(
+        gte.gt_plt_dist(_gt(df, "name", "series"), column="series"), "series"
+    ),
+    # icons
+    "fa_icon_repeat": lambda df: _render_gt(
+        _gt(df, "name", "rating").fmt(
+            lambda x: gte.fa_icon_repeat(repeats=int(x)), columns="rating"
+        ),
+        "rating",
+    ),
+    "gt_fa_rank_change": lambda df: _render_gt(
+        gte.gt_fa_rank_change(_gt(df, "name", "change"), column="change"), "change"
+    ),
+    "gt_fa_rating": lambda df: _render_gt(
+        gte.gt_fa_rating(_gt(df, "name", "rating"), columns="rating"), "rating"
+    ),
+    # images
+    "gt_fmt_img_circle": lambda df: _render_gt(
+        gte.gt_fmt_img_circle(_gt(df, "name", "img"), columns="img", encode=False),
+        "img",
+    ),
+    "img_header": lambda df: _render_gt(
+        _gt(df, "name", "num").cols_label(
+            num=gte.img_header(label="Number", img_url=IMG_URL)
+        )
+    ),
+    "add_text_img": lambda df: _render_gt(
+        _gt(df, "name", "num").fmt(
+            lambda x: gte.add_text_img(text=x, img_url=IMG_URL), columns="name"
+        ),
+        "name",
+    ),
+    # summary
+    "gt_plt_summary": lambda df: _render_gt(
+        gte.gt_plt_summary(df[["name", "group", "num", "other", "rating"]])
+    ),
+}
+
+
+def _measure(name: str, df) -> dict[str, float]:
+    html, cells = CASES[name](df)
+    cell_bytes = [len(cell.encode("utf-8")) for cell in cells]
+
+    return {
+        "total_bytes": len(html.encode("utf-8")),
+        "bytes_per_cell": round(sum(cell_bytes) / len(cell_bytes), 1)
+        if cell_bytes
+        else 0,
+    }
+
+
+@pytest.fixture(scope="module")
+def payload_budgets(request):
+    budgets = json.loads(BUDGETS_PATH.read_text()) if BUDGETS_PATH.exists() else {}
+    yield budgets
+
+    if request.config.getoption("--payload-budget-update"):
+        BUDGETS_PATH.write_text(json.dumps(budgets, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_payload_size(request, name, payload_df, payload_budgets):
+    measured = _measure(name, payload_df)
+
+    if request.config.getoption("--payload-budget-update"):
+        payload_budgets[name] = measured
+        return
+
+    assert name in payload_budgets, (
+        f"No payload budget recorded for {name}. "
+        "Run `pytest --payload-budget-update` to record one."
+    )
+
+    for metric, value in measured.items():
+        budget = payload_budgets[name][metric]
+        assert value <= budget * (1 + TOLERANCE), (
+            f"{name} {metric} grew to {value}, over its budget of {budget} "
+            f"(tolerance {TOLERANCE:.0%}). If the growth is intended, run "
+            "`pytest --payload-budget-update` to record the new size."
+        )
+
+
+def test_payload_budgets_cover_cases(payload_budgets):
+    assert set(payload_budgets) == set(CASES)
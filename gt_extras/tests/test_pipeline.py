@@ -0,0 +1,97 @@
+from functools import partial
+
+import pandas as pd
+import polars as pl
+import pytest
+from great_tables import GT
+
+import gt_extras as gte
+from gt_extras import _utils_column
+
+
+def _plots():
+    return [
+        partial(gte.gt_plt_bar, columns="num"),
+        partial(gte.gt_plt_donut, columns=["num", "other"]),
+        partial(gte.gt_plt_bar_pct, column="other"),
+        partial(gte.gt_color_box, columns="num"),
+        partial(gte.gt_fa_rank_change, column="change"),
+    ]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "name": ["a", "b", "c"],
+            "num": [1.5, None, 30.0],
+            "other": [10, 20, 5],
+            "change": [2, -1, 0],
+        }
+    )
+
+
+@pytest.mark.parametrize("DataFrame", [pd.DataFrame, pl.DataFrame])
+def test_apply_plots_matches_piping(DataFrame, df):
+    gt = GT(DataFrame(df.to_dict(orient="list")), id="plots")
+
+    expected = gt
+    for plot in _plots():
+        expected = expected.pipe(plot)
+
+    result = gte.apply_plots(gt, _plots())
+
+    assert result.as_raw_html() == expected.as_raw_html()
+
+
+def test_apply_plots_reads_each_column_once(monkeypatch, df):
+    reads = []
+    to_list = _utils_column.to_list
+
+    def _counting_to_list(ser):
+        reads.append(ser.name)
+        return to_list(ser)
+
+    monkeypatch.setattr(_utils_column, "to_list", _counting_to_list)
+
+    gte.apply_plots(GT(df), _plots())
+    assert sorted(reads) == ["change", "num", "other"]
+
+    # Outside of apply_plots(), each function reads its columns again
+    reads.clear()
+    gte.gt_plt_bar(gte.gt_plt_donut(GT(df), columns="num"), columns="num")
+    assert reads == ["num", "num"]
+
+
+def test_apply_plots_drops_overwritten_formatters(df):
+    gt = GT(df, id="plots")
+
+    result = gte.apply_plots(
+        gt,
+        [
+            partial(gte.gt_plt_bar, columns="num"),
+            partial(gte.gt_plt_donut, columns="num"),
+            partial(gte.gt_plt_bar_pct, column="other"),
+        ],
+    )
+    expected = gte.gt_plt_bar_pct(
+        gte.gt_plt_donut(gte.gt_plt_bar(gt, columns="num"), columns="num"),
+        column="other",
+    )
+
+    assert len(result._formats) == 2
+    assert len(expected._formats) == 3
+    assert result.as_raw_html() == expected.as_raw_html()
+
+
+def test_apply_plots_keeps_existing_formatters(df):
+    gt = GT(df).fmt_number(columns="num", decimals=1)
+
+    result = gte.apply_plots(gt, [partial(gte.gt_plt_bar, columns="num")])
+
+    assert len(result._formats) == 2
+
+
+def test_apply_plots_non_gt_result(df):
+    with pytest.raises(TypeError, match="Each plot must return a GT object"):
+        gte.apply_plots(GT(df), [lambda gt: gt.as_raw_html()])
@@ -1,7 +1,13 @@
+import copy
+import re
+import warnings
+
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 from great_tables import GT, loc, style
+from great_tables._data_color.palettes import GradientPalette
 
 from gt_extras import (
     gt_plt_bar,
@@ -9,14 +15,52 @@ from gt_extras import (
     gt_plt_bar_stack,
     gt_plt_bullet,
     gt_plt_conf_int,
+    gt_plt_dist,
     gt_plt_donut,
     gt_plt_dot,
     gt_plt_dumbbell,
+    gt_plt_sparkline,
     gt_plt_winloss,
 )
+from gt_extras._polars_glyphs import _format_numbers
+from gt_extras._utils_column import _format_numeric_text
+from gt_extras._utils_svg import _round_number
+from gt_extras.plotting import (
+    _aggregate_winloss,
+    _binned_density,
+    _boxplot_stats,
+    _lttb_downsample,
+)
+from gt_extras.profiling import profile
 from gt_extras.tests.conftest import assert_rendered_body
 
 
+def _extract_svgs(gt: GT) -> list[str]:
+    return re.findall(r"<svg.*?</svg>", gt.as_raw_html())
+
+
+def _render_both_engines(plot, df: pl.DataFrame, **kwargs) -> tuple[str, str]:
+    # Warnings are recorded, so that they can be compared too
+    rendered = []
+    for engine in ("python", "polars"):
+        with warnings.catch_warnings(record=True) as record:
+            warnings.simplefilter("always")
+            html = plot(GT(df, id="engines"), engine=engine, **kwargs).as_raw_html()
+        rendered.append((html, [str(w.message) for w in record]))
+    return rendered[0], rendered[1]
+
+
+@pytest.fixture
+def engines_df():
+    return pl.DataFrame(
+        {
+            "num": [1.5, None, 2.25, float("nan"), 3.333, -1.0, 10.0],
+            "int": [10, 20, None, 5, 0, 15, 30],
+            "other": [2.0, 3.5, None, 1.0, 0.5, 2.75, 12.5],
+        }
+    )
+
+
 def test_gt_plt_bar_snap(snapshot, mini_gt):
     res = gt_plt_bar(gt=mini_gt, columns="num")
 
@@ -73,6 +117,110 @@ def test_gt_plt_bar_keep_columns(mini_gt):
     assert html.count("<svg") == 3
 
 
+def test_gt_plt_bar_keep_columns_multiple():
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+    result = gt_plt_bar(gt=GT(df), columns=["a", "c"], keep_columns=True)
+
+    assert [col_info.var for col_info in result._boxhead] == [
+        "a",
+        "a plot",
+        "b",
+        "c",
+        "c plot",
+    ]
+    assert result.as_raw_html().count("<svg") == 4
+
+
+def test_gt_plt_bar_one_formatter_per_column():
+    df = pd.DataFrame({"a": [1.0, None, 3.0, 4.0], "b": [5, 6, 7, 8]})
+    result = gt_plt_bar(gt=GT(df), columns=["a", "b"])
+
+    assert len(result._formats) == 2
+    assert result.as_raw_html().count("<svg") == 8
+
+
+def test_gt_plt_bar_resolution():
+    df = pd.DataFrame({"num": [100, 50.2, 50.3, 0.1]})
+    html = gt_plt_bar(gt=GT(df), columns="num", width=60, resolution=1).as_raw_html()
+
+    # Both middle values round to a 30px bar, and the smallest to no bar at all
+    assert html.count('width="30.0px"') == 2
+    assert html.count('width="0.0px"') == 1
+    assert html.count('width="60.0px"') == 1
+
+
+def test_gt_plt_bar_resolution_reuses_svg():
+    df = pd.DataFrame({"num": np.linspace(0, 100, 1000)})
+
+    with profile() as report:
+        gt_plt_bar(GT(df), columns="num", width=60, resolution=0.5).as_raw_html()
+
+    assert report.to_dict()["stages"]["svg_building"]["calls"] == 121
+
+
+def test_gt_plt_bar_resolution_cache_cleared_after_render():
+    df = pd.DataFrame({"num": np.linspace(0, 100, 1000)})
+    res = gt_plt_bar(
+        GT(df, id="cache"), columns="num", width=60, resolution=0.5, show_labels=True
+    )
+
+    html = res.as_raw_html()
+
+    # The shared bars are only kept while the table renders
+    assert res._formats[-1].cells.render_caches[0] == {}
+    assert res.as_raw_html() == html
+
+
+def test_gt_plt_bar_precision():
+    df = pd.DataFrame({"num": [100, 33.3333]})
+    html = gt_plt_bar(
+        gt=GT(df), columns="num", width=60, show_labels=True, precision=1
+    ).as_raw_html()
+
+    assert 'width="20px"' in html
+    assert 'width="60px"' in html
+    assert 'x="19.6px"' in html
+
+    # Labels are text, not coordinates, so they are never rounded
+    assert ">33.3333</text>" in html
+
+
+def test_gt_plt_bar_css_renderer():
+    df = pd.DataFrame({"num": [100, 25]})
+    html = gt_plt_bar(
+        gt=GT(df), columns="num", width=60, renderer="css", show_labels=True
+    ).as_raw_html()
+
+    assert "<svg" not in html
+    assert "border-left:1.5px solid black;" in html
+    assert "width:100.0%;height:20px;background:purple;" in html
+    assert "width:25.0%;height:20px;background:purple;" in html
+    assert ">100</div>" in html
+
+
+def test_gt_plt_bar_css_renderer_smaller_than_svg(mini_gt):
+    svg = gt_plt_bar(gt=mini_gt, columns="num").as_raw_html()
+    css = gt_plt_bar(gt=mini_gt, columns="num", renderer="css").as_raw_html()
+
+    assert len(css) < len(svg)
+
+
+def test_gt_plt_bar_invalid_renderer(mini_gt):
+    with pytest.raises(ValueError, match="Renderer must be either 'svg' or 'css'."):
+        gt_plt_bar(gt=mini_gt, columns="num", renderer="canvas")
+
+
+def test_gt_plt_bar_invalid_precision(mini_gt):
+    with pytest.raises(ValueError, match="Precision must be a non-negative integer"):
+        gt_plt_bar(gt=mini_gt, columns="num", precision=-1)
+
+
+@pytest.mark.parametrize("resolution", [0, -1])
+def test_gt_plt_bar_invalid_resolution(mini_gt, resolution):
+    with pytest.raises(ValueError, match="Resolution must be a positive number"):
+        gt_plt_bar(gt=mini_gt, columns="num", resolution=resolution)
+
+
 def test_gt_plt_bar_show_labels_false(mini_gt):
     result = gt_plt_bar(gt=mini_gt, columns=["num"], show_labels=False)
     html = result.as_raw_html()
@@ -85,11 +233,81 @@ def test_gt_plt_bar_no_stroke_color(mini_gt):
     assert html.count('line stroke="transparent"') == 3
 
 
+def test_gt_plt_bar_deepcopy(mini_gt):
+    res = gt_plt_bar(gt=mini_gt, columns="num", show_labels=True)
+
+    assert copy.deepcopy(res).as_raw_html() == res.as_raw_html()
+
+
 def test_gt_plt_bar_type_error(mini_gt):
     with pytest.raises(TypeError, match="Invalid column type provided"):
         gt_plt_bar(gt=mini_gt, columns=["char"])
 
 
+@pytest.mark.parametrize("precision", [None, 0, 1, 2])
+def test_gt_plt_bar_polars_engine_matches_python(engines_df, precision):
+    python_res, polars_res = _render_both_engines(
+        gt_plt_bar,
+        engines_df,
+        columns=["num", "int"],
+        show_labels=True,
+        precision=precision,
+    )
+    assert polars_res == python_res
+
+
+def test_gt_plt_bar_polars_engine_domain_and_keep_columns(engines_df):
+    python_res, polars_res = _render_both_engines(
+        gt_plt_bar, engines_df, columns="num", domain=[0, 3], keep_columns=True
+    )
+    assert polars_res == python_res
+    assert len(polars_res[1]) == 3
+
+
+def test_gt_plt_bar_polars_engine_builds_html_up_front(engines_df):
+    res = gt_plt_bar(GT(engines_df), columns="int", engine="polars")
+
+    assert len(res._formats) == 1
+    assert len(_extract_svgs(res)) == len(engines_df)
+
+
+def test_gt_plt_bar_polars_engine_invalid(mini_gt, engines_df):
+    with pytest.raises(ValueError, match="Engine must be either"):
+        gt_plt_bar(GT(engines_df), columns="num", engine="rust")
+    with pytest.raises(ValueError, match="requires a table built from a polars"):
+        gt_plt_bar(mini_gt, columns="num", engine="polars")
+    with pytest.raises(ValueError, match="only supports the 'svg' renderer"):
+        gt_plt_bar(GT(engines_df), columns="num", renderer="css", engine="polars")
+    with pytest.raises(TypeError, match="Invalid column type provided"):
+        gt_plt_bar(GT(pl.DataFrame({"x": ["a"]})), columns="x", engine="polars")
+
+
+@pytest.mark.parametrize("precision", [None, 0, 1, 3])
+def test_format_numbers_matches_python(precision):
+    rng = np.random.default_rng(37)
+    values = [
+        *rng.uniform(-1000, 1000, 200),
+        *(np.arange(200) / 200),
+        0.0,
+        -0.0,
+        -0.04,
+        1e-7,
+        2.5e-5,
+        1e16,
+        123456789012345.67,
+        float("nan"),
+    ]
+
+    written = _format_numbers(pl.Series(values), precision).to_list()
+    assert written == [_round_number(val, precision) for val in values]
+
+    if precision is not None:
+        written = _format_numbers(
+            pl.Series(values), precision, keep_negative_zero=True
+        ).to_list()
+        assert written == [_format_numeric_text(val, precision) for val in values]
+
+
 def test_gt_plt_dot_snap(snapshot, mini_gt):
     res = gt_plt_dot(gt=mini_gt, category_col="fctr", data_col="currency")
 
@@ -203,14 +421,68 @@ def test_gt_plt_dot_with_na_in_category():
     )
     gt = GT(df)
 
-    with pytest.warns(UserWarning, match="A color value is None and has been coerced"):
+    # Missing categories are left empty, without warning about their color
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
         result = gt_plt_dot(gt=gt, category_col="category", data_col="values")
-
-    html = result.as_raw_html()
+        html = result.as_raw_html()
 
     assert isinstance(result, GT)
     assert html.count('<rect x="0" y="24.6" width="120.0"') == 1
     assert '<rect x="0" y="24.6" width="60.0"' not in html
+    assert html.count("<div></div>") == 3
+
+
+def test_gt_plt_dot_missing_category_color_keeps_later_colors(monkeypatch):
+    df = pd.DataFrame({"category": ["A", "B", "C"], "values": [1, 2, 3]})
+    expected = gt_plt_dot(
+        GT(df), category_col="category", data_col="values", palette=["red", "blue"]
+    )
+
+    # Drop the color of the middle category, as the palette does for a NaN scaled value
+    gradient_call = GradientPalette.__call__
+
+    def _call(self, values):
+        colors = gradient_call(self, values)
+        return [colors[0], None, *colors[2:]]
+
+    monkeypatch.setattr(GradientPalette, "__call__", _call)
+
+    with pytest.warns(UserWarning, match="coerced to 'transparent'"):
+        result = gt_plt_dot(
+            GT(df), category_col="category", data_col="values", palette=["red", "blue"]
+        )
+
+    expected_svgs, result_svgs = _extract_svgs(expected), _extract_svgs(result)
+    assert 'fill="transparent"' in result_svgs[1]
+    assert result_svgs[0] == expected_svgs[0]
+    assert result_svgs[2] == expected_svgs[2]
+
+
+@pytest.mark.parametrize(
+    "make_frame",
+    [
+        lambda data: pd.DataFrame(data).astype({"category": "category"}),
+        lambda data: pl.DataFrame(data).cast({"category": pl.Categorical}),
+        lambda data: pl.DataFrame(data).cast(
+            {"category": pl.Enum(["z", "C", "B", "A"])}
+        ),
+        lambda data: pl.DataFrame(data),
+    ],
+)
+def test_gt_plt_dot_dictionary_encoded_categories(make_frame):
+    data = {"category": ["B", "A", None, "C", "A"], "values": [1, 2, 3, 4, 5]}
+    expected = gt_plt_dot(
+        GT(pd.DataFrame(data)), category_col="category", data_col="values"
+    )
+
+    result = gt_plt_dot(
+        GT(make_frame(data)), category_col="category", data_col="values"
+    )
+
+    # Colors follow the order categories first appear in, whatever their native encoding
+    assert _extract_svgs(result) == _extract_svgs(expected)
+    assert len(_extract_svgs(result)) == 4
 
 
 def test_gt_plt_dot_palette_string_valid(mini_gt):
@@ -615,6 +887,30 @@ def test_gt_plt_dumbbell_reversed_values():
     assert 'fill="green" x="91.66666666666666" y="14.45">400</text>' in html
 
 
+@pytest.mark.parametrize("precision", [None, 1])
+@pytest.mark.parametrize("num_decimals", [0, 2])
+def test_gt_plt_dumbbell_polars_engine_matches_python(
+    engines_df, precision, num_decimals
+):
+    python_res, polars_res = _render_both_engines(
+        gt_plt_dumbbell,
+        engines_df,
+        col1="num",
+        col2="other",
+        label="Change",
+        precision=precision,
+        num_decimals=num_decimals,
+    )
+    assert polars_res == python_res
+
+
+def test_gt_plt_dumbbell_polars_engine_non_numeric():
+    df = pl.DataFrame({"value_1": [1.0, 2.0], "value_2": ["a", "b"]})
+
+    with pytest.raises(ValueError, match="Expected all entries to be numeric"):
+        gt_plt_dumbbell(GT(df), col1="value_1", col2="value_2", engine="polars")
+
+
 def test_gt_plt_winloss_snap(snapshot):
     df = pd.DataFrame(
         {
@@ -754,6 +1050,36 @@ def test_gt_plt_winloss_with_invalid_values():
     assert html.count('fill="red"') == 1
 
 
+def test_gt_plt_winloss_numeric_strings_are_invalid():
+    df = pd.DataFrame({"team": ["A"], "games": [["1", 1, "0.5", 0]]})
+    gt_test = GT(df)
+
+    with pytest.warns(UserWarning) as record:
+        html = gt_plt_winloss(gt=gt_test, column="games").as_raw_html()
+
+    assert [str(w.message) for w in record] == [
+        "Invalid value '1' encountered in win/loss data. Skipping.",
+        "Invalid value '0.5' encountered in win/loss data. Skipping.",
+    ]
+    assert html.count('fill="blue"') == 1
+    assert html.count('fill="grey"') == 0
+    assert html.count('fill="red"') == 1
+
+
+def test_gt_plt_winloss_pd_na_is_missing():
+    df = pd.DataFrame({"team": ["A"], "games": [[1, pd.NA, 0.5, None, 0]]})
+    gt_test = GT(df)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        html = gt_plt_winloss(gt=gt_test, column="games").as_raw_html()
+
+    assert html.count("<rect") == 3
+    assert html.count('fill="blue"') == 1
+    assert html.count('fill="grey"') == 1
+    assert html.count('fill="red"') == 1
+
+
 def test_gt_plt_winloss_different_length_lists():
     df = pd.DataFrame({"team": ["A", "B"], "games": [[1, 0], [1, 0, 0.5, 1, 0]]})
     gt_test = GT(df)
@@ -793,6 +1119,344 @@ def test_gt_plt_winloss_spacing_warning():
         )
 
 
+def test_gt_plt_winloss_compact():
+    df = pd.DataFrame({"team": ["A", "B"], "games": [[1, 0, 0.5], [0, 1, 1]]})
+    gt_test = GT(df)
+
+    result = gt_plt_winloss(gt=gt_test, column="games", compact=True)
+    html = result.as_raw_html()
+
+    assert "<rect" not in html
+    assert html.count("<path") == 5
+    assert html.count('fill="blue"') == 2
+    assert html.count('fill="red"') == 2
+    assert html.count('fill="grey"') == 1
+    assert (
+        '<path d="M 26.666666666666668 6.0 h 24.666666666666668 v 12.0 '
+        "h -24.666666666666668 Z  M 53.333333333333336 6.0 h 24.666666666666668 "
+        'v 12.0 h -24.666666666666668 Z " fill="blue"/>'
+    ) in html
+
+
+def test_gt_plt_winloss_compact_merges_runs():
+    df = pd.DataFrame({"team": ["A"], "games": [[1, 1, 1, 0, 0, None, 0, 1]]})
+    gt_test = GT(df)
+
+    result = gt_plt_winloss(gt=gt_test, column="games", spacing=0, compact=True)
+    html = result.as_raw_html()
+
+    assert html.count("<path") == 2
+    assert '<path d="M 0.0 6.0 h 30.0 v 12.0 h -30.0 Z  M 70.0 6.0 h 10.0' in html
+    assert '<path d="M 30.0 12.0 h 20.0 v 12.0 h -20.0 Z  M 60.0 12.0 h 10.0' in html
+
+
+def test_gt_plt_winloss_compact_smaller_output():
+    games = [[1, 0, 0.5, 1] * 40 for _ in range(3)]
+    gt_test = GT(pd.DataFrame({"games": games}))
+
+    default_html = gt_plt_winloss(gt=gt_test, column="games", width=400).as_raw_html()
+    compact_html = gt_plt_winloss(
+        gt=gt_test, column="games", width=400, compact=True
+    ).as_raw_html()
+
+    assert len(compact_html) < len(default_html)
+
+
+def test_gt_plt_winloss_invalid_values_warn_once():
+    df = pd.DataFrame({"team": ["A", "B"], "games": [[1, 2], [0, "x"]]})
+    gt_test = GT(df)
+
+    with pytest.warns(UserWarning) as record:
+        result = gt_plt_winloss(gt=gt_test, column="games")
+
+    messages = [str(w.message) for w in record]
+    assert messages == [
+        "Invalid value '2' encountered in win/loss data. Skipping.",
+        "Invalid value 'x' encountered in win/loss data. Skipping.",
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        html = result.as_raw_html()
+
+    assert html.count("<rect") == 2
+
+
+def test_gt_plt_winloss_aggregate():
+    games = [[1, 1, 0, 0, 0.5, 0.5, 1, 0] * 3, [1] * 10, None]
+    gt_test = GT(pd.DataFrame({"games": games}))
+
+    result = gt_plt_winloss(
+        gt=gt_test, column="games", width=4, aggregate=True, precision=1
+    )
+    html = result.as_raw_html()
+
+    # 24 games in 4 windows of 6, and the shorter row fills only the first windows
+    assert html.count("<rect") == 6
+    assert '<rect x="0" y="12" width="1" height="6" fill="grey"/>' in html
+    assert '<rect x="2" y="12" width="1" height="3" fill="blue"/>' in html
+    assert '<rect x="3" y="15" width="1" height="3" fill="red"/>' in html
+    assert html.count('height="9" fill="blue"') == 2
+
+
+def test_gt_plt_winloss_aggregate_short_sequences_unchanged():
+    df = pd.DataFrame({"games": [[1, 0, 0.5], [0, 1, 1]]})
+
+    result = gt_plt_winloss(GT(df), column="games", aggregate=True)
+    expected = gt_plt_winloss(GT(df), column="games")
+
+    assert _extract_svgs(result) == _extract_svgs(expected)
+
+
+def test_aggregate_winloss_matches_loop():
+    rng = np.random.default_rng(48)
+    lengths = [0, 3, 250, 1000]
+    rows = [rng.choice([0, 0.5, 1, np.nan], size=length) for length in lengths]
+
+    outcomes = np.concatenate(rows)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    shares = _aggregate_winloss(outcomes, offsets, max_length=1000, n_windows=80)
+
+    assert shares.shape == (4, 80)
+    for row, values in zip(shares, rows):
+        for window in range(80):
+            in_window = values[
+                [i for i in range(len(values)) if i * 80 // 1000 == window]
+            ]
+            in_window = in_window[~np.isnan(in_window)]
+            if len(in_window) == 0:
+                assert np.isnan(row[window])
+            else:
+                assert np.isclose(row[window], in_window.mean())
+
+
+def test_gt_plt_winloss_native_list_column():
+    games = [[1.0, None, 0.5, 0.0], [], None, [0.0, 1.0]]
+    expected = gt_plt_winloss(GT(pd.DataFrame({"games": games})), column="games")
+
+    result = gt_plt_winloss(GT(pl.DataFrame({"games": games})), column="games")
+
+    assert _extract_svgs(result) == _extract_svgs(expected)
+    assert len(_extract_svgs(result)) == 2
+
+
+def test_gt_plt_sparkline_basic():
+    df = pd.DataFrame({"series": [[1, 3, 2, 5], [4, 4]]})
+    html = gt_plt_sparkline(
+        GT(df), column="series", width=80, height=30, line_width=2, precision=1
+    ).as_raw_html()
+
+    assert html.count("<svg") == 2
+    assert html.count("<path") == 2
+    assert 'fill="none"' in html
+    assert 'd="M2 28L27.3 15 52.7 21.5 78 2"' in html
+    # The second row is drawn on the shared scale
+    assert 'd="M2 8.5L78 8.5"' in html
+
+
+def test_gt_plt_sparkline_own_scale():
+    df = pd.DataFrame({"series": [[1, 3, 2, 5], [4, 4]]})
+    html = gt_plt_sparkline(
+        GT(df), column="series", same_scale=False, precision=0
+    ).as_raw_html()
+
+    # A flat series is drawn through the middle of its cell
+    assert 'd="M2 15L78 15"' in html
+
+
+def test_gt_plt_sparkline_downsamples_to_width():
+    df = pd.DataFrame({"series": [np.sin(np.arange(5000) / 50).tolist()] * 2})
+    html = gt_plt_sparkline(
+        GT(df), column="series", width=60, precision=1
+    ).as_raw_html()
+
+    paths = re.findall(r' d="M([^"]*)"', html)
+    assert len(paths) == 2
+    assert all(len(path.replace("L", " ").split()) == 2 * 60 for path in paths)
+
+
+def test_gt_plt_sparkline_missing_values():
+    df = pd.DataFrame({"series": [[1.0, None, 3.0], [], None, [None, None]]})
+    html = gt_plt_sparkline(GT(df), column="series", precision=1).as_raw_html()
+
+    # Missing values are skipped, but keep their place along the line
+    assert 'd="M1.5 28.5L78.5 1.5"' in html
+    assert html.count("<path") == 1
+    assert html.count('<div style="width:80px; height:30px;"></div>') == 3
+
+
+def test_gt_plt_sparkline_native_list_column():
+    series = [[1.0, None, 0.5, 2.0], [], None, [0.0, 1.0]]
+    expected = gt_plt_sparkline(GT(pd.DataFrame({"s": series})), column="s")
+
+    result = gt_plt_sparkline(GT(pl.DataFrame({"s": series})), column="s")
+
+    assert _extract_svgs(result) == _extract_svgs(expected)
+    assert len(_extract_svgs(result)) == 2
+
+
+def test_gt_plt_sparkline_non_numeric():
+    df = pd.DataFrame({"series": [[1, "a"], [2, 3]]})
+
+    with pytest.raises(ValueError, match="Expected all entries to be numeric or None."):
+        gt_plt_sparkline(GT(df), column="series")
+
+
+def _lttb_reference(xs: np.ndarray, ys: np.ndarray, threshold: int) -> list[int]:
+    n = len(xs)
+    if n <= threshold:
+        return list(range(n))
+
+    n_buckets = threshold - 2
+    edges = [1 + (j * (n - 2)) // n_buckets for j in range(n_buckets + 1)]
+    selected = [0]
+    for j in range(n_buckets):
+        if j + 1 < n_buckets:
+            next_bucket = slice(edges[j + 1], edges[j + 2])
+            cx, cy = xs[next_bucket].mean(), ys[next_bucket].mean()
+        else:
+            cx, cy = xs[-1], ys[-1]
+
+        a = selected[-1]
+        areas = [
+            abs((xs[a] - cx) * (ys[i] - ys[a]) - (xs[a] - xs[i]) * (cy - ys[a]))
+            for i in range(edges[j], edges[j + 1])
+        ]
+        selected.append(edges[j] + int(np.argmax(areas)))
+
+    return selected + [n - 1]
+
+
+def test_lttb_downsample_matches_reference():
+    rng = np.random.default_rng(45)
+    lengths = [0, 5, 20, 21, 333, 1000]
+    series = [rng.normal(size=length).cumsum() for length in lengths]
+
+    xs = np.concatenate([np.arange(length, dtype=float) for length in lengths])
+    ys = np.concatenate(series)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    kept_xs, kept_ys, kept_offsets = _lttb_downsample(xs, ys, offsets, threshold=20)
+
+    assert np.diff(kept_offsets).tolist() == [0, 5, 20, 20, 20, 20]
+    for i, values in enumerate(series):
+        start, stop = kept_offsets[i], kept_offsets[i + 1]
+        expected = _lttb_reference(np.arange(len(values), dtype=float), values, 20)
+        assert kept_xs[start:stop].astype(int).tolist() == expected
+        assert kept_ys[start:stop].tolist() == values[expected].tolist()
+
+
+def test_gt_plt_dist_histogram():
+    df = pd.DataFrame({"values": [[1, 2, 2, 3, 10], [5, 5], None]})
+    html = gt_plt_dist(GT(df), column="values", bins=4, precision=1).as_raw_html()
+
+    assert html.count("<svg") == 2
+    # Only non-empty bins are drawn, against the shared range of 1 to 10
+    assert html.count("<rect") == 3
+    assert '<rect x="3.7" y="-0.4" width="21.4" height="24" fill="grey"/>' in html
+    assert html.count('<div style="width:100px; height:30px;"></div>') == 1
+    assert "tooltip" not in html
+    assert "<text" not in html
+
+
+def test_gt_plt_dist_own_limits():
+    df = pd.DataFrame({"values": [[1, 2, 2, 3, 10], [5, 6]]})
+    html = gt_plt_dist(
+        GT(df), column="values", bins=2, same_limit=False, precision=1
+    ).as_raw_html()
+
+    # Each row spans its own range, so both values of the second row get a bar of full height
+    assert html.count('height="24"') == 3
+
+
+def test_gt_plt_dist_density():
+    df = pd.DataFrame({"values": [[0.1, 0.2, 0.25, 0.9], [3, 3, 3]]})
+    html = gt_plt_dist(
+        GT(df), column="values", plot_type="density", fill_color="blue", precision=1
+    ).as_raw_html()
+
+    assert html.count("<path") == 2
+    assert html.count('fill="blue"') == 2
+    assert re.search(r'd="M1 29L[^"]*Z"', html)
+
+
+def test_gt_plt_dist_boxplot():
+    df = pd.DataFrame({"values": [[1, 2, 3, 4, 5, 100], [0, 100]]})
+    html = gt_plt_dist(
+        GT(df), column="values", plot_type="boxplot", precision=1
+    ).as_raw_html()
+
+    assert html.count("<rect") == 2
+    # The outlier at 100 is drawn as a point past the whisker
+    assert html.count("<circle") == 1
+    assert '<circle cx="99" cy="15" r="1.5" fill="black"/>' in html
+
+
+def test_gt_plt_dist_native_list_column():
+    values = [[1.0, None, 0.5, 2.0], [], None, [0.0, 1.0]]
+    expected = gt_plt_dist(GT(pd.DataFrame({"v": values})), column="v")
+
+    result = gt_plt_dist(GT(pl.DataFrame({"v": values})), column="v")
+
+    assert _extract_svgs(result) == _extract_svgs(expected)
+    assert len(_extract_svgs(result)) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"plot_type": "violin"}, "Plot type must be one of"),
+        ({"bins": 0}, "Number of bins must be a positive integer."),
+        ({"bw": 0}, "Bandwidth must be a positive number or None."),
+    ],
+)
+def test_gt_plt_dist_invalid_arguments(kwargs, message):
+    df = pd.DataFrame({"values": [[1, 2, 3]]})
+
+    with pytest.raises(ValueError, match=message):
+        gt_plt_dist(GT(df), column="values", **kwargs)
+
+
+def test_gt_plt_dist_non_numeric():
+    df = pd.DataFrame({"values": [[1, "a"], [2, 3]]})
+
+    with pytest.raises(ValueError, match="Expected all entries to be numeric or None."):
+        gt_plt_dist(GT(df), column="values")
+
+
+def test_boxplot_stats_match_numpy():
+    rng = np.random.default_rng(46)
+    lengths = [0, 1, 2, 7, 50, 301]
+    rows = [rng.standard_t(2, size=length) for length in lengths]
+
+    positions = np.concatenate(rows)
+    row_ids = np.repeat(np.arange(len(rows)), lengths)
+    stats, outlier_offsets, outliers = _boxplot_stats(positions, row_ids, len(rows))
+
+    assert np.isnan(stats[0]).all()
+    for i, values in enumerate(rows[1:], start=1):
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+
+        assert np.allclose(stats[i], [inside.min(), q1, median, q3, inside.max()])
+        row_outliers = outliers[outlier_offsets[i] : outlier_offsets[i + 1]]
+        assert sorted(row_outliers) == sorted(set(values) - set(inside))
+
+
+def test_binned_density_close_to_gaussian_kde():
+    from scipy.stats import gaussian_kde
+
+    rng = np.random.default_rng(47)
+    positions = np.clip(rng.normal(0.5, 0.1, 500), 0, 1)
+    row_ids = np.zeros(len(positions), dtype=np.int64)
+
+    density = _binned_density(positions, row_ids, 1)[0]
+
+    expected = gaussian_kde(positions)(np.linspace(0, 1, len(density)))
+    assert np.abs(density - expected / expected.max()).max() < 0.05
+
+
 def test_gt_plt_bar_stack_snap(snapshot):
     df = pd.DataFrame({"team": ["A", "B"], "values": [[10, 20], [40, 30]]})
     gt_test = GT(df)
@@ -821,6 +1485,33 @@ def test_gt_plt_bar_stack_basic():
     assert html.count('<text dominant-baseline="central" text-anchor="middle"') == 6
 
 
+def test_gt_plt_bar_stack_css_renderer():
+    df = pd.DataFrame({"values": [[10, 20, 30], [40, 0, 20], []]})
+    html = gt_plt_bar_stack(
+        gt=GT(df), column="values", width=100, renderer="css"
+    ).as_raw_html()
+
+    assert "<svg" not in html
+    assert html.count("display:inline-block;") == 5
+    assert html.count("margin-left:2px;") == 3
+    assert "width:16.0px;height:30px;background:#000000;" in html
+    assert "margin-left:2px;width:32.0px;height:30px;background:#25bce6;" in html
+    assert ">40</div>" in html
+    assert '<div style="width:100px;height:30px;"></div>' in html
+
+
+def test_gt_plt_bar_stack_hide_labels():
+    df = pd.DataFrame({"values": [[10, 20, 30], [40, 30, 20]]})
+
+    for renderer in ["svg", "css"]:
+        html = gt_plt_bar_stack(
+            gt=GT(df), column="values", renderer=renderer, show_labels=False
+        ).as_raw_html()
+
+        assert "<text" not in html
+        assert ">30</div>" not in html
+
+
 def test_gt_plt_bar_stack_custom_palette():
     df = pd.DataFrame({"team": ["A"], "values": [[10, 20, 30]]})
     gt_test = GT(df)
@@ -975,6 +1666,21 @@ def test_gt_plt_bar_stack_invalid_scale():
         gt_plt_bar_stack(gt=gt_test, column="values", scale_type="invalid")  # type: ignore
 
 
+@pytest.mark.parametrize("scale_type", ["relative", "absolute"])
+def test_gt_plt_bar_stack_native_list_column(scale_type):
+    values = [[10.0, None, 30.0], [], None, [40.0, 60.0]]
+    expected = gt_plt_bar_stack(
+        GT(pd.DataFrame({"values": values})), column="values", scale_type=scale_type
+    )
+
+    result = gt_plt_bar_stack(
+        GT(pl.DataFrame({"values": values})), column="values", scale_type=scale_type
+    )
+
+    assert _extract_svgs(result) == _extract_svgs(expected)
+    assert len(_extract_svgs(result)) == 2
+
+
 def test_gt_plt_bar_pct_snap(snapshot, mini_gt):
     res = gt_plt_bar_pct(gt=mini_gt, column="num")
 
@@ -1005,6 +1711,34 @@ def test_gt_plt_bar_pct_without_labels(mini_gt):
     assert "</text>" not in html
 
 
+def test_gt_plt_bar_pct_resolution_keeps_exact_labels():
+    df = pd.DataFrame({"x": [10.04, 10.26, 100]})
+    html = gt_plt_bar_pct(
+        gt=GT(df), column="x", labels=True, autoscale=False, resolution=1
+    ).as_raw_html()
+
+    assert html.count('width="10.0px" height="16px" fill="purple"') == 2
+    assert "10.0%" in html
+    assert "10.3%" in html
+
+
+def test_gt_plt_bar_pct_css_renderer():
+    df = pd.DataFrame({"x": [20, 80, None]})
+    html = gt_plt_bar_pct(
+        gt=GT(df), column="x", labels=True, autoscale=False, renderer="css"
+    ).as_raw_html()
+
+    assert "<svg" not in html
+    assert "linear-gradient(to right,purple 20.0%,#e1e1e1 20.0%)" in html
+    assert "linear-gradient(to right,purple 80.0%,#e1e1e1 80.0%)" in html
+    assert '<div style="width:100px;height:16px;"></div>' in html
+
+    # The short bar's label sits outside of it, the long bar's inside
+    assert "padding-left:25.0px;" in html
+    assert "padding-left:5.0px;" in html
+    assert ">20%</div>" in html
+
+
 def test_gt_plt_bar_pct_column_decimal(mini_gt):
     result = gt_plt_bar_pct(
         mini_gt, column="num", autoscale=False, labels=True, decimals=2
@@ -1230,7 +1964,7 @@ def test_gt_plt_bullet_with_none_and_nan_values(actual, target):
     assert isinstance(result, GT)
     assert html.count('<line stroke="darkgrey"') == 2
     assert html.count('fill="purple"') == 3
-    assert html.count('width="0px" height="20px" fill="purple"') == 1
+    assert html.count('width="0.0px" height="20px" fill="purple"') == 1
 
 
 def test_gt_plt_bullet_invalid_data_column():
@@ -1307,6 +2041,24 @@ def test_gt_plt_bullet_scaling():
     assert 'x1="36.0px" y1="0" x2="36.0px" y2="30px"' in html
 
 
+@pytest.mark.parametrize("precision", [None, 1])
+def test_gt_plt_bullet_polars_engine_matches_python(engines_df, precision):
+    python_res, polars_res = _render_both_engines(
+        gt_plt_bullet,
+        engines_df,
+        data_column="int",
+        target_column="num",
+        keep_data_column=True,
+        precision=precision,
+    )
+    assert polars_res == python_res
+
+
+def test_gt_plt_bullet_polars_engine_invalid(mini_gt):
+    with pytest.raises(ValueError, match="requires a table built from a polars"):
+        gt_plt_bullet(mini_gt, data_column="num", target_column="num", engine="polars")
+
+
 def test_gt_plt_donut_snap(snapshot, mini_gt):
     res = gt_plt_donut(gt=mini_gt, columns="num")
 
@@ -1398,6 +2150,24 @@ def test_gt_plt_donut_with_na_values():
     assert html.count('<div style="width:30px; height:30px;"></div>') == 2
 
 
+def test_gt_plt_donut_resolution(mini_gt):
+    exact = gt_plt_donut(gt=mini_gt, columns="num").as_raw_html()
+    rounded = gt_plt_donut(gt=mini_gt, columns="num", resolution=0.5).as_raw_html()
+
+    assert rounded.count("<svg") == exact.count("<svg")
+    assert rounded != exact
+
+
+def test_gt_plt_donut_precision():
+    df = pd.DataFrame({"num": [1, 2, 3]})
+    exact = gt_plt_donut(gt=GT(df), columns="num").as_raw_html()
+    rounded = gt_plt_donut(gt=GT(df), columns="num", precision=2).as_raw_html()
+
+    assert re.search(r"\d\.\d{3,}", exact)
+    assert not re.search(r"\d\.\d{3,}", rounded)
+    assert rounded.count("<svg") == exact.count("<svg") == 3
+
+
 def test_gt_plt_donut_custom_size(mini_gt):
     result = gt_plt_donut(gt=mini_gt, columns=["num"], size=50)
     html = result.as_raw_html()
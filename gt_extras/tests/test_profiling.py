@@ -0,0 +1,108 @@
+import json
+import threading
+
+import pandas as pd
+import pytest
+from great_tables import GT
+
+import gt_extras as gte
+from gt_extras.profiling import STAGES, _profile_stage
+
+
+def test_profile_records_stages(mini_gt):
+    with gte.profile() as report:
+        gte.gt_plt_bar(mini_gt, columns="num").as_raw_html()
+
+    result = report.to_dict()
+
+    assert result["stages"]["column_resolution"]["calls"] == 1
+    assert result["stages"]["scaling"]["calls"] == 1
+    assert result["stages"]["svg_building"]["calls"] == 3
+    assert result["stages"]["svg_building"]["total_time"] > 0
+
+
+def test_profile_records_formatters(mini_gt):
+    with gte.profile() as report:
+        gte.gt_plt_bar(mini_gt, columns=["num", "currency"])
+        gte.fmt_pct_extra(mini_gt, columns="num")
+
+    functions = report.to_dict()["functions"]
+
+    assert functions["gt_plt_bar"]["calls"] == 1
+    assert functions["gt_plt_bar"]["formatters"] == 2
+    assert functions["fmt_pct_extra"]["formatters"] == 1
+
+
+def test_profile_color_and_icon_stages(mini_gt):
+    df = pd.DataFrame({"rating": [1, 3], "change": [2, -1]})
+
+    with gte.profile() as report:
+        gte.gt_color_box(mini_gt, columns="num")
+        gte.gt_fa_rating(GT(df), columns="rating").as_raw_html()
+        gte.gt_fa_rank_change(GT(df), column="change").as_raw_html()
+
+    stages = report.to_dict()["stages"]
+
+    assert stages["color_mapping"]["calls"] == 1
+    assert stages["icon_generation"]["calls"] == 4
+
+
+def test_profile_inactive_records_nothing(mini_gt):
+    with gte.profile() as report:
+        pass
+
+    gte.gt_plt_bar(mini_gt, columns="num").as_raw_html()
+
+    assert report.to_dict() == {"stages": {}, "functions": {}}
+
+
+def test_profile_nested_restores_outer(mini_gt):
+    with gte.profile() as outer:
+        with gte.profile() as inner:
+            gte.gt_plt_bar(mini_gt, columns="num")
+        gte.gt_plt_donut(mini_gt, columns="num")
+
+    assert list(inner.to_dict()["functions"]) == ["gt_plt_bar"]
+    assert list(outer.to_dict()["functions"]) == ["gt_plt_donut"]
+
+
+def test_profile_scoped_to_thread(mini_gt):
+    with gte.profile() as report:
+        thread = threading.Thread(target=lambda: gte.gt_plt_bar(mini_gt, columns="num"))
+        thread.start()
+        thread.join()
+
+    assert report.to_dict() == {"stages": {}, "functions": {}}
+
+
+def test_profile_records_grid_layout_workers(mini_gt):
+    gt = gte.gt_plt_bar(mini_gt, columns="num")
+    with gte.profile() as report:
+        gte.gt_grid_layout([gt, gt], ncol=2)
+
+    assert report.to_dict()["stages"]["svg_building"]["calls"] == 6
+
+
+def test_profile_chrome_trace(tmp_path, mini_gt):
+    with gte.profile() as report:
+        gte.gt_plt_bar(mini_gt, columns="num").as_raw_html()
+
+    f_path = tmp_path / "trace.json"
+    trace = report.to_chrome_trace(f_path)
+
+    assert json.loads(f_path.read_text()) == trace
+    events = trace["traceEvents"]
+    assert {event["cat"] for event in events} == {
+        "function",
+        "column_resolution",
+        "scaling",
+        "svg_building",
+    }
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert [e["args"] for e in events if e["cat"] == "function"] == [{"formatters": 1}]
+
+
+def test_profile_stage_unknown():
+    assert "svg_building" in STAGES
+    with pytest.raises(ValueError, match="Unknown profiling stage: rendering"):
+        _profile_stage("rendering")
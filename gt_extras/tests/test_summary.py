@@ -1,3 +1,4 @@
+import re
 from datetime import datetime, timezone
 
 import numpy as np
@@ -74,6 +75,16 @@ def test_gt_plt_summary_no_interactivity(DataFrame):
     assert "transition:" not in html
 
 
+def test_gt_plt_summary_precision():
+    df = pd.DataFrame({"numeric": [1.5, 2.2, 3.3, 5.1], "string": ["A", "B", "A", "C"]})
+
+    exact = gt_plt_summary(df).as_raw_html()
+    rounded = gt_plt_summary(df, precision=0).as_raw_html()
+
+    assert len(rounded) < len(exact)
+    assert not re.search(r' (?:x|y|width|height)="-?\d+\.\d', rounded)
+
+
 @pytest.mark.parametrize("DataFrame", [pd.DataFrame, pl.DataFrame])
 def test_gt_plt_summary_two_modes(DataFrame):
     df = DataFrame({"numeric": [1, 1, 2, 2, 3]})
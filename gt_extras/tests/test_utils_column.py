@@ -1,13 +1,28 @@
+import copy
+import pickle
 import warnings
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 import pytest
 from great_tables import GT
 
 from gt_extras._utils_column import (
+    _cache_column_reads,
+    _factorize_column,
+    _fmt_with_row_payloads,
     _format_numeric_text,
+    _get_global_range,
+    _get_na_mask,
+    _render_first_cell,
+    _RENDERING_CELL,
+    _RowPayloadFormatter,
     _scale_numeric_column,
+    _validate_and_get_list_column,
     _validate_and_get_single_column,
 )
 
@@ -197,6 +212,37 @@ def test_scaling_default_domain_min_zero_false():
     assert result == expected
 
 
+@pytest.mark.parametrize("DataFrame", [pl.DataFrame, pa.table])
+def test_validate_list_column_native(DataFrame):
+    df = DataFrame({"lists": [[1.0, None, 3.0], [], None, [0.5]]})
+    gt = GT(df)
+
+    col_name, flat_vals, offsets = _validate_and_get_list_column(gt, "lists")
+
+    assert col_name == "lists"
+    assert isinstance(flat_vals, np.ndarray)
+    np.testing.assert_array_equal(flat_vals, [1.0, np.nan, 3.0, 0.5])
+    np.testing.assert_array_equal(offsets, [0, 3, 3, 3, 4])
+
+
+def test_validate_list_column_python_lists():
+    df = pd.DataFrame({"lists": [[1, None, "a"], [], None, [0.5]]})
+    gt = GT(df)
+
+    col_name, flat_vals, offsets = _validate_and_get_list_column(gt, "lists")
+
+    assert col_name == "lists"
+    assert flat_vals == [1, None, "a", 0.5]
+    np.testing.assert_array_equal(offsets, [0, 3, 3, 3, 4])
+
+
+def test_validate_list_column_not_found():
+    gt = GT(pd.DataFrame({"lists": [[1, 2]]}))
+
+    with pytest.raises(KeyError, match="Column 'nonexistent' not found"):
+        _validate_and_get_list_column(gt, "nonexistent")
+
+
 @pytest.mark.parametrize(
     "value, num_decimals, expected",
     [
@@ -227,3 +273,270 @@ def test_scaling_default_domain_min_zero_false():
 )
 def test_format_numeric_text(value, num_decimals, expected):
     assert _format_numeric_text(value, num_decimals) == expected
+
+
+@pytest.mark.parametrize("DataFrame", [pd.DataFrame, pl.DataFrame])
+def test_fmt_with_row_payloads(DataFrame):
+    df = DataFrame({"name": ["a", "b", "c"], "num": [1, 2, 3]})
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        lambda x, scale, label: f"{x}:{scale}:{label}",
+        column="num",
+        payloads={"scale": array("d", [0.5, 1.5, 2.5]), "label": ["x", "y", "z"]},
+    )
+    html = res.as_raw_html()
+
+    assert len(res._formats) == 1
+    assert "1:0.5:x" in html
+    assert "2:1.5:y" in html
+    assert "3:2.5:z" in html
+
+
+def test_fmt_with_row_payloads_rows():
+    df = pd.DataFrame({"num": [1, 2, 3]})
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        lambda x, code: f"<b>{x}-{code}</b>",
+        column="num",
+        payloads={"code": np.array([7, 8, 9])},
+        rows=[0, 2],
+    )
+    html = res.as_raw_html()
+
+    assert "<b>1-7</b>" in html
+    assert "<b>3-9</b>" in html
+    assert "<b>2-" not in html
+
+
+def test_render_first_cell():
+    df = pd.DataFrame({"num": [1, 2, 3]})
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        lambda x, code: f"<b>{x}-{code}</b>",
+        column="num",
+        payloads={"code": np.array([7, 8, 9])},
+        rows=[1, 2],
+    )
+
+    assert _render_first_cell(res) == "<b>2-8</b>"
+    assert _render_first_cell(GT(df).fmt(lambda x: f"<i>{x}</i>")) == "<i>1</i>"
+
+
+def test_fmt_with_row_payloads_concurrent_renders():
+    df = pd.DataFrame({"num": list(range(50))})
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        lambda x, double: f"{x}={double}",
+        column="num",
+        payloads={"double": np.arange(50) * 2},
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        htmls = list(executor.map(lambda _: res.as_raw_html(), range(8)))
+
+    assert all(f"{i}={i * 2}<" in html for html in htmls for i in range(50))
+
+
+def test_fmt_with_row_payloads_render_caches():
+    df = pd.DataFrame({"num": [1, 2, 1, 2]})
+    cache = {}
+
+    def _cached(x, code):
+        if x not in cache:
+            cache[x] = f"<b>{x}-{code}</b>"
+        return cache[x]
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        _cached,
+        column="num",
+        payloads={"code": [7, 8, 7, 8]},
+        render_caches=[cache],
+    )
+    html = res.as_raw_html()
+
+    assert html.count("<b>1-7</b>") == 2
+    assert html.count("<b>2-8</b>") == 2
+    assert cache == {}
+
+
+def test_fmt_with_row_payloads_render_loop():
+    # great_tables must call the formatter of each cell while iterating over the resolved cells,
+    # since that is when the row of the cell is known. This fails if the render loop changes.
+    df = pd.DataFrame({"num": [10, 11, 12, 13]})
+    rendered_rows = []
+
+    def _check_row(x, row):
+        rendering = _RENDERING_CELL.get()
+        assert rendering is not None and rendering[1] == row
+        rendered_rows.append(row)
+        return f"<b>{x}@{row}</b>"
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        _check_row,
+        column="num",
+        payloads={"row": [0, 1, 2, 3]},
+        rows=[3, 1, 2],
+    )
+    html = res.as_raw_html()
+
+    assert sorted(rendered_rows) == [1, 2, 3]
+    assert all(f"<b>{10 + row}@{row}</b>" in html for row in [1, 2, 3])
+    assert "<b>10@" not in html
+
+
+def test_fmt_with_row_payloads_render_caches_kept_outside_render():
+    df = pd.DataFrame({"num": [1, 2]})
+    cache = {"glyph": "<b></b>"}
+
+    res = _fmt_with_row_payloads(
+        GT(df),
+        _label_with_code,
+        column="num",
+        payloads={"code": [7, 8]},
+        render_caches=[cache],
+    )
+
+    # Iterating over the cells without formatting them does not end a render
+    assert list(res._formats[-1].cells.resolve()) == [("num", 0), ("num", 1)]
+    assert cache == {"glyph": "<b></b>"}
+
+
+def _label_with_code(x, code):
+    return f"<b>{x}-{code}</b>"
+
+
+def test_fmt_with_row_payloads_deepcopy():
+    df = pd.DataFrame({"num": [1, 2, 3]})
+    res = _fmt_with_row_payloads(
+        GT(df, id="copy"),
+        _label_with_code,
+        column="num",
+        payloads={"code": np.array([7, 8, 9])},
+    )
+
+    copied = copy.deepcopy(res)
+
+    assert copied.as_raw_html() == res.as_raw_html()
+    assert "<b>3-9</b>" in copied.as_raw_html()
+
+
+def test_row_payload_formatter_explicit_row():
+    formatter = _RowPayloadFormatter(_label_with_code, {"code": [7, 8, 9]})
+
+    assert formatter(2, row=1) == "<b>2-8</b>"
+    assert pickle.loads(pickle.dumps(formatter))(3, row=2) == "<b>3-9</b>"
+
+    # Without a row, the formatter can only be called while its cells are rendered
+    with pytest.raises(RuntimeError, match="must be given a row"):
+        formatter(1)
+
+
+@pytest.mark.parametrize("DataFrame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_get_na_mask(DataFrame):
+    df = DataFrame(
+        {
+            "float": [1.0, None, float("nan"), 4.0],
+            "int": [1, None, 3, 4],
+            "str": ["a", "b", None, "d"],
+        }
+    )
+
+    assert _get_na_mask(df, "float").tolist() == [False, True, True, False]
+    assert _get_na_mask(df, "int").tolist() == [False, True, False, False]
+    assert _get_na_mask(df, "str").tolist() == [False, False, True, False]
+
+
+def test_get_na_mask_pandas_object_column():
+    df = pd.DataFrame({"mixed": [1, "text", None, np.nan, pd.NA]})
+
+    assert _get_na_mask(df, "mixed").tolist() == [False, False, True, True, True]
+
+
+@pytest.mark.parametrize(
+    "make_frame",
+    [
+        pd.DataFrame,
+        pl.DataFrame,
+        pa.table,
+        lambda data: pd.DataFrame(data).astype({"c": "category"}),
+        lambda data: pl.DataFrame(data).cast({"c": pl.Categorical}),
+        lambda data: pl.DataFrame(data).cast({"c": pl.Enum(["z", "c", "b", "a"])}),
+        lambda data: pa.table({"c": pa.array(data["c"]).dictionary_encode()}),
+    ],
+)
+def test_factorize_column(make_frame):
+    df = make_frame({"c": ["b", "a", None, "c", "a", "b"]})
+
+    codes, uniques = _factorize_column(df, "c")
+
+    assert codes.tolist() == [0, 1, -1, 2, 1, 0]
+    assert uniques == ["b", "a", "c"]
+
+
+def test_factorize_column_pyarrow_chunks_with_different_dictionaries():
+    chunks = [
+        pa.array(["b", None]).dictionary_encode(),
+        pa.array(["a", "b"]).dictionary_encode(),
+    ]
+    df = pa.table({"c": pa.chunked_array(chunks)})
+
+    codes, uniques = _factorize_column(df, "c")
+
+    assert codes.tolist() == [0, -1, 1, 0]
+    assert uniques == ["b", "a"]
+
+
+@pytest.mark.parametrize("DataFrame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_get_global_range(DataFrame):
+    df = DataFrame({"a": [1.0, None, float("nan"), 4.0], "b": [3, None, 9, 1]})
+
+    assert _get_global_range(df, ["a", "b"]) == (1.0, 9.0)
+    assert _get_global_range(df, ["a"], padding=0.5) == (-0.5, 5.5)
+
+
+@pytest.mark.parametrize("DataFrame", [pd.DataFrame, pl.DataFrame])
+def test_get_global_range_all_missing(DataFrame):
+    df = DataFrame({"a": [None, None]})
+
+    data_min, data_max = _get_global_range(df, ["a"])
+
+    assert np.isnan(data_min) and np.isnan(data_max)
+
+
+def test_cache_column_reads():
+    df = pd.DataFrame({"a": [1.0, None, 3.0]})
+
+    with _cache_column_reads():
+        first = _get_na_mask(df, "a")
+        second = _get_na_mask(df, "a")
+
+        # The cached mask is shared, but cannot be changed by a caller
+        assert np.shares_memory(first, second)
+        with pytest.raises(ValueError, match="read-only"):
+            first[0] = True
+
+        # Another table with the same column is read separately
+        other = _get_na_mask(pd.DataFrame({"a": [None, 2.0, 3.0]}), "a")
+        assert other.tolist() == [True, False, False]
+
+    assert not np.shares_memory(_get_na_mask(df, "a"), first)
+
+
+def test_cache_column_reads_scoped_to_context():
+    df = pd.DataFrame({"a": [1.0, None, 3.0]})
+
+    with _cache_column_reads():
+        first = _get_na_mask(df, "a")
+
+        # Reads in another thread are outside of this block, so they are not cached
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(_get_na_mask, df, "a").result()
+
+    assert not np.shares_memory(first, other)
+    assert other.flags.writeable
@@ -0,0 +1,21 @@
+import pytest
+
+from gt_extras._utils_svg import _round_number
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(57.29577951308232, "57.3"), (-3.14159, "-3.14"), (30.0, "30"), (1e-07, "0")],
+)
+def test_round_number(value, expected):
+    assert _round_number(value, 2) == expected
+
+
+@pytest.mark.parametrize("value", [1.23456, 30.0, 4, 1e-07])
+def test_round_number_none_unchanged(value):
+    assert _round_number(value, None) == str(value)
+
+
+def test_round_number_no_negative_zero():
+    assert _round_number(-0.0004, 2) == "0"
+    assert _round_number(-0.4, 0) == "0"